@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json(monkeypatch):
+    """Decode and encode JSON with the stdlib even when orjson is installed.
+
+    Mocked httpx responses set ``json.return_value``, which the orjson path bypasses
+    by reading ``response.content``. Tests of the orjson path patch these back in.
+    """
+    from yap_on_slack import post_messages
+
+    monkeypatch.setattr(post_messages, "_orjson_loads", None)
+    monkeypatch.setattr(post_messages, "_orjson_dumps", None)
@@ -0,0 +1,104 @@
+"""Tests for AI message generation."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yap_on_slack.post_messages import AIConfigModel, generate_messages_with_ai
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the AI response cache out of the real home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-test")
+    return tmp_path
+
+
+@pytest.fixture
+def ai_config():
+    """Provide a minimal AI config."""
+    return AIConfigModel(model="test/model", system_prompt="Write messages")
+
+
+def _completion(messages):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "choices": [{"message": {"content": json.dumps({"messages": messages})}}]
+    }
+    return response
+
+
+GENERATED = [{"text": "hello", "replies": [], "reactions": []}]
+
+
+class TestLLMCache:
+    """Test suite for the YAP_LLM_CACHE response cache."""
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_disabled_by_default(self, mock_post, ai_config):
+        """Test that every call hits the API when the cache isn't enabled."""
+        mock_post.return_value = _completion(GENERATED)
+
+        generate_messages_with_ai({}, ai_config)
+        generate_messages_with_ai({}, ai_config)
+
+        assert mock_post.call_count == 2
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_enabled_reuses_response(self, mock_post, ai_config, monkeypatch):
+        """Test that an identical request is served from the cache."""
+        monkeypatch.setenv("YAP_LLM_CACHE", "enabled")
+        mock_post.return_value = _completion(GENERATED)
+
+        first = generate_messages_with_ai({}, ai_config)
+        second = generate_messages_with_ai({}, ai_config)
+
+        assert first == second == GENERATED
+        assert mock_post.call_count == 1
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_temperature_is_part_of_key(self, mock_post, ai_config, monkeypatch):
+        """Test that changing sampling parameters misses the cache."""
+        monkeypatch.setenv("YAP_LLM_CACHE", "enabled")
+        mock_post.return_value = _completion(GENERATED)
+
+        generate_messages_with_ai({}, ai_config)
+        generate_messages_with_ai({}, ai_config.model_copy(update={"temperature": 0.2}))
+
+        assert mock_post.call_count == 2
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_replay_miss_does_not_call_api(self, mock_post, ai_config, monkeypatch):
+        """Test that replay mode never falls through to the API."""
+        monkeypatch.setenv("YAP_LLM_CACHE", "replay")
+
+        assert generate_messages_with_ai({}, ai_config) is None
+        mock_post.assert_not_called()
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_readonly_does_not_write(self, mock_post, ai_config, monkeypatch):
+        """Test that readonly mode leaves the cache untouched."""
+        monkeypatch.setenv("YAP_LLM_CACHE", "readonly")
+        mock_post.return_value = _completion(GENERATED)
+
+        generate_messages_with_ai({}, ai_config)
+        generate_messages_with_ai({}, ai_config)
+
+        assert mock_post.call_count == 2
+
+    @pytest.mark.parametrize("entry", ['{"messages": []}', '["hello"]', '[{"replies": []}]'])
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_malformed_entry_is_a_miss(self, mock_post, ai_config, monkeypatch, cache_home, entry):
+        """Test that a cache entry with the wrong shape is regenerated rather than returned."""
+        monkeypatch.setenv("YAP_LLM_CACHE", "enabled")
+        mock_post.return_value = _completion(GENERATED)
+
+        generate_messages_with_ai({}, ai_config)
+        (cache_file,) = cache_home.rglob("*.json")
+        cache_file.write_text(entry)
+
+        assert generate_messages_with_ai({}, ai_config) == GENERATED
+        assert mock_post.call_count == 2
@@ -13,6 +13,8 @@ from yap_on_slack.post_messages import (
     UnifiedConfig,
     UserConfigModel,
     WorkspaceConfigModel,
+    _load_unified_config,
+    _load_yaml_file,
     discover_config_file,
     load_unified_config,
 )
@@ -331,6 +333,54 @@ ai:
                 # Verify strategy
                 assert app_config.strategy == "random"
 
+    def test_load_config_returns_parsed_model(self):
+        """Test that the parsed config.yaml model is returned from the same single read."""
+        config_content = """
+workspace:
+  org_url: https://test.slack.com
+  channel_id: C0123456789
+  team_id: T0123456789
+
+credentials:
+  xoxc_token: xoxc-test-token
+  xoxd_token: xoxd-test-token
+
+ai:
+  model: google/gemini-2.5-flash
+"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.yaml"
+            config_file.write_text(config_content)
+
+            with patch.dict("os.environ", {}, clear=True):
+                with patch("pathlib.Path.open", wraps=config_file.open) as mock_open:
+                    app_config, env, unified = _load_unified_config(config_file)
+
+            assert unified is not None
+            assert unified.ai is not None and unified.ai.model == "google/gemini-2.5-flash"
+            assert app_config.workspace.SLACK_TEAM_ID == "T0123456789"
+            assert mock_open.call_count == 1
+
+    def test_yaml_file_cache_tracks_changes(self, tmp_path):
+        """Test that a parsed YAML file is reused until the file changes."""
+        import os
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("workspace:\n  org_url: https://a.slack.com\n")
+
+        first = _load_yaml_file(config_file)
+        first["workspace"]["org_url"] = "mutated"
+        with patch("yap_on_slack.post_messages._yaml_load") as mock_load:
+            second = _load_yaml_file(config_file)
+        mock_load.assert_not_called()
+        assert second["workspace"]["org_url"] == "https://a.slack.com"
+
+        config_file.write_text("workspace:\n  org_url: https://bb.slack.com\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _load_yaml_file(config_file)["workspace"]["org_url"] == "https://bb.slack.com"
+
     def test_load_config_minimal(self):
         """Test loading minimal config with just workspace and credentials."""
         config_content = """
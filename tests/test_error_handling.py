@@ -164,7 +164,7 @@ class TestNetworkErrors:
             "SLACK_TEAM_ID": "T123",
         }
 
-        with patch("httpx.post") as mock_post, patch("time.sleep"):
+        with patch("httpx.Client.post") as mock_post, patch("time.sleep"):
             mock_post.side_effect = httpx.TimeoutException("Request timeout")
 
             with pytest.raises(SlackNetworkError, match="Network error"):
@@ -183,7 +183,7 @@ class TestNetworkErrors:
             "SLACK_TEAM_ID": "T123",
         }
 
-        with patch("httpx.post") as mock_post, patch("time.sleep"):
+        with patch("httpx.Client.post") as mock_post, patch("time.sleep"):
             mock_post.side_effect = httpx.NetworkError("Connection failed")
 
             with pytest.raises(SlackNetworkError, match="Network error"):
@@ -201,7 +201,7 @@ class TestNetworkErrors:
             "SLACK_TEAM_ID": "T123",
         }
 
-        with patch("httpx.post") as mock_post, patch("time.sleep"):
+        with patch("httpx.Client.post") as mock_post, patch("time.sleep"):
             mock_post.side_effect = httpx.TimeoutException("Request timeout")
 
             with pytest.raises(SlackNetworkError, match="Network error"):
@@ -227,11 +227,44 @@ class TestRateLimiting:
         mock_response.json.return_value = {"ok": False, "error": "ratelimited"}
         mock_response.headers = {"Retry-After": "60"}
 
-        with patch("httpx.post", return_value=mock_response):
-            # Rate limit raises exception which does NOT trigger retry (not in retry list)
+        with (
+            patch("httpx.Client.post", return_value=mock_response) as mock_post,
+            patch("time.sleep") as mock_sleep,
+        ):
+            # Rate limits are retried, waiting Retry-After between attempts
             with pytest.raises(SlackRateLimitError, match="retry after 60s"):
                 add_reaction("C123", "123.456", "rocket", config)
 
+        assert mock_post.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [60.0, 60.0]
+
+    def test_post_message_recovers_after_rate_limit(self):
+        """Test that a transient rate limit is retried with jittered backoff."""
+        config = {
+            "SLACK_XOXC_TOKEN": "xoxc-test",
+            "SLACK_XOXD_TOKEN": "xoxd-test",
+            "SLACK_ORG_URL": "https://test.slack.com",
+            "SLACK_CHANNEL_ID": "C123",
+            "SLACK_TEAM_ID": "T123",
+        }
+
+        limited = Mock()
+        limited.json.return_value = {"ok": False, "error": "ratelimited"}
+        limited.headers = {}
+        posted = Mock()
+        posted.json.return_value = {"ok": True, "ts": "123.456"}
+
+        with (
+            patch("httpx.Client.post", side_effect=[limited, posted]) as mock_post,
+            patch("time.sleep") as mock_sleep,
+        ):
+            result = post_message("Test message", config)
+
+        assert result is not None and result["ts"] == "123.456"
+        assert mock_post.call_count == 2
+        # No Retry-After: exponential backoff from 1s plus up to 0.5s of jitter
+        assert 1.0 <= mock_sleep.call_args.args[0] <= 1.5
+
     def test_post_message_channel_not_found(self):
         """Test handling of channel not found error."""
         config = {
@@ -245,7 +278,7 @@ class TestRateLimiting:
         mock_response = Mock()
         mock_response.json.return_value = {"ok": False, "error": "channel_not_found"}
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             with pytest.raises(SlackAPIError, match="channel_not_found"):
                 post_message("Test message", config)
 
@@ -262,7 +295,7 @@ class TestRateLimiting:
         mock_response = Mock()
         mock_response.json.return_value = {"ok": False, "error": "invalid_auth"}
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             with pytest.raises(SlackAPIError, match="invalid_auth"):
                 post_message("Test message", config)
 
@@ -279,7 +312,7 @@ class TestRateLimiting:
         mock_response = Mock()
         mock_response.json.return_value = {"ok": False, "error": "invalid_name"}
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             result = add_reaction("C123", "123.456", "nonexistent_emoji", config)
             assert result is False
 
@@ -296,7 +329,7 @@ class TestRateLimiting:
         mock_response = Mock()
         mock_response.json.return_value = {"ok": False, "error": "already_reacted"}
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             result = add_reaction("C123", "123.456", "rocket", config)
             assert result is True  # Should return True for already reacted
 
@@ -317,7 +350,7 @@ class TestSuccessScenarios:
         mock_response = Mock()
         mock_response.json.return_value = {"ok": True, "ts": "123.456"}
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             result = post_message("Test message", config)
             assert result is not None
             assert result["ok"] is True
@@ -336,6 +369,6 @@ class TestSuccessScenarios:
         mock_response = Mock()
         mock_response.json.return_value = {"ok": True}
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             result = add_reaction("C123", "123.456", "rocket", config)
             assert result is True
@@ -130,6 +130,18 @@ class TestParseRichTextFromString:
             {"type": "emoji", "name": "white_check_mark"},
         ]
 
+    def test_returned_elements_are_independent(self):
+        """Test that mutating a parse result doesn't leak into later parses."""
+        first = parse_rich_text_from_string("@here\n:wave:")
+        for element in first:
+            element.clear()
+
+        assert parse_rich_text_from_string("@here\n:wave:") == [
+            {"type": "broadcast", "range": "here"},
+            {"type": "text", "text": "\n"},
+            {"type": "emoji", "name": "wave"},
+        ]
+
     def test_emoji_with_underscores(self):
         """Test emoji names with underscores."""
         result = parse_rich_text_from_string(":thinking_face:")
@@ -174,19 +186,12 @@ class TestParseRichTextFromString:
     def test_newline_preservation(self):
         """Test that newlines are preserved."""
         result = parse_rich_text_from_string("Line 1\nLine 2")
-        assert result == [
-            {"type": "text", "text": "Line 1"},
-            {"type": "text", "text": "\n"},
-            {"type": "text", "text": "Line 2"},
-        ]
+        assert result == [{"type": "text", "text": "Line 1\nLine 2"}]
 
     def test_multiple_newlines(self):
         """Test multiple newlines."""
         result = parse_rich_text_from_string("Line 1\n\nLine 3")
-        # Should have: Line 1, \n, \n, Line 3
-        assert len(result) == 4
-        assert result[1] == {"type": "text", "text": "\n"}
-        assert result[2] == {"type": "text", "text": "\n"}
+        assert result == [{"type": "text", "text": "Line 1\n\nLine 3"}]
 
     # Bullet point tests
     def test_bullet_with_dot(self):
@@ -199,18 +204,30 @@ class TestParseRichTextFromString:
         result = parse_rich_text_from_string("- First item")
         assert result[0] == {"type": "text", "text": "First item"}
 
+    def test_adjacent_plain_text_is_merged(self):
+        """Test that plain text runs merge but styled runs stay separate."""
+        result = parse_rich_text_from_string("Hi *there*\nbye")
+        assert result == [
+            {"type": "text", "text": "Hi "},
+            {"type": "text", "text": "there", "style": {"bold": True}},
+            {"type": "text", "text": "\nbye"},
+        ]
+
+    def test_indented_bullet_with_mixed_markers(self):
+        """Test the whole leading run of spaces, dots and dashes is stripped."""
+        result = parse_rich_text_from_string("  • - Nested item")
+        assert result[0] == {"type": "text", "text": "Nested item"}
+
     def test_multiple_bullets(self):
         """Test multiple bullet points."""
         result = parse_rich_text_from_string("• First\n• Second")
-        assert result[0] == {"type": "text", "text": "First"}
-        assert result[1] == {"type": "text", "text": "\n"}
-        assert result[2] == {"type": "text", "text": "Second"}
+        assert result == [{"type": "text", "text": "First\nSecond"}]
 
     def test_bullets_with_preceding_text(self):
         """Test bullets following normal text get newline."""
         result = parse_rich_text_from_string("Header:\n• Item")
-        # Should have a newline before bullet item
-        assert {"type": "text", "text": "\n"} in result
+        # Should have an extra newline before the bullet item
+        assert result == [{"type": "text", "text": "Header:\n\nItem"}]
 
     # Mixed formatting tests
     def test_bold_and_italic(self):
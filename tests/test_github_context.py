@@ -0,0 +1,548 @@
+"""Tests for GitHub context fetching."""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import yap_on_slack.post_messages as post_messages
+from yap_on_slack.post_messages import (
+    GitHubConfigModel,
+    GitHubItemLimitsModel,
+    GitHubRepoSelectionModel,
+    _github_get,
+    _TokenBucket,
+    get_github_context,
+)
+
+
+def _response(payload, status_code=200, headers=None):
+    request = httpx.Request("GET", "https://api.github.com")
+    return httpx.Response(status_code, json=payload, headers=headers, request=request)
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the GitHub response cache out of the real home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(post_messages, "_github_rate_limit_remaining", None)
+    monkeypatch.setattr(post_messages, "_GITHUB_BUCKET", _TokenBucket(rate=100, capacity=100))
+    post_messages._github_user.cache_clear()
+    post_messages._github_user_ids.cache_clear()
+    return tmp_path
+
+
+def _route(url, **kwargs):
+    """Return canned GitHub API responses keyed by URL."""
+    if url.endswith("/user"):
+        return _response({"login": "octocat"})
+    if url.endswith("/user/repos"):
+        return _response(
+            [
+                {"full_name": name, "language": "Go", "stargazers_count": 7, "forks_count": 2}
+                for name in ("o/one", "o/two")
+            ]
+        )
+    repo = url.split("/repos/", 1)[1].split("/")
+    name = "/".join(repo[:2])
+    if len(repo) == 2:
+        return _response({"language": "Python", "stargazers_count": 1, "forks_count": 0})
+    if repo[2] == "commits":
+        return _response(
+            [{"commit": {"message": f"fix in {name}", "author": {"name": "Octo", "date": "d"}}}]
+        )
+    if repo[2] == "pulls":
+        return _response([{"title": f"PR in {name}", "number": 1, "user": {"login": "octocat"}}])
+    if repo[2] == "issues":
+        return _response(
+            [
+                {"title": f"Issue in {name}", "number": 2, "user": {"login": "octocat"}},
+                {"title": "A PR", "pull_request": {"url": "u"}, "user": {"login": "octocat"}},
+            ]
+        )
+    return _response({}, status_code=404)
+
+
+class TestGetGitHubContext:
+    """Test suite for get_github_context function over the REST endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def rest_only(self, monkeypatch):
+        """Force the REST code path."""
+        monkeypatch.setenv("GITHUB_GRAPHQL_DISABLED", "1")
+
+    @pytest.fixture
+    def github_config(self):
+        """Provide a config that pins two repos explicitly."""
+        return GitHubConfigModel(
+            repos=GitHubRepoSelectionModel(mode="include", include=["o/one", "o/two"])
+        )
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    def test_collects_context_from_all_repos(self, mock_get, github_config):
+        """Test that every repo contributes metadata, commits, PRs and issues."""
+        context = get_github_context({}, token="ghp-test", limit=2, github_config=github_config)
+
+        assert context is not None
+        assert [r["name"] for r in context["repos"]] == ["o/one", "o/two"]
+        assert [c["repo"] for c in context["commits"]] == ["o/one", "o/two"]
+        assert [p["title"] for p in context["prs"]] == ["PR in o/one", "PR in o/two"]
+        # Pull requests returned by the issues endpoint are dropped
+        assert [i["title"] for i in context["issues"]] == ["Issue in o/one", "Issue in o/two"]
+        # One /user lookup plus four endpoints per repo
+        assert mock_get.call_count == 9
+        for call in mock_get.call_args_list:
+            assert call.kwargs["headers"]["Accept"] == "application/vnd.github+json"
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_failing_endpoint_does_not_drop_other_data(self, mock_get, github_config):
+        """Test that one failing request only loses that endpoint's data."""
+
+        def route(url, **kwargs):
+            if url.endswith("o/two/pulls"):
+                raise RuntimeError("boom")
+            return _route(url, **kwargs)
+
+        mock_get.side_effect = route
+
+        context = get_github_context({}, token="ghp-test", limit=2, github_config=github_config)
+
+        assert context is not None
+        assert [p["repo"] for p in context["prs"]] == ["o/one"]
+        assert len(context["commits"]) == 2
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    def test_multiple_authors_fetch_commits_per_author(self, mock_get):
+        """Test that each author gets its own server-side filtered commits request."""
+        github_config = GitHubConfigModel(
+            repos=GitHubRepoSelectionModel(mode="include", include=["o/one"]),
+            authors=["alice", "bob"],
+        )
+
+        context = get_github_context({}, token="ghp-test", limit=1, github_config=github_config)
+
+        assert context is not None
+        commit_calls = [c for c in mock_get.call_args_list if c.args[0].endswith("/commits")]
+        assert sorted(c.kwargs["params"]["author"] for c in commit_calls) == ["alice", "bob"]
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_author_filter_skips_deleted_users(self, mock_get):
+        """Test that PRs and issues from deleted (null) users don't drop the repo."""
+
+        def route(url, **kwargs):
+            if url.endswith(("/pulls", "/issues")):
+                return _response(
+                    [
+                        {"title": "ghost", "number": 1, "user": None},
+                        {"title": "mine", "number": 2, "user": {"login": "alice"}},
+                    ]
+                )
+            return _route(url, **kwargs)
+
+        mock_get.side_effect = route
+        github_config = GitHubConfigModel(
+            repos=GitHubRepoSelectionModel(mode="include", include=["o/one"]),
+            authors=["alice", "bob"],
+        )
+
+        context = get_github_context({}, token="ghp-test", limit=1, github_config=github_config)
+
+        assert context is not None
+        assert [pr["title"] for pr in context["prs"]] == ["mine"]
+        assert [issue["title"] for issue in context["issues"]] == ["mine"]
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_pr_date_filter_stops_at_first_old_pr(self, mock_get):
+        """Test that PRs sorted by update time are cut at the date boundary."""
+        github_config = GitHubConfigModel(
+            repos=GitHubRepoSelectionModel(mode="include", include=["o/one"]),
+            date_since="2024-06-01",
+        )
+
+        def route(url, **kwargs):
+            if url.endswith("/pulls"):
+                assert kwargs["params"]["sort"] == "updated"
+                return _response(
+                    [
+                        {"title": "new", "updated_at": "2024-07-01T00:00:00Z"},
+                        {"title": "old", "updated_at": "2024-05-01T00:00:00Z"},
+                        {"title": "older", "updated_at": "2024-04-01T00:00:00Z"},
+                    ]
+                )
+            return _route(url, **kwargs)
+
+        mock_get.side_effect = route
+
+        context = get_github_context({}, token="ghp-test", limit=1, github_config=github_config)
+
+        assert context is not None
+        assert [p["title"] for p in context["prs"]] == ["new"]
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    def test_listed_repos_reuse_metadata(self, mock_get):
+        """Test that repos from /user/repos don't need a per-repo metadata call."""
+        context = get_github_context(
+            {}, token="ghp-test", limit=2, github_config=GitHubConfigModel()
+        )
+
+        assert context is not None
+        assert [(r["name"], r["language"], r["stars"]) for r in context["repos"]] == [
+            ("o/one", "Go", 7),
+            ("o/two", "Go", 7),
+        ]
+        urls = [c.args[0] for c in mock_get.call_args_list]
+        assert "https://api.github.com/repos/o/one" not in urls
+        assert "https://api.github.com/repos/o/two" not in urls
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    def test_page_sizes_capped_to_items_used(self, mock_get):
+        """Test that pages aren't larger than what the prompt can use.
+
+        The issues endpoint also returns PRs that are filtered out locally, so it
+        keeps the configured page size.
+        """
+        github_config = GitHubConfigModel(
+            repos=GitHubRepoSelectionModel(mode="include", include=["o/one"]),
+            items_per_repo=GitHubItemLimitsModel(commits=50, prs=50, issues=50),
+        )
+
+        get_github_context({}, token="ghp-test", limit=1, github_config=github_config)
+
+        per_page = {
+            c.args[0].rsplit("/", 1)[1]: c.kwargs["params"]["per_page"]
+            for c in mock_get.call_args_list
+            if c.kwargs.get("params")
+        }
+        assert per_page == {"commits": 3, "pulls": 5, "issues": 50}
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    def test_authenticated_user_is_fetched_once(self, mock_get, github_config):
+        """Test that repeated calls reuse the cached /user lookup."""
+        get_github_context({}, token="ghp-test", limit=2, github_config=github_config)
+        get_github_context({}, token="ghp-test", limit=2, github_config=github_config)
+
+        user_calls = [c for c in mock_get.call_args_list if c.args[0].endswith("/user")]
+        assert len(user_calls) == 1
+
+    @patch("yap_on_slack.post_messages.subprocess.run")
+    def test_gh_cli_token_is_resolved_once(self, mock_run):
+        """Test that 'gh auth token' is only spawned once per process."""
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "gho-cli\n"
+        post_messages._gh_cli_token.cache_clear()
+        try:
+            assert post_messages._gh_cli_token() == "gho-cli"
+            assert post_messages._gh_cli_token() == "gho-cli"
+        finally:
+            post_messages._gh_cli_token.cache_clear()
+
+        assert mock_run.call_count == 1
+
+    def test_disabled_returns_none(self):
+        """Test that a disabled integration makes no requests."""
+        assert get_github_context({}, enabled=False) is None
+
+    @patch("yap_on_slack.post_messages.subprocess.run")
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_nothing_included_returns_none(self, mock_get, mock_run):
+        """Test that turning every fetch off skips auth and repo lookups."""
+        config = GitHubConfigModel(include_repo_metadata=False)
+        context = get_github_context(
+            {},
+            include_commits=False,
+            include_prs=False,
+            include_issues=False,
+            github_config=config,
+        )
+
+        assert context is None
+        mock_get.assert_not_called()
+        mock_run.assert_not_called()
+
+
+def _graphql_repo(name):
+    return {
+        "description": None,
+        "primaryLanguage": {"name": "Python"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "slack"}}]},
+        "stargazerCount": 3,
+        "forkCount": 1,
+        "defaultBranchRef": {
+            "target": {
+                "history": {
+                    "nodes": [
+                        {
+                            "message": f"fix in {name}",
+                            "author": {"name": "Octo", "date": "d", "user": {"login": "octocat"}},
+                        }
+                    ]
+                }
+            }
+        },
+        "pullRequests": {
+            "nodes": [
+                {
+                    "title": f"PR in {name}",
+                    "number": 1,
+                    "state": "MERGED",
+                    "url": "u",
+                    "author": {"login": "octocat"},
+                    "createdAt": "c",
+                    "updatedAt": "u",
+                }
+            ]
+        },
+        "issues": {
+            "nodes": [
+                {
+                    "title": f"Issue in {name}",
+                    "number": 2,
+                    "url": "u",
+                    "state": "OPEN",
+                    "labels": {"nodes": [{"name": "bug"}]},
+                    "author": None,
+                }
+            ]
+        },
+    }
+
+
+class TestGetGitHubContextGraphQL:
+    """Test suite for get_github_context over the GraphQL API."""
+
+    @pytest.fixture
+    def github_config(self):
+        """Provide a config that pins two repos explicitly."""
+        return GitHubConfigModel(
+            repos=GitHubRepoSelectionModel(mode="include", include=["o/one", "o/two"])
+        )
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_single_query_replaces_rest_calls(self, mock_post, mock_get, github_config):
+        """Test that all repos are fetched with one GraphQL query."""
+        mock_post.return_value = _response(
+            {"data": {"repo0": _graphql_repo("o/one"), "repo1": _graphql_repo("o/two")}}
+        )
+
+        context = get_github_context({}, token="ghp-test", limit=2, github_config=github_config)
+
+        assert context is not None
+        assert mock_post.call_count == 1
+        # Only the /user lookup goes over REST
+        assert mock_get.call_count == 1
+        query = mock_post.call_args.kwargs["json"]["query"]
+        assert 'repo0: repository(owner: "o", name: "one")' in query
+        assert 'repo1: repository(owner: "o", name: "two")' in query
+        assert context["repos"][0]["topics"] == ["slack"]
+        assert [c["repo"] for c in context["commits"]] == ["o/one", "o/two"]
+        assert context["prs"][0]["state"] == "closed"
+        assert context["issues"][0] == {
+            "title": "Issue in o/one",
+            "number": 2,
+            "repo": "o/one",
+            "url": "u",
+            "labels": ["bug"],
+            "state": "open",
+            "author": "Unknown",
+        }
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_authors_filter_history_server_side(self, mock_post, mock_get):
+        """Test that authors are resolved to IDs and queried as aliased histories."""
+        github_config = GitHubConfigModel(
+            repos=GitHubRepoSelectionModel(mode="include", include=["o/one"]),
+            authors=["alice", "bob"],
+        )
+        repo = _graphql_repo("o/one")
+
+        def commit(message, date):
+            return {"message": message, "author": {"name": "Someone", "date": date}}
+
+        repo["defaultBranchRef"]["target"] = {
+            "a0": {"nodes": [commit("older", "2024-01-01T00:00:00Z")]},
+            "a1": {"nodes": [commit("newer", "2024-02-01T00:00:00Z")]},
+        }
+        mock_post.side_effect = [
+            _response({"data": {"u0": {"id": "ID_A"}, "u1": {"id": "ID_B"}}}),
+            _response({"data": {"repo0": repo}}),
+        ]
+
+        context = get_github_context({}, token="ghp-test", limit=1, github_config=github_config)
+
+        assert context is not None
+        query = mock_post.call_args_list[1].kwargs["json"]["query"]
+        assert 'a0: history(first: $commits, since: $since, author: {id: "ID_A"})' in query
+        assert 'a1: history(first: $commits, since: $since, author: {id: "ID_B"})' in query
+        # Server-filtered commits are kept regardless of display name, newest first
+        assert [c["message"] for c in context["commits"]] == ["newer", "older"]
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_missing_repo_yields_no_items(self, mock_post, mock_get, github_config):
+        """Test that a repo GraphQL can't resolve contributes nothing."""
+        mock_post.return_value = _response(
+            {
+                "data": {"repo0": _graphql_repo("o/one"), "repo1": None},
+                "errors": [{"type": "NOT_FOUND"}],
+            }
+        )
+
+        context = get_github_context({}, token="ghp-test", limit=2, github_config=github_config)
+
+        assert context is not None
+        assert [p["repo"] for p in context["prs"]] == ["o/one"]
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get", side_effect=_route)
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_failed_query_falls_back_to_rest(self, mock_post, mock_get, github_config):
+        """Test that a rejected GraphQL query is retried over REST."""
+        mock_post.return_value = _response({"message": "Bad credentials"}, status_code=401)
+
+        context = get_github_context({}, token="ghp-test", limit=2, github_config=github_config)
+
+        assert context is not None
+        assert [p["title"] for p in context["prs"]] == ["PR in o/one", "PR in o/two"]
+        assert mock_get.call_count == 9
+
+
+class TestGitHubConditionalCache:
+    """Test suite for the ETag-backed GitHub request cache."""
+
+    URL = "https://api.github.com/repos/o/one/commits"
+    HEADERS = {"Authorization": "Bearer ghp-test"}
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_not_modified_serves_cached_body(self, mock_get):
+        """Test that a 304 reuses the body stored from the previous 200."""
+        mock_get.side_effect = [
+            _response([{"sha": "abc"}], headers={"ETag": '"v1"'}),
+            httpx.Response(304, request=httpx.Request("GET", self.URL)),
+        ]
+
+        first = _github_get(self.URL, headers=self.HEADERS, params={"per_page": 5})
+        second = _github_get(self.URL, headers=self.HEADERS, params={"per_page": 5})
+
+        assert first.json() == [{"sha": "abc"}]
+        assert second.status_code == 200
+        assert second.json() == [{"sha": "abc"}]
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        # Validators are added to a copy, not the caller's headers
+        assert "If-None-Match" not in self.HEADERS
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_cache_is_keyed_by_params_and_token(self, mock_get):
+        """Test that different params or tokens do not share cache entries."""
+        mock_get.return_value = _response([], headers={"ETag": '"v1"'})
+
+        _github_get(self.URL, headers=self.HEADERS, params={"per_page": 5})
+        _github_get(self.URL, headers=self.HEADERS, params={"per_page": 10})
+        _github_get(self.URL, headers={"Authorization": "Bearer other"}, params={"per_page": 5})
+
+        for call in mock_get.call_args_list:
+            assert "If-None-Match" not in call.kwargs["headers"]
+
+    @pytest.mark.parametrize("entry", ['{"etag": "\\"v1\\""}', "[]", '"text"'])
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_malformed_cache_entry_is_a_miss(self, mock_get, entry):
+        """Test that a cache file with the wrong shape is ignored rather than raising."""
+        cache_path = post_messages._github_cache_path(self.URL, None, self.HEADERS)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(entry)
+        mock_get.return_value = httpx.Response(304, request=httpx.Request("GET", self.URL))
+
+        response = _github_get(self.URL, headers=self.HEADERS)
+
+        assert response.status_code == 304
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_cache_files_are_owner_only(self, mock_get):
+        """Test that cached response bodies are not readable by other users."""
+        mock_get.return_value = _response([{"sha": "abc"}], headers={"ETag": '"v1"'})
+
+        _github_get(self.URL, headers=self.HEADERS)
+
+        cache_path = post_messages._github_cache_path(self.URL, None, self.HEADERS)
+        assert cache_path.stat().st_mode & 0o777 == 0o600
+        assert cache_path.parent.stat().st_mode & 0o777 == 0o700
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_low_rate_limit_skips_uncached_calls(self, mock_get):
+        """Test that uncached calls are skipped once the rate limit runs low."""
+        mock_get.return_value = _response(
+            [], headers={"ETag": '"v1"', "X-RateLimit-Remaining": "42"}
+        )
+
+        _github_get(self.URL, headers=self.HEADERS)
+        cached = _github_get(self.URL, headers=self.HEADERS)
+        skipped = _github_get(self.URL + "?page=2", headers=self.HEADERS)
+
+        assert cached.status_code == 200
+        assert skipped.status_code == 429
+        assert mock_get.call_count == 2
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_low_graphql_budget_does_not_block_rest(self, mock_post, mock_get):
+        """Test that the separate GraphQL budget does not throttle REST fallback."""
+        reset_at = int(time.time()) + 1000
+        mock_post.return_value = _response(
+            {"data": {}},
+            headers={
+                "X-RateLimit-Resource": "graphql",
+                "X-RateLimit-Remaining": "5",
+                "X-RateLimit-Reset": str(reset_at),
+            },
+        )
+        mock_get.return_value = _response([{"sha": "abc"}])
+
+        post_messages._github_graphql("{ viewer { login } }", headers=self.HEADERS)
+        response = _github_get(self.URL, headers=self.HEADERS)
+
+        assert response.status_code == 200
+        assert mock_get.call_count == 1
+        assert post_messages._github_rate_limit_remaining is None
+        assert post_messages._GITHUB_BUCKET.rate == 100
+
+
+class TestTokenBucket:
+    """Test suite for the GitHub request rate limiter."""
+
+    @patch("yap_on_slack.post_messages.time.sleep")
+    def test_burst_up_to_capacity_then_waits(self, mock_sleep):
+        """Test that calls beyond the burst capacity wait for a refill."""
+        bucket = _TokenBucket(rate=1, capacity=2)
+
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(1, abs=0.05)
+
+    def test_pace_spreads_low_remaining_quota(self):
+        """Test that a nearly exhausted quota slows the rate until reset."""
+        bucket = _TokenBucket(rate=10, capacity=10)
+
+        bucket.pace(remaining=50, reset_at=time.time() + 100)
+        assert bucket.rate == pytest.approx(0.5, rel=0.05)
+
+        bucket.pace(remaining=4000, reset_at=time.time() + 100)
+        assert bucket.rate == 10
+
+    @patch("yap_on_slack.post_messages.httpx.Client.get")
+    def test_rate_limit_headers_pace_shared_bucket(self, mock_get):
+        """Test that GitHub responses feed their rate-limit headers to the bucket."""
+        reset_at = int(time.time()) + 1000
+        mock_get.return_value = _response(
+            [], headers={"X-RateLimit-Remaining": "150", "X-RateLimit-Reset": str(reset_at)}
+        )
+
+        _github_get("https://api.github.com/user", headers={"Authorization": "Bearer t"})
+
+        assert post_messages._GITHUB_BUCKET.rate == pytest.approx(0.15, rel=0.05)
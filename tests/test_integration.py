@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +17,8 @@ from yap_on_slack.post_messages import (
     load_messages,
 )
 
+_real_sleep = time.sleep
+
 
 class TestLoadConfig:
     """Test suite for load_config function."""
@@ -232,6 +235,30 @@ users:
             # Reply count should be between 0 and 8 even with single user
             assert len(messages[0]["replies"]) <= 8
 
+        def test_single_user_keeps_reply_dicts(self):
+            """Test that reply dicts are reused rather than copied with a single user."""
+            app = AppConfig(
+                workspace=SlackWorkspace(
+                    SLACK_ORG_URL="https://test.slack.com",
+                    SLACK_CHANNEL_ID="C123",
+                    SLACK_TEAM_ID="T123",
+                ),
+                users=[
+                    SlackUser(name="env", SLACK_XOXC_TOKEN="x1", SLACK_XOXD_TOKEN="d1"),
+                ],
+            )
+            reply = {"text": "reply"}
+            messages = [{"text": "Hello", "replies": [reply]}]
+
+            with patch(
+                "yap_on_slack.post_messages.random.choices",
+                side_effect=lambda population, k: [8] * k,
+            ):
+                _assign_users_to_ai_messages(app, messages)
+
+            assert messages[0]["replies"][0] is reply
+            assert "user" not in reply
+
         def test_global_round_robin_cycles_through_all_users(self):
             """Test that round-robin cycles through all users across messages."""
             app = AppConfig(
@@ -306,6 +333,25 @@ users:
             assert messages[2]["user"] == "alice"
             assert messages[3]["user"] == "bob"
 
+        def test_select_user_by_name(self):
+            """Test that named users are looked up and unknown names are rejected."""
+            app = AppConfig(
+                workspace=SlackWorkspace(
+                    SLACK_ORG_URL="https://test.slack.com",
+                    SLACK_CHANNEL_ID="C123",
+                    SLACK_TEAM_ID="T123",
+                ),
+                users=[
+                    SlackUser(name="alice", SLACK_XOXC_TOKEN="x1", SLACK_XOXD_TOKEN="d1"),
+                    SlackUser(name="bob", SLACK_XOXC_TOKEN="x2", SLACK_XOXD_TOKEN="d2"),
+                ],
+            )
+
+            assert app.select_user(name="bob", message_index=0).SLACK_XOXC_TOKEN == "x2"
+            assert app.select_user(name=None, message_index=2).name == "alice"
+            with pytest.raises(ValueError, match="Unknown user 'carol'"):
+                app.select_user(name="carol", message_index=0)
+
         def test_random_strategy_assigns_random_users(self):
             """Test that random strategy assigns users randomly."""
             app = AppConfig(
@@ -406,6 +452,34 @@ class TestLoadMessages:
                 if "replies" in msg:
                     assert isinstance(msg["replies"], list)
 
+    def test_load_messages_defaults_are_copies(self):
+        """Test that editing returned default messages doesn't change later results."""
+        with patch("yap_on_slack.post_messages.Path") as mock_path:
+            mock_path.return_value.exists.return_value = False
+
+            first = load_messages()
+            first[0]["text"] = "changed"
+            first[0]["replies"].append("extra")
+
+            second = load_messages()
+
+            assert second[0]["text"] != "changed"
+            assert "extra" not in second[0]["replies"]
+
+    def test_message_replies_accept_strings_and_objects(self):
+        """Test that string and object replies validate to the same reply model."""
+        from pydantic import ValidationError
+
+        from yap_on_slack.post_messages import Message
+
+        msg = Message(text="Hi", replies=["plain", {"text": "styled", "user": "alice"}])
+        assert [(r.text, r.user) for r in msg.replies] == [("plain", None), ("styled", "alice")]
+
+        with pytest.raises(ValidationError, match="Reply text cannot be empty"):
+            Message(text="Hi", replies=["  "])
+        with pytest.raises(ValidationError, match="Reply must be a string or object"):
+            Message(text="Hi", replies=[42])
+
     def test_load_messages_with_empty_file(self):
         """Test loading empty messages file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -456,7 +530,7 @@ class TestMainFlow:
         }
         return app, env
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     @patch("yap_on_slack.post_messages.time.sleep")
     @patch("yap_on_slack.post_messages.load_config")
     @patch("yap_on_slack.post_messages.load_messages")
@@ -486,7 +560,7 @@ class TestMainFlow:
         # Should post 3 messages total: 2 main + 1 reply
         assert mock_post.call_count == 3
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     @patch("yap_on_slack.post_messages.time.sleep")
     @patch("yap_on_slack.post_messages.load_config")
     @patch("yap_on_slack.post_messages.load_messages")
@@ -511,7 +585,66 @@ class TestMainFlow:
 
         assert mock_post.call_count >= 1
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    @patch("yap_on_slack.post_messages.time.sleep")
+    @patch("yap_on_slack.post_messages.load_config")
+    @patch("yap_on_slack.post_messages.load_messages")
+    def test_main_posts_with_each_users_own_tokens_when_names_repeat(
+        self, mock_load_messages, mock_load_config, mock_sleep, mock_post, app_env
+    ):
+        """Test that same-named users each post with their own credentials."""
+        from yap_on_slack.post_messages import main
+
+        app, env = app_env
+        app = AppConfig(
+            workspace=app.workspace,
+            users=[
+                SlackUser(name="dup", SLACK_XOXC_TOKEN="xoxc-first", SLACK_XOXD_TOKEN="d1"),
+                SlackUser(name="dup", SLACK_XOXC_TOKEN="xoxc-second", SLACK_XOXD_TOKEN="d2"),
+            ],
+            strategy="round_robin",
+        )
+        mock_load_config.return_value = (app, env)
+        mock_load_messages.return_value = [{"text": "Message 1"}, {"text": "Message 2"}]
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"ok": True, "ts": "1234567890.123456"}
+        mock_post.return_value = mock_response
+
+        main()
+
+        tokens = [call.kwargs["data"]["token"] for call in mock_post.call_args_list]
+        assert tokens == ["xoxc-first", "xoxc-second"]
+
+    @patch("yap_on_slack.post_messages.post_message")
+    @patch("yap_on_slack.post_messages.time.sleep")
+    @patch("yap_on_slack.post_messages.load_config")
+    @patch("yap_on_slack.post_messages.load_messages")
+    def test_main_counts_unexpected_errors_as_failed_posts(
+        self, mock_load_messages, mock_load_config, mock_sleep, mock_post_message, app_env
+    ):
+        """Test that an unexpected error fails one post without ending the run."""
+        from yap_on_slack.post_messages import main
+
+        mock_load_config.return_value = app_env
+        mock_load_messages.return_value = [
+            {"text": "Message 1", "replies": ["Reply 1", "Reply 2"]},
+            {"text": "Message 2", "replies": []},
+            {"text": "Message 3", "replies": []},
+        ]
+        mock_post_message.side_effect = [
+            {"ts": "1.0"},
+            TypeError("boom"),
+            {"ts": "1.1"},
+            ValueError("bad"),
+            {"ts": "3.0"},
+        ]
+
+        main()
+
+        assert mock_post_message.call_count == 5
+        assert mock_post_message.call_args.args[0] == "Message 3"
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     @patch("yap_on_slack.post_messages.time.sleep")
     @patch("yap_on_slack.post_messages.load_config")
     @patch("yap_on_slack.post_messages.load_messages")
@@ -542,7 +675,7 @@ class TestMainFlow:
             assert data["thread_ts"] == parent_ts
             assert data["reply_broadcast"] == "false"
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     @patch("yap_on_slack.post_messages.time.sleep")
     @patch("yap_on_slack.post_messages.load_config")
     @patch("yap_on_slack.post_messages.load_messages")
@@ -572,3 +705,55 @@ class TestMainFlow:
         # Check that reaction endpoint was called
         calls = [call[0][0] for call in mock_post.call_args_list]
         assert any("reactions.add" in url for url in calls)
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    @patch("yap_on_slack.post_messages.time.sleep")
+    @patch("yap_on_slack.post_messages.load_config")
+    @patch("yap_on_slack.post_messages.load_messages")
+    def test_main_delay_counts_time_spent_posting(
+        self, mock_load_messages, mock_load_config, mock_sleep, mock_post, app_env
+    ):
+        """Test that a slow post shortens the following inter-message delay."""
+        from yap_on_slack.post_messages import main
+
+        mock_load_config.return_value = app_env
+        mock_load_messages.return_value = [
+            {"text": "Message 1", "replies": []},
+            {"text": "Message 2", "replies": []},
+        ]
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"ok": True, "ts": "1234567890.123456"}
+
+        def slow_post(*args, **kwargs):
+            _real_sleep(0.3)
+            return mock_response
+
+        mock_post.side_effect = slow_post
+
+        main()
+
+        # Default --delay is 2.0s; the 0.3s post is deducted from it
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays
+        assert max(delays) <= 1.75
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    @patch("yap_on_slack.post_messages.time.sleep")
+    @patch("yap_on_slack.post_messages.load_config")
+    @patch("yap_on_slack.post_messages.load_messages")
+    def test_main_validates_all_messages_before_posting(
+        self, mock_load_messages, mock_load_config, mock_sleep, mock_post, app_env
+    ):
+        """Test that an invalid reply late in the list stops the run before any post."""
+        from yap_on_slack.post_messages import main
+
+        mock_load_config.return_value = app_env
+        mock_load_messages.return_value = [
+            {"text": "Message 1", "replies": ["Reply 1"]},
+            {"text": "Message 2", "replies": ["   "]},
+        ]
+
+        main()
+
+        mock_post.assert_not_called()
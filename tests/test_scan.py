@@ -10,9 +10,11 @@ from yap_on_slack.post_messages import (
     SlackAPIError,
     SlackNetworkError,
     SlackRateLimitError,
+    _replies_cache_path,
     fetch_channel_messages,
     generate_system_prompts,
     get_channel_info,
+    invalidate_channels_cache,
     list_channels,
 )
 
@@ -20,6 +22,13 @@ from yap_on_slack.post_messages import (
 class TestListChannels:
     """Test suite for list_channels function."""
 
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        """Keep the channel list cache inside a temporary directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.delenv("SLACK_CHANNELS_CACHE_TTL", raising=False)
+        return tmp_path
+
     @pytest.fixture
     def config(self):
         """Provide test configuration."""
@@ -31,7 +40,7 @@ class TestListChannels:
             "SLACK_TEAM_ID": "T1234567890",
         }
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_list_channels_success(self, mock_post, config):
         """Test successful channel listing."""
         mock_response = MagicMock()
@@ -66,7 +75,7 @@ class TestListChannels:
         assert result[0]["is_private"] is False
         mock_post.assert_called_once()
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_list_channels_with_pagination(self, mock_post, config):
         """Test channel listing with pagination."""
         # First response with cursor
@@ -94,7 +103,7 @@ class TestListChannels:
         assert result[1]["name"] == "ch2"
         assert mock_post.call_count == 2
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_list_channels_rate_limited(self, mock_post, config):
         """Test rate limit handling."""
         mock_response = MagicMock()
@@ -107,7 +116,7 @@ class TestListChannels:
 
         assert "Rate limited" in str(exc_info.value)
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_list_channels_auth_error(self, mock_post, config):
         """Test authentication error handling."""
         mock_response = MagicMock()
@@ -120,7 +129,7 @@ class TestListChannels:
         assert "Authentication error" in str(exc_info.value)
 
     @patch("time.sleep")
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_list_channels_network_error(self, mock_post, mock_sleep, config):
         """Test network error handling with retries."""
         mock_post.side_effect = httpx.ConnectError("Connection failed")
@@ -131,6 +140,73 @@ class TestListChannels:
         # Verify it retried 3 times
         assert mock_post.call_count == 3
 
+    @pytest.fixture
+    def channels_response(self):
+        """Provide a single-page conversations.list response."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "ok": True,
+            "channels": [{"id": "C1", "name": "ch1", "num_members": 10, "is_private": False}],
+            "response_metadata": {},
+        }
+        return mock_response
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_list_channels_uses_cache(self, mock_post, config, channels_response):
+        """Test that a second call is served from the disk cache."""
+        mock_post.return_value = channels_response
+
+        first = list_channels(config)
+        second = list_channels(config)
+
+        assert first == second
+        mock_post.assert_called_once()
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_list_channels_force_refresh(self, mock_post, config, channels_response):
+        """Test that force_refresh bypasses the cache."""
+        mock_post.return_value = channels_response
+
+        list_channels(config)
+        list_channels(config, force_refresh=True)
+
+        assert mock_post.call_count == 2
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_list_channels_cache_disabled(
+        self, mock_post, config, channels_response, monkeypatch, cache_home
+    ):
+        """Test that SLACK_CHANNELS_CACHE_TTL=0 disables caching."""
+        monkeypatch.setenv("SLACK_CHANNELS_CACHE_TTL", "0")
+        mock_post.return_value = channels_response
+
+        list_channels(config)
+        list_channels(config)
+
+        assert mock_post.call_count == 2
+        assert not (cache_home / "yap-on-slack").exists()
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_invalidate_channels_cache(self, mock_post, config, channels_response):
+        """Test that invalidating the cache forces the next call to Slack."""
+        mock_post.return_value = channels_response
+
+        list_channels(config)
+        invalidate_channels_cache(config)
+        list_channels(config)
+
+        assert mock_post.call_count == 2
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_list_channels_cache_is_per_credential(self, mock_post, config, channels_response):
+        """Test that different tokens don't share cached channel lists."""
+        mock_post.return_value = channels_response
+
+        list_channels(config)
+        list_channels({**config, "SLACK_XOXC_TOKEN": "xoxc-other-user"})
+
+        assert mock_post.call_count == 2
+
 
 class TestGetChannelInfo:
     """Test suite for get_channel_info function."""
@@ -144,7 +220,7 @@ class TestGetChannelInfo:
             "SLACK_ORG_URL": "https://test-workspace.slack.com",
         }
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_get_channel_info_success(self, mock_post, config):
         """Test successful channel info retrieval."""
         mock_response = MagicMock()
@@ -166,7 +242,7 @@ class TestGetChannelInfo:
         assert result["id"] == "C1234567890"
         assert result["name"] == "general"
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_get_channel_info_not_found(self, mock_post, config):
         """Test channel not found returns None."""
         mock_response = MagicMock()
@@ -181,6 +257,12 @@ class TestGetChannelInfo:
 class TestFetchChannelMessages:
     """Test suite for fetch_channel_messages function."""
 
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        """Keep the thread replies cache inside a temporary directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        return tmp_path
+
     @pytest.fixture
     def config(self):
         """Provide test configuration."""
@@ -190,8 +272,18 @@ class TestFetchChannelMessages:
             "SLACK_ORG_URL": "https://test-workspace.slack.com",
         }
 
+    def test_replies_batch_size_capped_at_worker_pool(self, monkeypatch):
+        """Test that the reply batch size can't exceed the shared pool's threads."""
+        from yap_on_slack import post_messages
+
+        monkeypatch.setenv("SLACK_REPLIES_BATCH_SIZE", "4")
+        assert post_messages._replies_batch_size() == 4
+
+        monkeypatch.setenv("SLACK_REPLIES_BATCH_SIZE", "50")
+        assert post_messages._replies_batch_size() == post_messages._EXECUTOR_MAX_WORKERS
+
     @patch("time.sleep")  # Mock sleep to speed up tests
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_fetch_messages_success(self, mock_post, mock_sleep, config):
         """Test successful message fetching."""
         mock_response = MagicMock()
@@ -224,7 +316,7 @@ class TestFetchChannelMessages:
         assert result["messages"][0]["text"] == "Hello world"
 
     @patch("time.sleep")
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_fetch_messages_with_replies(self, mock_post, mock_sleep, config):
         """Test fetching messages with thread replies."""
         # First call: history
@@ -261,7 +353,7 @@ class TestFetchChannelMessages:
         assert result["total_replies"] == 2
         assert len(result["messages"][0]["replies"]) == 2
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_fetch_messages_rate_limited(self, mock_post, config):
         """Test rate limit handling."""
         mock_response = MagicMock()
@@ -272,7 +364,144 @@ class TestFetchChannelMessages:
         with pytest.raises(SlackRateLimitError):
             fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("time.sleep")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_fetch_replies_rate_limited_then_retried(self, mock_post, mock_sleep, config):
+        """Test that rate-limited reply fetches back off and are retried."""
+        history_response = MagicMock()
+        history_response.json.return_value = {
+            "ok": True,
+            "messages": [{"text": "Parent", "user": "U1", "ts": "100.1", "reply_count": 1}],
+            "response_metadata": {},
+        }
+        limited_response = MagicMock()
+        limited_response.json.return_value = {"ok": False, "error": "ratelimited"}
+        limited_response.headers = {"Retry-After": "3"}
+        replies_response = MagicMock()
+        replies_response.json.return_value = {
+            "ok": True,
+            "messages": [
+                {"text": "Parent", "user": "U1", "ts": "100.1"},
+                {"text": "Reply", "user": "U2", "ts": "100.2"},
+            ],
+        }
+        mock_post.side_effect = [history_response, limited_response, replies_response]
+
+        result = fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+
+        assert result["total_replies"] == 1
+        assert result["messages"][0]["replies"][0]["text"] == "Reply"
+        mock_sleep.assert_any_call(3.0)
+
+    @patch("time.sleep")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_fetch_replies_persistent_rate_limit_keeps_messages(
+        self, mock_post, mock_sleep, config
+    ):
+        """Test that persistent reply rate limiting returns the messages already fetched."""
+        history_response = MagicMock()
+        history_response.json.return_value = {
+            "ok": True,
+            "messages": [{"text": "Parent", "user": "U1", "ts": "100.1", "reply_count": 1}],
+            "response_metadata": {},
+        }
+        limited_response = MagicMock()
+        limited_response.json.return_value = {"ok": False, "error": "ratelimited"}
+        limited_response.headers = {"Retry-After": "1"}
+        mock_post.side_effect = [history_response] + [limited_response] * 10
+
+        result = fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+
+        assert result["total_messages"] == 1
+        assert result["total_replies"] == 0
+
+    @pytest.fixture
+    def thread_responses(self):
+        """Provide history and replies responses for a single two-reply thread."""
+
+        def build(reply_count):
+            history_response = MagicMock()
+            history_response.json.return_value = {
+                "ok": True,
+                "messages": [
+                    {"text": "Parent", "user": "U1", "ts": "100.1", "reply_count": reply_count}
+                ],
+                "response_metadata": {},
+            }
+            replies_response = MagicMock()
+            replies_response.json.return_value = {
+                "ok": True,
+                "messages": [
+                    {"text": "Parent", "user": "U1", "ts": "100.1"},
+                    {"text": "Reply", "user": "U2", "ts": "100.2"},
+                ],
+            }
+            return history_response, replies_response
+
+        return build
+
+    @patch("time.sleep")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_fetch_replies_uses_cache_when_unchanged(
+        self, mock_post, mock_sleep, config, thread_responses
+    ):
+        """Test that unchanged threads are served from the replies cache."""
+        history_response, replies_response = thread_responses(1)
+        mock_post.side_effect = [history_response, replies_response, history_response]
+
+        first = fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+        second = fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+
+        assert mock_post.call_count == 3  # second run skips conversations.replies
+        assert second["messages"][0]["replies"] == first["messages"][0]["replies"]
+        assert second["total_replies"] == 1
+
+    @patch("time.sleep")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_fetch_replies_refetched_when_reply_count_changes(
+        self, mock_post, mock_sleep, config, thread_responses
+    ):
+        """Test that threads with a new reply_count are fetched again."""
+        history_one, replies_response = thread_responses(1)
+        history_two, _ = thread_responses(2)
+        mock_post.side_effect = [history_one, replies_response, history_two, replies_response]
+
+        fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+        fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+
+        assert mock_post.call_count == 4
+
+    @pytest.mark.parametrize("entry", ["[]", '{"100.1": 1}', '{"100.1": [1, "x"]}'])
+    @patch("time.sleep")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_fetch_replies_malformed_cache_is_a_miss(
+        self, mock_post, mock_sleep, config, thread_responses, entry
+    ):
+        """Test that a replies cache with the wrong shape is refetched rather than raising."""
+        cache_path = _replies_cache_path(config, "C1234567890")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(entry)
+        history_response, replies_response = thread_responses(1)
+        mock_post.side_effect = [history_response, replies_response]
+
+        result = fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+
+        assert mock_post.call_count == 2
+        assert result["total_replies"] == 1
+
+    @patch("time.sleep")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_fetch_replies_cache_disabled(self, mock_post, mock_sleep, config, thread_responses):
+        """Test that use_cache=False always fetches replies."""
+        history_response, replies_response = thread_responses(1)
+        mock_post.side_effect = [history_response, replies_response] * 2
+
+        fetch_channel_messages(config, "C1234567890", limit=10, throttle=0)
+        fetch_channel_messages(config, "C1234567890", limit=10, throttle=0, use_cache=False)
+
+        assert mock_post.call_count == 4
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_fetch_messages_channel_not_found(self, mock_post, config):
         """Test channel not found error."""
         mock_response = MagicMock()
@@ -285,7 +514,7 @@ class TestFetchChannelMessages:
         assert "not found" in str(exc_info.value)
 
     @patch("time.sleep")
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_fetch_messages_progress_callback(self, mock_post, mock_sleep, config):
         """Test progress callback is called."""
         mock_response = MagicMock()
@@ -326,7 +555,7 @@ class TestGenerateSystemPrompts:
             ],
         }
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_generate_prompts_success(self, mock_post, channel_data):
         """Test successful prompt generation."""
         mock_response = MagicMock()
@@ -354,7 +583,7 @@ class TestGenerateSystemPrompts:
         assert len(result) == 3
         assert "Prompt 1" in result[0]
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_generate_prompts_with_markdown_code_block(self, mock_post, channel_data):
         """Test parsing prompts from markdown code blocks."""
         mock_response = MagicMock()
@@ -378,7 +607,7 @@ class TestGenerateSystemPrompts:
 
         assert result is None
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_generate_prompts_api_error(self, mock_post, channel_data):
         """Test API error handling."""
         mock_response = MagicMock()
@@ -390,7 +619,7 @@ class TestGenerateSystemPrompts:
 
         assert result is None
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_generate_prompts_invalid_auth(self, mock_post, channel_data):
         """Test invalid auth handling."""
         mock_response = MagicMock()
@@ -402,7 +631,7 @@ class TestGenerateSystemPrompts:
 
         assert result is None
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_generate_prompts_timeout(self, mock_post, channel_data):
         """Test timeout handling."""
         mock_post.side_effect = httpx.TimeoutException("Request timed out")
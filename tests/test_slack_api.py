@@ -1,12 +1,14 @@
 """Mock tests for Slack API interactions."""
 
+import threading
+import time
 import uuid
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
-from yap_on_slack.post_messages import add_reaction, post_message
+from yap_on_slack.post_messages import add_reaction, add_reactions, post_message
 
 
 class TestPostMessage:
@@ -23,7 +25,7 @@ class TestPostMessage:
             "SLACK_TEAM_ID": "T1234567890",
         }
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_post_message_success(self, mock_post, config):
         """Test successful message posting."""
         mock_response = MagicMock()
@@ -45,9 +47,23 @@ class TestPostMessage:
         call_args = mock_post.call_args
         assert call_args.kwargs["data"]["token"] == config["SLACK_XOXC_TOKEN"]
         assert call_args.kwargs["data"]["channel"] == config["SLACK_CHANNEL_ID"]
-        assert call_args.kwargs["cookies"]["d"] == config["SLACK_XOXD_TOKEN"]
+        assert f"d={config['SLACK_XOXD_TOKEN']}" in call_args.kwargs["headers"]["Cookie"]
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_post_message_reuses_session_headers(self, mock_post, config):
+        """Test that the cookie header is built once and reused across posts."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"ok": True, "ts": "1234567890.123456"}
+        mock_post.return_value = mock_response
+
+        post_message("Message 1", config)
+        post_message("Message 2", config)
+
+        first, second = (call.kwargs["headers"] for call in mock_post.call_args_list)
+        assert first is second
+        assert "user-agent" in first
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_post_message_with_thread(self, mock_post, config):
         """Test posting a message in a thread."""
         mock_response = MagicMock()
@@ -65,7 +81,7 @@ class TestPostMessage:
         assert call_args.kwargs["data"]["thread_ts"] == "1234567890.123456"
         assert call_args.kwargs["data"]["reply_broadcast"] == "false"
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_post_message_failure(self, mock_post, config):
         """Test message posting failure."""
         from yap_on_slack.post_messages import SlackAPIError
@@ -81,7 +97,7 @@ class TestPostMessage:
             post_message("Test message", config)
 
     @patch("time.sleep")
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_post_message_network_error(self, mock_post, mock_sleep, config):
         """Test network error during message posting."""
         from yap_on_slack.post_messages import SlackNetworkError
@@ -94,8 +110,24 @@ class TestPostMessage:
         # Verify it retried 3 times
         assert mock_post.call_count == 3
 
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_post_message_protocol_error_returns_none(self, mock_post, config):
+        """Test that a non-retried transport error is reported as a failed post."""
+        mock_post.side_effect = httpx.RemoteProtocolError("Server disconnected")
+
+        assert post_message("Test message", config) is None
+        assert mock_post.call_count == 1
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_post_message_unexpected_error_propagates(self, mock_post, config):
+        """Test that programming errors aren't swallowed as failed posts."""
+        mock_post.side_effect = TypeError("bad argument")
+
+        with pytest.raises(TypeError):
+            post_message("Test message", config)
+
     @patch("time.sleep")
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_post_message_timeout(self, mock_post, mock_sleep, config):
         """Test timeout during message posting."""
         from yap_on_slack.post_messages import SlackNetworkError
@@ -108,7 +140,7 @@ class TestPostMessage:
         # Verify it retried 3 times
         assert mock_post.call_count == 3
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_post_message_with_formatting(self, mock_post, config):
         """Test posting message with rich formatting."""
         mock_response = MagicMock()
@@ -124,7 +156,7 @@ class TestPostMessage:
         call_args = mock_post.call_args
         assert "blocks" in call_args.kwargs["data"]
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_post_message_generates_unique_client_msg_id(self, mock_post, config):
         """Test that each message gets a unique client_msg_id."""
         mock_response = MagicMock()
@@ -158,7 +190,7 @@ class TestAddReaction:
             "SLACK_ORG_URL": "https://test-workspace.slack.com",
         }
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_add_reaction_success(self, mock_post, config):
         """Test successfully adding a reaction."""
         mock_response = MagicMock()
@@ -176,7 +208,7 @@ class TestAddReaction:
         assert call_args.kwargs["data"]["timestamp"] == "1234567890.123456"
         assert call_args.kwargs["data"]["name"] == "thumbsup"
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_add_reaction_failure(self, mock_post, config):
         """Test reaction adding failure - already_reacted returns True."""
         mock_response = MagicMock()
@@ -191,7 +223,7 @@ class TestAddReaction:
         assert result is True  # already_reacted is treated as success
 
     @patch("time.sleep")
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_add_reaction_network_error(self, mock_post, mock_sleep, config):
         """Test network error during reaction adding."""
         from yap_on_slack.post_messages import SlackNetworkError
@@ -205,7 +237,7 @@ class TestAddReaction:
         assert mock_post.call_count == 3
 
     @patch("time.sleep")
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_add_reaction_timeout(self, mock_post, mock_sleep, config):
         """Test timeout during reaction adding."""
         from yap_on_slack.post_messages import SlackNetworkError
@@ -218,7 +250,7 @@ class TestAddReaction:
         # Verify it retried 3 times
         assert mock_post.call_count == 3
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_add_reaction_with_emoji_variants(self, mock_post, config):
         """Test adding various emoji types."""
         mock_response = MagicMock()
@@ -231,7 +263,7 @@ class TestAddReaction:
             result = add_reaction("C1234567890", "1234567890.123456", emoji, config)
             assert result is True
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_add_reaction_uses_correct_endpoint(self, mock_post, config):
         """Test that reactions use the correct API endpoint."""
         mock_response = MagicMock()
@@ -243,7 +275,7 @@ class TestAddReaction:
         call_args = mock_post.call_args
         assert call_args[0][0] == f"{config['SLACK_ORG_URL']}/api/reactions.add"
 
-    @patch("yap_on_slack.post_messages.httpx.post")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
     def test_add_reaction_timeout_value(self, mock_post, config):
         """Test that reaction requests have appropriate timeout."""
         mock_response = MagicMock()
@@ -254,3 +286,202 @@ class TestAddReaction:
 
         call_args = mock_post.call_args
         assert call_args.kwargs["timeout"] == 5
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_add_reactions_posts_each_unique_emoji(self, mock_post, config):
+        """Test that batched reactions post once per unique emoji."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"ok": True}
+        mock_post.return_value = mock_response
+
+        results = add_reactions(
+            "C1234567890", "1234567890.123456", ["wave", "rocket", "wave", ""], config
+        )
+
+        assert results == {"wave": True, "rocket": True}
+        assert mock_post.call_count == 2
+        names = {call.kwargs["data"]["name"] for call in mock_post.call_args_list}
+        assert names == {"wave", "rocket"}
+
+    @patch("time.sleep")
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_add_reactions_failure_does_not_raise(self, mock_post, mock_sleep, config):
+        """Test that a failing reaction is reported as False instead of raising."""
+        mock_post.side_effect = httpx.ConnectError("Connection failed")
+
+        results = add_reactions("C1234567890", "1234567890.123456", ["wave"], config)
+
+        assert results == {"wave": False}
+
+    def test_add_reactions_respects_concurrency_cap(self, config, monkeypatch):
+        """Test that no more than SLACK_MAX_CONCURRENT_REQUESTS reactions run at once."""
+        from yap_on_slack import post_messages
+
+        monkeypatch.setenv("SLACK_MAX_CONCURRENT_REQUESTS", "2")
+        post_messages._slack_request_slots.cache_clear()
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_add_reaction(channel, timestamp, emoji, config):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return True
+
+        try:
+            with patch.object(post_messages, "add_reaction", fake_add_reaction):
+                results = add_reactions(
+                    "C1234567890", "1234567890.123456", ["a", "b", "c", "d", "e"], config
+                )
+        finally:
+            post_messages._slack_request_slots.cache_clear()
+
+        assert all(results.values()) and len(results) == 5
+        assert peak <= 2
+
+    def test_add_reactions_empty_list(self, config):
+        """Test that an empty emoji list makes no requests."""
+        assert add_reactions("C1234567890", "1234567890.123456", [], config) == {}
+
+
+class TestSharedHttpClient:
+    """Test suite for the shared pooled HTTP client."""
+
+    def test_client_is_reused(self):
+        """Test that requests share one client between calls."""
+        from yap_on_slack.post_messages import _get_http_client
+
+        assert _get_http_client() is _get_http_client()
+
+    def test_set_ssl_context_resets_client(self):
+        """Test that changing the SSL context rebuilds the shared client."""
+        from yap_on_slack.post_messages import _get_http_client, set_ssl_context
+
+        client = _get_http_client()
+        set_ssl_context(True)
+
+        assert client.is_closed
+        assert _get_http_client() is not client
+
+    def test_client_does_not_store_response_cookies(self):
+        """Test that Set-Cookie responses don't leak into later requests."""
+        from yap_on_slack.post_messages import _get_http_client
+
+        client = _get_http_client()
+        request = httpx.Request("POST", "https://test-workspace.slack.com/api/chat.postMessage")
+        response = httpx.Response(200, headers={"Set-Cookie": "d=other-user"}, request=request)
+        client.cookies.extract_cookies(response)
+
+        assert len(client.cookies) == 0
+
+
+class TestResponseJson:
+    """Test suite for JSON response decoding."""
+
+    def test_decodes_with_httpx_without_orjson(self, monkeypatch):
+        """Test that responses fall back to httpx decoding."""
+        from yap_on_slack import post_messages
+
+        monkeypatch.setattr(post_messages, "_orjson_loads", None)
+        response = httpx.Response(200, json={"ok": True, "text": "héllo"})
+
+        assert post_messages._response_json(response) == {"ok": True, "text": "héllo"}
+
+    def test_decodes_raw_content_with_fast_loader(self, monkeypatch):
+        """Test that the optional fast decoder receives the raw body bytes."""
+        import json
+
+        from yap_on_slack import post_messages
+
+        seen = []
+
+        def fake_loads(content):
+            seen.append(content)
+            return json.loads(content)
+
+        monkeypatch.setattr(post_messages, "_orjson_loads", fake_loads)
+        response = httpx.Response(200, json={"ok": True})
+
+        assert post_messages._response_json(response) == {"ok": True}
+        assert isinstance(seen[0], bytes)
+
+    def test_json_loads_uses_fast_loader_when_available(self, monkeypatch):
+        """Test that embedded JSON text goes through the optional fast decoder."""
+        import json
+
+        from yap_on_slack import post_messages
+
+        seen = []
+
+        def fake_loads(content):
+            seen.append(content)
+            return json.loads(content)
+
+        monkeypatch.setattr(post_messages, "_orjson_loads", fake_loads)
+        assert post_messages._json_loads('{"messages": []}') == {"messages": []}
+        assert seen == ['{"messages": []}']
+
+        monkeypatch.setattr(post_messages, "_orjson_loads", None)
+        with pytest.raises(json.JSONDecodeError):
+            post_messages._json_loads("not json")
+
+    def test_json_dumps_is_compact_with_and_without_fast_encoder(self, monkeypatch):
+        """Test that block JSON is encoded without whitespace either way."""
+        import json
+
+        from yap_on_slack import post_messages
+
+        value = [{"type": "text", "text": "hi"}]
+        monkeypatch.setattr(post_messages, "_orjson_dumps", lambda v: json.dumps(v).encode())
+        assert json.loads(post_messages._json_dumps(value)) == value
+
+        monkeypatch.setattr(post_messages, "_orjson_dumps", None)
+        assert post_messages._json_dumps(value) == '[{"type":"text","text":"hi"}]'
+
+    def test_json_dumps_pretty_matches_stdlib_layout(self, monkeypatch):
+        """Test that debug JSON is indented with sorted keys either way."""
+        import json
+
+        from yap_on_slack import post_messages
+
+        value = {"b": 1, "a": {"d": None, "c": [True]}}
+        expected = json.dumps(value, indent=2, sort_keys=True)
+        assert post_messages._json_dumps_pretty(value) == expected
+
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(post_messages, "_orjson_dumps", orjson.dumps)
+        assert post_messages._json_dumps_pretty(value) == expected
+
+    def test_real_orjson_decodes_and_encodes(self, monkeypatch):
+        """Test the orjson path end to end when the optional package is installed."""
+        import json
+
+        from yap_on_slack import post_messages
+
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(post_messages, "_orjson_loads", orjson.loads)
+        monkeypatch.setattr(post_messages, "_orjson_dumps", orjson.dumps)
+
+        response = httpx.Response(200, json={"ok": True, "text": "héllo"})
+        assert post_messages._response_json(response) == {"ok": True, "text": "héllo"}
+        assert post_messages._json_loads('{"messages": []}') == {"messages": []}
+        assert json.loads(post_messages._json_dumps({"a": [1]})) == {"a": [1]}
+
+    @patch("yap_on_slack.post_messages.httpx.Client.post")
+    def test_json_body_encoded_with_fast_encoder(self, mock_post, monkeypatch):
+        """Test that JSON request bodies are pre-encoded when orjson is available."""
+        import json
+
+        from yap_on_slack import post_messages
+
+        monkeypatch.setattr(post_messages, "_orjson_dumps", lambda v: json.dumps(v).encode())
+        post_messages._http_post("https://slack.com/api/x", json_data={"a": 1})
+
+        kwargs = mock_post.call_args.kwargs
+        assert json.loads(kwargs["content"]) == {"a": 1}
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert "json" not in kwargs
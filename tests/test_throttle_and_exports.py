@@ -46,6 +46,21 @@ class TestApplyThrottle:
         # Should respect max_wait_time
         assert elapsed < 0.15  # With some tolerance
 
+    def test_throttle_counts_elapsed_time(self):
+        """Test that time since started_at is deducted from the delay."""
+        with patch("time.sleep") as mock_sleep:
+            apply_throttle(1.0, randomize=False, started_at=time.monotonic() - 0.4)
+
+        mock_sleep.assert_called_once()
+        assert 0.5 <= mock_sleep.call_args[0][0] <= 0.6
+
+    def test_throttle_skipped_when_elapsed_exceeds_delay(self):
+        """Test that no sleep happens when the work already took longer than the delay."""
+        with patch("time.sleep") as mock_sleep:
+            apply_throttle(1.0, randomize=False, started_at=time.monotonic() - 2.0)
+
+        mock_sleep.assert_not_called()
+
     def test_throttle_minimum_wait(self):
         """Test that minimum wait time is enforced."""
         start = time.time()
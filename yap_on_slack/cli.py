@@ -8,9 +8,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.prompt import Prompt
-from rich.table import Table
 
 from yap_on_slack import __version__, get_git_commit
 
@@ -103,6 +100,9 @@ def cmd_run(args: argparse.Namespace) -> int:
     """Run the message posting."""
     import os
 
+    from rich.prompt import Prompt
+    from rich.table import Table
+
     # Import here to avoid circular imports and speed up --help
     from yap_on_slack.post_messages import main as post_messages_main
 
@@ -385,6 +385,10 @@ def cmd_show_schema(args: argparse.Namespace) -> int:
 
 def cmd_scan(args: argparse.Namespace) -> int:
     """Scan a Slack channel and generate system prompts."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+    from rich.prompt import Prompt
+    from rich.table import Table
+
     from yap_on_slack.post_messages import (
         SlackAPIError,
         SlackNetworkError,
@@ -2,6 +2,14 @@
 """Post realistic support messages to Slack using session tokens."""
 
 import argparse
+import atexit
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import importlib
+import importlib.util
+import itertools
 import json
 import logging
 import os
@@ -9,27 +17,30 @@ import random
 import re
 import ssl
 import subprocess
+import threading
 import time
 import uuid
+from collections import Counter
+from collections.abc import Callable, Iterator
 from datetime import datetime, timedelta
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
-from typing import Any, Literal
-from urllib.parse import unquote, urlparse
+from typing import IO, Any, Literal
+from urllib.parse import unquote, urlencode, urlparse
 
 import httpx
-import yaml
 from dotenv import dotenv_values
-from pydantic import BaseModel, ValidationError, field_validator
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, ValidationError, field_validator
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 from tenacity import (
+    RetryCallState,
     RetryError,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_exponential_jitter,
 )
 
 console = Console()
@@ -52,29 +63,176 @@ _SSL_CONTEXT: bool | ssl.SSLContext = True  # Default: verify SSL
 # Default HTTP headers for Slack API requests
 _DEFAULT_HEADERS = {"user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"}
 
+# Shared HTTP client so requests reuse pooled keep-alive connections instead of
+# paying a TCP+TLS handshake each time. Created lazily by _get_http_client().
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+# httpx drops idle connections after 5s by default, which is shorter than a long
+# --delay between messages; keep them around so paced posts still reuse them.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+# HTTP/2 multiplexes concurrent requests to the same host over one TLS connection.
+# httpx only supports it when the optional h2 package (httpx[http2]) is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    The client's cookie jar never stores cookies: Slack session cookies differ
+    per user, so they are sent explicitly with each request instead.
+
+    Returns:
+        Shared httpx.Client configured with the current SSL context
+    """
+    global _HTTP_CLIENT
+    client = _HTTP_CLIENT
+    if client is None:
+        with _HTTP_CLIENT_LOCK:
+            client = _HTTP_CLIENT
+            if client is None:
+                cookie_jar = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+                client = httpx.Client(
+                    verify=_SSL_CONTEXT,
+                    cookies=cookie_jar,
+                    limits=_HTTP_LIMITS,
+                    http2=_HTTP2_AVAILABLE,
+                )
+                _HTTP_CLIENT = client
+    return client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        client, _HTTP_CLIENT = _HTTP_CLIENT, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_http_client)
+
+# Shared worker pool for concurrent Slack requests (reply fetching, reactions).
+# Kept for the life of the process so threads aren't spawned and reaped per batch.
+_EXECUTOR: concurrent.futures.ThreadPoolExecutor | None = None
+_EXECUTOR_MAX_WORKERS = 10
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _EXECUTOR
+    executor = _EXECUTOR
+    if executor is None:
+        with _EXECUTOR_LOCK:
+            executor = _EXECUTOR
+            if executor is None:
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_EXECUTOR_MAX_WORKERS, thread_name_prefix="yap-on-slack"
+                )
+                _EXECUTOR = executor
+    return executor
+
+
+# orjson decodes large Slack payloads several times faster than the stdlib parser.
+# It is optional; without it responses are decoded by httpx as before.
+try:
+    _orjson = importlib.import_module("orjson")
+    _orjson_loads: Callable[[bytes | str], Any] | None = _orjson.loads
+    _orjson_dumps: Callable[..., bytes] | None = _orjson.dumps
+    _ORJSON_PRETTY: int = _orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS
+except ImportError:
+    _orjson_loads = None
+    _orjson_dumps = None
+    _ORJSON_PRETTY = 0
+
+
+def _response_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Decode errors are raised as json.JSONDecodeError (orjson's error subclasses it).
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        Decoded JSON value
+    """
+    if _orjson_loads is None:
+        return response.json()
+    return _orjson_loads(response.content)
+
+
+def _json_loads(data: str) -> Any:
+    """Decode a JSON document, using orjson when it is installed.
+
+    Used for JSON embedded in API responses (e.g. model output), which would
+    otherwise be parsed by the slower stdlib decoder after the envelope.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if _orjson_loads is None:
+        return json.loads(data)
+    return _orjson_loads(data)
+
+
+def _json_dumps(value: Any) -> str:
+    """Encode a value as compact JSON, using orjson when it is installed.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON text without insignificant whitespace
+    """
+    if _orjson_dumps is None:
+        return json.dumps(value, separators=(",", ":"))
+    return _orjson_dumps(value).decode()
+
+
+def _json_dumps_pretty(value: Any) -> str:
+    """Encode a value as indented JSON with sorted keys, for display.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON text indented by two spaces
+    """
+    if _orjson_dumps is None:
+        return json.dumps(value, indent=2, sort_keys=True)
+    return _orjson_dumps(value, option=_ORJSON_PRETTY).decode()
+
 
 def _http_get(
     url: str,
     *,
     headers: dict[str, str] | None = None,
     params: dict[str, Any] | None = None,
-    timeout: int = 10,
+    timeout: float | httpx.Timeout = 10,
 ) -> httpx.Response:
     """Make an HTTP GET request with SSL context.
 
     All HTTP GET requests should use this helper to ensure consistent
-    SSL context handling across the codebase.
+    SSL context handling and connection reuse across the codebase.
 
     Args:
         url: The URL to request
         headers: Optional request headers
         params: Optional query parameters
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (or an httpx.Timeout)
 
     Returns:
         httpx.Response object
     """
-    return httpx.get(url, headers=headers, params=params, timeout=timeout, verify=_SSL_CONTEXT)
+    return _get_http_client().get(url, headers=headers, params=params, timeout=timeout)
 
 
 def _http_post(
@@ -84,12 +242,12 @@ def _http_post(
     json_data: dict[str, Any] | None = None,
     headers: dict[str, str] | None = None,
     cookies: dict[str, str] | None = None,
-    timeout: int = 10,
+    timeout: float | httpx.Timeout = 10,
 ) -> httpx.Response:
     """Make an HTTP POST request with SSL context.
 
     All HTTP POST requests should use this helper to ensure consistent
-    SSL context handling across the codebase.
+    SSL context handling and connection reuse across the codebase.
 
     Args:
         url: The URL to request
@@ -97,19 +255,31 @@ def _http_post(
         json_data: Optional JSON body
         headers: Optional request headers
         cookies: Optional cookies
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (or an httpx.Timeout)
 
     Returns:
         httpx.Response object
     """
-    return httpx.post(
+    if cookies:
+        # Sent as a header rather than stored on the shared client, which serves every user
+        headers = dict(headers or {})
+        headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in cookies.items())
+    if json_data is not None and _orjson_dumps is not None:
+        # orjson produces the bytes body directly; httpx would encode via the stdlib
+        headers = {**(headers or {}), "Content-Type": "application/json"}
+        return _get_http_client().post(
+            url,
+            data=data,
+            content=_orjson_dumps(json_data),
+            headers=headers,
+            timeout=timeout,
+        )
+    return _get_http_client().post(
         url,
         data=data,
         json=json_data,
         headers=headers,
-        cookies=cookies,
         timeout=timeout,
-        verify=_SSL_CONTEXT,
     )
 
 
@@ -138,6 +308,7 @@ def apply_throttle(
     randomize: bool = True,
     randomization_range: float = 0.5,
     max_wait_time: float = 60.0,
+    started_at: float | None = None,
 ) -> None:
     """Apply intelligent throttling with optional randomization.
 
@@ -149,10 +320,14 @@ def apply_throttle(
         randomize: Whether to add randomization (default: True)
         randomization_range: Range for random deviation (default: ±0.5s)
         max_wait_time: Maximum total wait time (timeout at 60s, default)
+        started_at: Optional time.monotonic() timestamp the delay is measured from.
+            Time already elapsed since then counts towards the delay, so slow
+            requests aren't followed by a full extra wait.
 
     Example:
         >>> apply_throttle(1.5)  # Sleep 1.5s ± 0.5s (varies each call)
         >>> apply_throttle(2.0, randomize=False)  # Sleep exactly 2.0s
+        >>> apply_throttle(1.5, started_at=batch_start)  # Pace batches ~1.5s apart
     """
     if randomize:
         # Add random variation: base ± randomization_range
@@ -162,7 +337,12 @@ def apply_throttle(
         # Enforce minimum even without randomization
         actual_wait = max(0.1, min(base_throttle, max_wait_time))
 
-    logger.debug(f"Throttling for {actual_wait:.2f}s")
+    if started_at is not None:
+        actual_wait -= time.monotonic() - started_at
+        if actual_wait <= 0:
+            return
+
+    logger.debug("Throttling for %.2fs", actual_wait)
     time.sleep(actual_wait)
 
 
@@ -173,9 +353,15 @@ class SlackAPIError(Exception):
 
 
 class SlackRateLimitError(SlackAPIError):
-    """Raised when Slack API rate limit is hit."""
+    """Raised when Slack API rate limit is hit.
 
-    pass
+    Attributes:
+        retry_after: Seconds Slack asked us to wait (Retry-After header), if sent
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class SlackNetworkError(SlackAPIError):
@@ -190,6 +376,32 @@ class InvalidMessageFormatError(Exception):
     pass
 
 
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Return the Retry-After header in seconds, or None if missing or malformed."""
+    retry_after = response.headers.get("Retry-After")
+    try:
+        return float(retry_after) if retry_after is not None else None
+    except ValueError:
+        return None
+
+
+# Network failures back off exponentially. Rate limits honour Retry-After (capped),
+# or back off with jitter when Slack doesn't say how long to wait.
+_NETWORK_RETRY_WAIT = wait_exponential(multiplier=1, min=2, max=30)
+_RATE_LIMIT_RETRY_WAIT = wait_exponential_jitter(initial=1, max=30, jitter=0.5)
+_RETRY_AFTER_MAX = 60.0
+
+
+def _slack_retry_wait(retry_state: RetryCallState) -> float:
+    """Tenacity wait strategy for Slack calls that retry on rate limits."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, SlackRateLimitError):
+        if exc.retry_after is not None:
+            return min(exc.retry_after, _RETRY_AFTER_MAX)
+        return _RATE_LIMIT_RETRY_WAIT(retry_state)
+    return _NETWORK_RETRY_WAIT(retry_state)
+
+
 def _print_auth_debug(
     *,
     endpoint: str,
@@ -203,6 +415,7 @@ def _print_auth_debug(
 
     Intentionally does not print any token/cookie values.
     """
+    from rich.panel import Panel
 
     org_url = config.get("SLACK_ORG_URL", "")
     parsed = urlparse(org_url)
@@ -231,6 +444,8 @@ def _print_auth_debug(
 
     if response is not None:
         diagnostics["http_status"] = response.status_code
+        # Shows whether the pooled client negotiated HTTP/2
+        diagnostics["http_version"] = response.http_version
         # Helpful headers (safe to print)
         for header_key in ("x-slack-req-id", "x-slack-backend", "retry-after"):
             if header_key in response.headers:
@@ -246,7 +461,7 @@ def _print_auth_debug(
 
     console.print(
         Panel.fit(
-            json.dumps(diagnostics, indent=2, sort_keys=True),
+            _json_dumps_pretty(diagnostics),
             title="[bold]Auth Debug[/bold]",
             border_style="magenta",
         )
@@ -454,32 +669,41 @@ class Message(BaseModel):
 
     @field_validator("replies", mode="before")
     @classmethod
-    def validate_replies(cls, v: Any) -> list[MessageReply]:
+    def validate_replies(cls, v: Any) -> list[Any]:
         """Validate replies are not empty and normalize their shape.
 
         Accepts either:
         - replies: ["text", ...]
         - replies: [{"text": "...", "user": "alice"}, ...]
+
+        Only string replies are rewritten here; building the MessageReply models is
+        left to pydantic-core rather than constructing each one from Python.
         """
         if v is None:
             return []
         if not isinstance(v, list):
             raise ValueError("Replies must be a list")
 
-        replies: list[MessageReply] = []
+        replies: list[Any] = []
         for reply in v:
             if isinstance(reply, str):
-                replies.append(MessageReply(text=reply))
-            elif isinstance(reply, dict):
-                replies.append(MessageReply(**reply))
+                replies.append({"text": reply})
+            elif isinstance(reply, dict | MessageReply):
+                replies.append(reply)
             else:
                 raise ValueError("Reply must be a string or object")
         return replies
 
 
+# Validates a whole messages file in one pass, parsing JSON directly in pydantic-core
+_MESSAGES_ADAPTER: TypeAdapter[list[Message]] = TypeAdapter(list[Message])
+
+
 class SlackUser(BaseModel):
     """A Slack user session (xoxc/xoxd) or bot token used to post messages."""
 
+    model_config = {"frozen": True}
+
     name: str
     SLACK_XOXC_TOKEN: str | None = None
     SLACK_XOXD_TOKEN: str | None = None
@@ -512,6 +736,8 @@ class SlackUser(BaseModel):
 class SlackWorkspace(BaseModel):
     """Shared workspace config (org/channel/team)."""
 
+    model_config = {"frozen": True}
+
     SLACK_ORG_URL: str
     SLACK_CHANNEL_ID: str
     SLACK_TEAM_ID: str
@@ -543,11 +769,15 @@ class AppConfig(BaseModel):
     strategy: Literal["round_robin", "random"] = "round_robin"
     ssl: SSLConfigModel = SSLConfigModel()  # Default: SSL verification enabled
 
-    def _user_index_by_name(self, name: str) -> int | None:
+    # First index of each user name, so per-message lookups don't scan the list
+    _name_index: dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
         for idx, user in enumerate(self.users):
-            if user.name == name:
-                return idx
-        return None
+            self._name_index.setdefault(user.name, idx)
+
+    def _user_index_by_name(self, name: str) -> int | None:
+        return self._name_index.get(name)
 
     def select_user(self, *, name: str | None, message_index: int) -> SlackUser:
         """Select a user for a message.
@@ -612,15 +842,36 @@ def _parse_cookie_header(cookie_header: str) -> dict[str, str]:
 
 
 def _build_slack_cookies(config: dict[str, str]) -> dict[str, str]:
+    # The result is cached per cookie/token pair and shared between callers,
+    # so it must be treated as read-only
+    return _slack_cookies(config.get("SLACK_COOKIES"), config.get("SLACK_XOXD_TOKEN"))
+
+
+def _build_session_headers(config: dict[str, str]) -> dict[str, str]:
+    """Return the default headers plus the Cookie header for session-token requests.
+
+    Built once per cookie/token pair rather than on every request; the result is
+    shared between callers, so it must be treated as read-only.
+    """
+    return _session_headers(config.get("SLACK_COOKIES"), config.get("SLACK_XOXD_TOKEN"))
+
+
+@functools.lru_cache(maxsize=16)
+def _session_headers(extra: str | None, xoxd_token: str | None) -> dict[str, str]:
+    cookies = _slack_cookies(extra, xoxd_token)
+    cookie_header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+    return {**_DEFAULT_HEADERS, "Cookie": cookie_header}
+
+
+@functools.lru_cache(maxsize=16)
+def _slack_cookies(extra: str | None, xoxd_token: str | None) -> dict[str, str]:
     # Start with any additional cookies provided (e.g., x, d-s, b, etc.)
     cookies: dict[str, str] = {}
-    extra = config.get("SLACK_COOKIES")
     if extra:
         cookies.update(_parse_cookie_header(extra))
 
     # Always set/override the auth cookie `d` from SLACK_XOXD_TOKEN.
     # Use the token directly - do not URL-decode as Slack expects the original value
-    xoxd_token = config.get("SLACK_XOXD_TOKEN")
     if xoxd_token:
         cookies["d"] = xoxd_token
     return cookies
@@ -658,6 +909,24 @@ def _build_auth_headers(config: dict[str, str]) -> dict[str, str]:
     return headers
 
 
+def _build_bot_json_headers(config: dict[str, str]) -> dict[str, str]:
+    """Return the headers for a bot-token Web API call with a JSON body.
+
+    Built once per token rather than on every post or reaction; the result is
+    shared between callers, so it must be treated as read-only.
+    """
+    return _bot_json_headers(config["SLACK_BOT_TOKEN"])
+
+
+@functools.lru_cache(maxsize=16)
+def _bot_json_headers(bot_token: str) -> dict[str, str]:
+    return {
+        **_DEFAULT_HEADERS,
+        "Authorization": f"Bearer {bot_token}",
+        "Content-Type": "application/json",
+    }
+
+
 def create_ssl_context(ssl_config: SSLConfigModel | None = None) -> bool | ssl.SSLContext:
     """Create SSL context based on configuration.
 
@@ -720,13 +989,13 @@ def create_ssl_context(ssl_config: SSLConfigModel | None = None) -> bool | ssl.S
             env_value = os.getenv(env_var)
             if env_value and Path(env_value).exists():
                 ca_bundle_path = env_value
-                logger.debug(f"Using CA bundle from {env_var}: {ca_bundle_path}")
+                logger.debug("Using CA bundle from %s: %s", env_var, ca_bundle_path)
                 break
 
     # Check for CA directory from environment
     ca_cert_dir = os.getenv("SSL_CERT_DIR")
     if ca_cert_dir and Path(ca_cert_dir).is_dir():
-        logger.debug(f"Using CA cert directory from SSL_CERT_DIR: {ca_cert_dir}")
+        logger.debug("Using CA cert directory from SSL_CERT_DIR: %s", ca_cert_dir)
 
     # If we need a custom CA bundle/dir or no_strict mode, create custom context
     if ca_bundle_path or ca_cert_dir or ssl_config.no_strict:
@@ -746,7 +1015,7 @@ def create_ssl_context(ssl_config: SSLConfigModel | None = None) -> bool | ssl.S
         if ca_cert_dir:
             try:
                 context.load_verify_locations(capath=ca_cert_dir)
-                logger.debug(f"Loaded CA certificates from directory: {ca_cert_dir}")
+                logger.debug("Loaded CA certificates from directory: %s", ca_cert_dir)
             except Exception as e:
                 logger.warning(f"Failed to load CA directory {ca_cert_dir}: {e}")
 
@@ -793,14 +1062,16 @@ def set_ssl_context(ssl_context: bool | ssl.SSLContext) -> None:
     """Set the global SSL context for all HTTP requests.
 
     This function updates the module-level _SSL_CONTEXT variable that is used
-    by all httpx calls throughout the module.
+    by all httpx calls throughout the module, and resets the shared client.
 
     Args:
         ssl_context: SSL context to use (bool or ssl.SSLContext)
     """
     global _SSL_CONTEXT
     _SSL_CONTEXT = ssl_context
-    logger.debug(f"SSL context set to: {type(ssl_context).__name__}")
+    # The shared client binds its SSL context at creation, so rebuild it on next use
+    close_http_client()
+    logger.debug("SSL context set to: %s", type(ssl_context).__name__)
 
 
 def discover_config_file(explicit_path: Path | None = None) -> Path | None:
@@ -820,7 +1091,7 @@ def discover_config_file(explicit_path: Path | None = None) -> Path | None:
     """
     if explicit_path:
         if explicit_path.exists():
-            logger.debug(f"Using explicit config: {explicit_path}")
+            logger.debug("Using explicit config: %s", explicit_path)
             return explicit_path
         else:
             raise ValueError(f"Config file not found: {explicit_path}")
@@ -828,20 +1099,20 @@ def discover_config_file(explicit_path: Path | None = None) -> Path | None:
     # Check CWD for .yos.yaml (highest priority)
     cwd_yos_config = Path.cwd() / ".yos.yaml"
     if cwd_yos_config.exists():
-        logger.debug(f"Found config in CWD: {cwd_yos_config}")
+        logger.debug("Found config in CWD: %s", cwd_yos_config)
         return cwd_yos_config
 
     # Check CWD for config.yaml
     cwd_config = Path.cwd() / "config.yaml"
     if cwd_config.exists():
-        logger.debug(f"Found config in CWD: {cwd_config}")
+        logger.debug("Found config in CWD: %s", cwd_config)
         return cwd_config
 
     # Check ~/.config/yap-on-slack/config.yaml
     home_config_dir = Path.home() / ".config" / "yap-on-slack"
     home_config = home_config_dir / "config.yaml"
     if home_config.exists():
-        logger.debug(f"Found config in home: {home_config}")
+        logger.debug("Found config in home: %s", home_config)
         return home_config
 
     logger.debug(
@@ -850,6 +1121,29 @@ def discover_config_file(explicit_path: Path | None = None) -> Path | None:
     return None
 
 
+def _yaml_load(stream: str | IO[str]) -> Any:
+    """Parse YAML with libyaml's C loader when PyYAML was built with it."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_file(path: Path, mtime_ns: int, size: int) -> Any:
+    with path.open() as f:
+        return _yaml_load(f)
+
+
+def _load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, reusing the parsed result while the file is unchanged.
+
+    The CLI and main() may both load the same config in one process; the cache is
+    keyed on mtime and size so edits are picked up. Returns a copy callers may mutate.
+    """
+    stat = path.stat()
+    return copy.deepcopy(_parse_yaml_file(path, stat.st_mtime_ns, stat.st_size))
+
+
 def load_unified_config(config_path: Path | None = None) -> tuple[AppConfig, dict[str, str]]:
     """Load unified configuration from config.yaml and .env files.
 
@@ -859,6 +1153,47 @@ def load_unified_config(config_path: Path | None = None) -> tuple[AppConfig, dic
     Returns:
         (app_config, env) tuple with merged configuration
     """
+    app_config, env, _ = _load_unified_config(config_path)
+    return app_config, env
+
+
+# OS environment variables that override values from a .env file
+_ENV_OVERRIDE_KEYS = frozenset(
+    {
+        "SLACK_XOXC_TOKEN",
+        "SLACK_XOXD_TOKEN",
+        "SLACK_COOKIES",
+        "SLACK_BOT_TOKEN",
+        "SLACK_ORG_URL",
+        "SLACK_CHANNEL_ID",
+        "SLACK_TEAM_ID",
+        "SLACK_USER_NAME",
+        "OPENROUTER_API_KEY",
+        "GITHUB_TOKEN",
+        "SSL_VERIFY",
+        "SSL_CA_BUNDLE",
+        "SSL_NO_STRICT",
+    }
+)
+
+
+def _read_env_file(path: Path | str) -> dict[str, str]:
+    """Read a .env file, dropping keys that have no value."""
+    return {key: value for key, value in dotenv_values(path).items() if value is not None}
+
+
+def _load_unified_config(
+    config_path: Path | None = None,
+) -> tuple[AppConfig, dict[str, str], UnifiedConfig | None]:
+    """Load unified configuration, also returning the parsed config.yaml model.
+
+    Lets main() read the AI/GitHub sections without parsing the file a second time.
+
+    Returns:
+        (app_config, env, unified_config) tuple; unified_config is None without a config file
+    """
+    import yaml
+
     console.print("[bold blue]━━━ Loading Configuration ━━━[/bold blue]")
 
     # Discover config file
@@ -870,49 +1205,25 @@ def load_unified_config(config_path: Path | None = None) -> tuple[AppConfig, dic
         config_dir = discovered_config.parent
         env_file = config_dir / ".env"
         if env_file.exists():
-            logger.debug(f"Loading .env from {env_file}")
-            raw_env = dotenv_values(env_file)
-            for key, value in raw_env.items():
-                if value is not None:
-                    env[key] = value
+            logger.debug("Loading .env from %s", env_file)
+            env = _read_env_file(env_file)
             console.print(f"[green]✓ Loaded .env from {env_file}[/green]")
     else:
         # Fallback: try .env in CWD
         cwd_env = Path.cwd() / ".env"
         if cwd_env.exists():
-            logger.debug(f"Loading .env from {cwd_env}")
-            raw_env = dotenv_values(cwd_env)
-            for key, value in raw_env.items():
-                if value is not None:
-                    env[key] = value
+            logger.debug("Loading .env from %s", cwd_env)
+            env = _read_env_file(cwd_env)
             console.print(f"[green]✓ Loaded .env from {cwd_env}[/green]")
 
     # Merge with OS environment variables (env vars take precedence)
-    for key in [
-        "SLACK_XOXC_TOKEN",
-        "SLACK_XOXD_TOKEN",
-        "SLACK_COOKIES",
-        "SLACK_BOT_TOKEN",
-        "SLACK_ORG_URL",
-        "SLACK_CHANNEL_ID",
-        "SLACK_TEAM_ID",
-        "SLACK_USER_NAME",
-        "OPENROUTER_API_KEY",
-        "GITHUB_TOKEN",
-        "SSL_VERIFY",
-        "SSL_CA_BUNDLE",
-        "SSL_NO_STRICT",
-    ]:
-        os_value = os.getenv(key)
-        if os_value:
-            env[key] = os_value
+    env.update({key: value for key in _ENV_OVERRIDE_KEYS if (value := os.environ.get(key))})
 
     # Load config.yaml if found
     unified_config: UnifiedConfig | None = None
     if discovered_config:
         try:
-            with discovered_config.open() as f:
-                config_data = yaml.safe_load(f)
+            config_data = _load_yaml_file(discovered_config)
 
             if not isinstance(config_data, dict):
                 raise ValueError("Config file must be a YAML mapping/object")
@@ -1066,7 +1377,7 @@ def load_unified_config(config_path: Path | None = None) -> tuple[AppConfig, dic
         f"[bold green]✓ Configuration ready ({len(users)} user{'s' if len(users) != 1 else ''})[/bold green]\n"
     )
 
-    return app_config, env
+    return app_config, env, unified_config
 
 
 def _assign_users_to_ai_messages(app_config: AppConfig, messages: list[dict[str, Any]]) -> None:
@@ -1076,54 +1387,60 @@ def _assign_users_to_ai_messages(app_config: AppConfig, messages: list[dict[str,
     Also randomizes reply count (0-8) when using AI-generated messages.
     """
 
-    has_multiple_users = len(app_config.users) > 1
+    user_names = [user.name for user in app_config.users]
+    has_multiple_users = len(user_names) > 1
+    use_random = app_config.strategy == "random"
+
+    # Replies round-robin through all users globally, across messages
+    reply_users = itertools.cycle(user_names)
+    # With the random strategy, users are drawn in one batch once all slots are known
+    unassigned: list[dict[str, Any]] = []
 
-    # Track global reply index for round-robin across all messages
-    global_reply_idx = 0
+    # Randomize reply count: pick 0-8 replies from available replies
+    reply_counts = random.choices(range(9), k=len(messages))
 
-    for msg_idx, msg in enumerate(messages):
+    for msg_idx, (msg, max_replies) in enumerate(zip(messages, reply_counts, strict=True)):
         # Assign user if multiple users configured
         if has_multiple_users and msg.get("user") is None:
-            if app_config.strategy == "random":
-                msg["user"] = random.choice(app_config.users).name
+            if use_random:
+                unassigned.append(msg)
             else:
-                msg["user"] = app_config.users[msg_idx % len(app_config.users)].name
+                msg["user"] = user_names[msg_idx % len(user_names)]
 
         replies = msg.get("replies", [])
         if not isinstance(replies, list):
             continue
 
-        # Randomize reply count: pick 0-8 replies from available replies
         # If fewer replies available, use all of them; if more, randomly sample
-        max_replies = random.randint(0, 8)
         if len(replies) > max_replies:
             replies = random.sample(replies, max_replies)
-        # If replies < max_replies, we just use all available replies
 
         normalized_replies: list[dict[str, Any]] = []
         for reply in replies:
             if isinstance(reply, str):
                 reply_obj: dict[str, Any] = {"text": reply}
             elif isinstance(reply, dict):
-                reply_obj = dict(reply)
+                reply_obj = reply
             else:
                 continue
 
-            # Assign user to reply if multiple users configured
+            # Assign user to reply if multiple users configured; copy first so the
+            # caller's reply dict is left as it was
             if has_multiple_users and reply_obj.get("user") is None:
-                if app_config.strategy == "random":
-                    reply_obj["user"] = random.choice(app_config.users).name
+                if reply_obj is reply:
+                    reply_obj = dict(reply)
+                if use_random:
+                    unassigned.append(reply_obj)
                 else:
-                    # Use global reply index to ensure round-robin cycles through all users
-                    reply_obj["user"] = app_config.users[
-                        global_reply_idx % len(app_config.users)
-                    ].name
-                    global_reply_idx += 1
+                    reply_obj["user"] = next(reply_users)
 
             normalized_replies.append(reply_obj)
 
         msg["replies"] = normalized_replies
 
+    for item, name in zip(unassigned, random.choices(user_names, k=len(unassigned)), strict=True):
+        item["user"] = name
+
 
 def load_config(users_path: Path | None = None) -> tuple[AppConfig, dict[str, str]]:
     """Load configuration from .env plus optional multi-user config.
@@ -1131,20 +1448,15 @@ def load_config(users_path: Path | None = None) -> tuple[AppConfig, dict[str, st
     Returns:
         (app_config, raw_env)
     """
+    import yaml
+
     logger.debug("Loading environment configuration from .env file")
     with console.status("[bold blue]Loading environment configuration...", spinner="dots"):
         try:
-            raw_config = dotenv_values(".env")
+            env = _read_env_file(".env")
         except Exception as e:
             logger.error(f"Failed to read .env file: {e}")
             raise ValueError(f"Cannot read .env file: {e}") from e
-        time.sleep(0.2)
-
-    # Convert to non-optional dict
-    env: dict[str, str] = {}
-    for key, value in raw_config.items():
-        if value is not None:
-            env[key] = value
 
     # Workspace vars are always required
     required_workspace_vars = ["SLACK_ORG_URL", "SLACK_CHANNEL_ID", "SLACK_TEAM_ID"]
@@ -1211,15 +1523,15 @@ def load_config(users_path: Path | None = None) -> tuple[AppConfig, dict[str, st
         raw = path.read_text()
 
         if suffix in {".yaml", ".yml"}:
-            payload = yaml.safe_load(raw)
+            payload = _yaml_load(raw)
         elif suffix == ".json":
-            payload = json.loads(raw)
+            payload = _json_loads(raw)
         else:
             # Default to YAML, but fall back to JSON
             try:
-                payload = yaml.safe_load(raw)
+                payload = _yaml_load(raw)
             except Exception:
-                payload = json.loads(raw)
+                payload = _json_loads(raw)
 
         if not isinstance(payload, dict):
             raise ValueError("Users config must be a mapping/object at the top level")
@@ -1228,12 +1540,12 @@ def load_config(users_path: Path | None = None) -> tuple[AppConfig, dict[str, st
     if users_config_yaml or users_config_json or users_file:
         try:
             if users_config_yaml:
-                loaded = yaml.safe_load(users_config_yaml)
+                loaded = _yaml_load(users_config_yaml)
                 if not isinstance(loaded, dict):
                     raise ValueError("SLACK_USERS_YAML must be a YAML mapping/object")
                 users_payload = loaded
             elif users_config_json:
-                users_payload = json.loads(users_config_json)
+                users_payload = _json_loads(users_config_json)
             else:
                 if users_file is None:
                     raise ValueError("SLACK_USERS_FILE was not provided")
@@ -1278,77 +1590,84 @@ def load_config(users_path: Path | None = None) -> tuple[AppConfig, dict[str, st
     return app_config, env
 
 
-def parse_rich_text_from_string(text: str) -> list[dict[str, Any]]:
-    """Parse markdown-like formatting and convert to Slack rich_text elements.
+# Inline markdown-like formatting recognised by parse_rich_text_from_string.
+# Group numbers are referenced directly when building elements.
+_RICH_TEXT_RE = re.compile(
+    r"(\*\*)([^*]+?)\1|"  # **bold**
+    r"(\*)([^\s*][^*]*?[^\s*]|[^\s*])\3(?!\*)|"  # *bold*
+    r"(_)([^_]+?)\5|"  # _italic_
+    r"(~)([^~]+?)\7|"  # ~strikethrough~
+    r"(`)([^`]+?)\9|"  # `code`
+    r"(<(https?://[^|>]+)(?:\|([^>]+))?[^<]*>)|"  # <url|label> or <url>
+    r"(https?://[^\s<>]+)|"  # Raw URLs
+    r"(:([a-z_0-9]+):)|"  # :emoji_name:
+    r"(@(here|channel|everyone))\b|"  # @here, @channel, @everyone (broadcast)
+    r"(@([a-zA-Z0-9_.-]+))"  # @username mentions
+)
 
-    Args:
-        text: Input text with markdown-like formatting
+# Every _RICH_TEXT_RE alternative needs at least one of these characters (URLs
+# contain ':'), so lines without any can skip the full alternation
+_RICH_TEXT_MARKER_RE = re.compile(r"[*_~`<:@]")
 
-    Returns:
-        List of Slack rich_text elements
+# First :emoji_name: in a message, used as its reaction when the AI supplied none
+_EMOJI_RE = re.compile(r":([a-z_0-9]+):")
 
-    Raises:
-        InvalidMessageFormatError: If text format is invalid
-    """
-    if not isinstance(text, str):
-        logger.error(f"Invalid text type: {type(text)}, expected str")
-        raise InvalidMessageFormatError(f"Text must be a string, got {type(text)}")
 
-    if not text.strip():
-        logger.warning("Empty text provided for parsing")
-        return [{"type": "text", "text": " "}]
+def _strip_bullet_prefix(line: str) -> str:
+    """Strip the leading run of whitespace, bullet and dash characters from a line."""
+    content = line.lstrip()
+    while content.startswith(("•", "-")):
+        content = content[1:].lstrip()
+    return content
 
-    logger.debug(f"Parsing message text: {text[:50]}...")
 
-    elements = []
+def _iter_rich_text(text: str) -> Iterator[dict[str, Any]]:
+    """Yield Slack rich_text elements for markdown-like text, line by line.
+
+    Args:
+        text: Input text with markdown-like formatting
+
+    Yields:
+        Slack rich_text elements in order
+    """
     lines = text.split("\n")
+    stripped_lines = [ln.strip() for ln in lines]
+    last_idx = len(lines) - 1
 
     for line_idx, line in enumerate(lines):
-        is_bullet = line.strip().startswith("•") or (
-            line.strip().startswith("-") and len(line.strip()) > 1 and line.strip()[1] == " "
-        )
+        stripped = stripped_lines[line_idx]
+        is_bullet = stripped.startswith(("•", "- "))
 
         if is_bullet:
-            if line_idx > 0 and not lines[line_idx - 1].strip().startswith(("•", "-")):
-                elements.append({"type": "text", "text": "\n"})
-            line_content = re.sub(r"^[\s•-]+", "", line).lstrip()
+            if line_idx > 0 and not stripped_lines[line_idx - 1].startswith(("•", "-")):
+                yield {"type": "text", "text": "\n"}
+            line_content = _strip_bullet_prefix(line)
         else:
             line_content = line
 
-        pattern = re.compile(
-            r"(\*\*)([^*]+?)\1|"  # **bold**
-            r"(\*)([^\s*][^*]*?[^\s*]|[^\s*])\3(?!\*)|"  # *bold*
-            r"(_)([^_]+?)\5|"  # _italic_
-            r"(~)([^~]+?)\7|"  # ~strikethrough~
-            r"(`)([^`]+?)\9|"  # `code`
-            r"(<(https?://[^|>]+)(?:\|([^>]+))?[^<]*>)|"  # <url|label> or <url>
-            r"(https?://[^\s<>]+)|"  # Raw URLs
-            r"(:([a-z_0-9]+):)|"  # :emoji_name:
-            r"(@(here|channel|everyone))\b|"  # @here, @channel, @everyone (broadcast)
-            r"(@([a-zA-Z0-9_.-]+))"  # @username mentions
-        )
-
         pos = 0
-        for match in pattern.finditer(line_content):
+        has_markers = _RICH_TEXT_MARKER_RE.search(line_content) is not None
+        matches = _RICH_TEXT_RE.finditer(line_content) if has_markers else ()
+        for match in matches:
             if match.start() > pos:
                 plain_text = line_content[pos : match.start()]
                 if plain_text:
-                    elements.append({"type": "text", "text": plain_text})
+                    yield {"type": "text", "text": plain_text}
 
             if match.group(2):  # **bold**
-                elements.append({"type": "text", "text": match.group(2), "style": {"bold": True}})  # type: ignore[dict-item]
+                yield {"type": "text", "text": match.group(2), "style": {"bold": True}}
             elif match.group(4):  # *bold*
-                elements.append({"type": "text", "text": match.group(4), "style": {"bold": True}})  # type: ignore[dict-item]
+                yield {"type": "text", "text": match.group(4), "style": {"bold": True}}
             elif match.group(6):  # _italic_
-                elements.append({"type": "text", "text": match.group(6), "style": {"italic": True}})  # type: ignore[dict-item]
+                yield {"type": "text", "text": match.group(6), "style": {"italic": True}}
             elif match.group(8):  # ~strikethrough~
-                elements.append({"type": "text", "text": match.group(8), "style": {"strike": True}})  # type: ignore[dict-item]
+                yield {"type": "text", "text": match.group(8), "style": {"strike": True}}
             elif match.group(10):  # `code`
-                elements.append({"type": "text", "text": match.group(10), "style": {"code": True}})  # type: ignore[dict-item]
+                yield {"type": "text", "text": match.group(10), "style": {"code": True}}
             elif match.group(12):  # <url|label> or <url>
                 url = match.group(12)
                 label = match.group(13) if match.group(13) else url
-                elements.append({"type": "link", "url": url, "text": label})
+                yield {"type": "link", "url": url, "text": label}
             elif match.group(14):  # Raw URL
                 url = match.group(14)
                 # Extract GitHub issue/PR number if available
@@ -1364,37 +1683,88 @@ def parse_rich_text_from_string(text: str) -> list[dict[str, Any]]:
                         label = url.split("/")[-1][:20]
                 else:
                     label = url[:30] + ("..." if len(url) > 30 else "")
-                elements.append({"type": "link", "url": url, "text": label})
+                yield {"type": "link", "url": url, "text": label}
             elif match.group(16):  # :emoji:
                 emoji_name = match.group(16)
-                logger.debug(f"Found emoji: {emoji_name}")
-                elements.append({"type": "emoji", "name": emoji_name})
+                logger.debug("Found emoji: %s", emoji_name)
+                yield {"type": "emoji", "name": emoji_name}
             elif match.group(18):  # @here, @channel, @everyone (broadcast)
                 broadcast_type = match.group(18)
-                logger.debug(f"Found broadcast mention: @{broadcast_type}")
-                elements.append({"type": "broadcast", "range": broadcast_type})
+                logger.debug("Found broadcast mention: @%s", broadcast_type)
+                yield {"type": "broadcast", "range": broadcast_type}
             elif match.group(19):  # @username mentions
                 username = match.group(20)
-                logger.debug(f"Found user mention: @{username}")
+                logger.debug("Found user mention: @%s", username)
                 # Render as highlighted text since we don't have user IDs
-                elements.append({"type": "text", "text": f"@{username}", "style": {"bold": True}})  # type: ignore[dict-item]
+                yield {"type": "text", "text": f"@{username}", "style": {"bold": True}}
 
             pos = match.end()
 
         if pos < len(line_content):
             remaining = line_content[pos:]
             if remaining:
-                elements.append({"type": "text", "text": remaining})
+                yield {"type": "text", "text": remaining}
+
+        if line_idx < last_idx:
+            yield {"type": "text", "text": "\n"}
+
+
+def _coalesce_text_elements(elements: Iterator[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge adjacent text elements that share the same style into one element."""
+    merged: list[dict[str, Any]] = []
+    for element in elements:
+        if merged and element["type"] == "text":
+            prev = merged[-1]
+            if prev["type"] == "text" and prev.get("style") == element.get("style"):
+                prev["text"] += element["text"]
+                continue
+        merged.append(element)
+    return merged
+
+
+def parse_rich_text_from_string(text: str) -> list[dict[str, Any]]:
+    """Parse markdown-like formatting and convert to Slack rich_text elements.
+
+    Args:
+        text: Input text with markdown-like formatting
 
-        if line_idx < len(lines) - 1:
-            elements.append({"type": "text", "text": "\n"})
+    Returns:
+        List of Slack rich_text elements
+
+    Raises:
+        InvalidMessageFormatError: If text format is invalid
+    """
+    if not isinstance(text, str):
+        logger.error(f"Invalid text type: {type(text)}, expected str")
+        raise InvalidMessageFormatError(f"Text must be a string, got {type(text)}")
+
+    if not text.strip():
+        logger.warning("Empty text provided for parsing")
+        return [{"type": "text", "text": " "}]
+
+    logger.debug("Parsing message text: %s...", text[:50])
 
+    elements = _coalesce_text_elements(_iter_rich_text(text))
     return elements if elements else [{"type": "text", "text": text}]
 
 
+def _build_blocks(text: str) -> list[dict[str, Any]]:
+    """Parse message text into the rich_text blocks sent to chat.postMessage.
+
+    Raises:
+        InvalidMessageFormatError: If text format is invalid
+    """
+    elements = parse_rich_text_from_string(text)
+    return [
+        {"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": elements}]}
+    ]
+
+
 @retry(
-    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError, SlackNetworkError)),
-    wait=wait_exponential(multiplier=1, min=2, max=30),
+    retry=retry_if_exception_type(
+        (httpx.TimeoutException, httpx.NetworkError, SlackNetworkError, SlackRateLimitError)
+    ),
+    wait=_slack_retry_wait,
     stop=stop_after_attempt(3),
     reraise=True,
 )
@@ -1414,14 +1784,13 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
         SlackNetworkError: If network connection fails after retries
         SlackRateLimitError: If rate limit is exceeded
     """
-    logger.debug(f"Adding reaction :{emoji}: to message {timestamp}")
+    logger.debug("Adding reaction :%s: to message %s", emoji, timestamp)
 
     use_bot_token = _is_bot_token_auth(config)
 
     if use_bot_token:
         # Bot token: Use standard Web API with JSON payload
-        headers = _build_auth_headers(config)
-        headers["Content-Type"] = "application/json"
+        headers = _build_bot_json_headers(config)
 
         payload = {
             "channel": channel,
@@ -1436,10 +1805,10 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
                 headers=headers,
                 timeout=5,
             )
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = _response_json(response)
 
             if result.get("ok"):
-                logger.debug(f"Successfully added reaction :{emoji}:")
+                logger.debug("Successfully added reaction :%s:", emoji)
                 return True
 
             error = result.get("error", "unknown")
@@ -1448,7 +1817,10 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
             if error == "ratelimited":
                 retry_after = response.headers.get("Retry-After", "60")
                 logger.warning(f"Rate limited on reactions.add, retry after {retry_after}s")
-                raise SlackRateLimitError(f"Rate limited, retry after {retry_after}s")
+                raise SlackRateLimitError(
+                    f"Rate limited, retry after {retry_after}s",
+                    retry_after=_retry_after_seconds(response),
+                )
 
             # Handle invalid emoji
             if error == "invalid_name":
@@ -1457,7 +1829,7 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
 
             # Handle already reacted
             if error == "already_reacted":
-                logger.debug(f"Already reacted with :{emoji}:")
+                logger.debug("Already reacted with :%s:", emoji)
                 return True
 
             logger.warning(f"Failed to add reaction: {error}")
@@ -1484,20 +1856,19 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
             "name": emoji,
         }
 
-        cookies = _build_slack_cookies(config)
+        session_headers = _build_session_headers(config)
 
         try:
             response = _http_post(
                 f"{config['SLACK_ORG_URL']}/api/reactions.add",
                 data=data,
-                cookies=cookies,
-                headers=_DEFAULT_HEADERS,
+                headers=session_headers,
                 timeout=5,
             )
-            session_result: dict[str, Any] = response.json()
+            session_result: dict[str, Any] = _response_json(response)
 
             if session_result.get("ok"):
-                logger.debug(f"Successfully added reaction :{emoji}:")
+                logger.debug("Successfully added reaction :%s:", emoji)
                 return True
 
             error = session_result.get("error", "unknown")
@@ -1515,7 +1886,10 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
             if error == "ratelimited":
                 retry_after = response.headers.get("Retry-After", "60")
                 logger.warning(f"Rate limited on reactions.add, retry after {retry_after}s")
-                raise SlackRateLimitError(f"Rate limited, retry after {retry_after}s")
+                raise SlackRateLimitError(
+                    f"Rate limited, retry after {retry_after}s",
+                    retry_after=_retry_after_seconds(response),
+                )
 
             # Handle invalid emoji
             if error == "invalid_name":
@@ -1524,7 +1898,7 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
 
             # Handle already reacted
             if error == "already_reacted":
-                logger.debug(f"Already reacted with :{emoji}:")
+                logger.debug("Already reacted with :%s:", emoji)
                 return True
 
             logger.warning(f"Failed to add reaction: {error}")
@@ -1548,49 +1922,243 @@ def add_reaction(channel: str, timestamp: str, emoji: str, config: dict[str, str
             return False
 
 
+@functools.lru_cache(maxsize=1)
+def _slack_request_slots() -> threading.BoundedSemaphore:
+    """Return the semaphore capping concurrent reaction requests.
+
+    The cap comes from SLACK_MAX_CONCURRENT_REQUESTS (default 3). Reactions now run
+    alongside message posting, so this keeps the burst against Slack small.
+    """
+    try:
+        slots = int(os.getenv("SLACK_MAX_CONCURRENT_REQUESTS", "3"))
+    except ValueError:
+        slots = 3
+    return threading.BoundedSemaphore(max(1, slots))
+
+
+def _add_reaction_bounded(channel: str, timestamp: str, emoji: str, config: dict[str, str]) -> bool:
+    """Call add_reaction() while holding one of the concurrent request slots."""
+    with _slack_request_slots():
+        return add_reaction(channel, timestamp, emoji, config)
+
+
+def add_reactions(
+    channel: str, timestamp: str, emojis: list[str], config: dict[str, str]
+) -> dict[str, bool]:
+    """Add several reactions to a message concurrently.
+
+    Each emoji is added via add_reaction() on its own worker thread, at most
+    SLACK_MAX_CONCURRENT_REQUESTS at a time, so N reactions cost a few round-trips
+    instead of N. Failures are logged and reported as
+    False rather than raised, so one bad emoji doesn't drop the rest.
+
+    Args:
+        channel: Slack channel ID
+        timestamp: Message timestamp
+        emojis: Emoji names without colons (duplicates are ignored)
+        config: Configuration dictionary
+
+    Returns:
+        Mapping of emoji name to whether the reaction was added
+    """
+    unique_emojis = list(dict.fromkeys(e for e in emojis if e))
+    results: dict[str, bool] = {}
+    if not unique_emojis:
+        return results
+
+    # SLACK_MAX_CONCURRENT_REQUESTS bounds concurrency, so a long AI-generated list
+    # can't flood the API
+    executor = _get_executor()
+    futures = {
+        executor.submit(_add_reaction_bounded, channel, timestamp, emoji, config): emoji
+        for emoji in unique_emojis
+    }
+    for future in concurrent.futures.as_completed(futures):
+        emoji = futures[future]
+        try:
+            results[emoji] = future.result()
+        except (SlackNetworkError, RetryError) as e:
+            logger.warning(f"Failed to add reaction :{emoji}: after retries: {e}")
+            results[emoji] = False
+        except SlackRateLimitError as e:
+            logger.warning(f"Rate limited adding reaction :{emoji}: {e}")
+            results[emoji] = False
+
+    return results
+
+
 # =============================================================================
 # Channel Scanning API Functions
 # =============================================================================
 
+# Default lifetime of the on-disk conversations.list cache (seconds)
+_CHANNELS_CACHE_TTL_DEFAULT = 600
 
-@retry(
-    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError, SlackNetworkError)),
-    wait=wait_exponential(multiplier=1, min=2, max=30),
-    stop=stop_after_attempt(3),
-    reraise=True,
-)
-def list_channels(
-    config: dict[str, str],
-    types: str = "public_channel,private_channel",
-) -> list[dict[str, Any]]:
-    """List accessible Slack channels.
 
-    Args:
-        config: Configuration dictionary with Slack credentials
-        types: Channel types to list (comma-separated)
+def _cache_dir() -> Path:
+    """Return the directory used for on-disk caches (honours XDG_CACHE_HOME)."""
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "yap-on-slack"
 
-    Returns:
-        List of channel dicts with id, name, num_members, is_private
 
-    Raises:
-        SlackNetworkError: If network connection fails after retries
-        SlackRateLimitError: If rate limit is exceeded
-        SlackAPIError: If Slack API returns an error
+def _write_cache_file(path: Path, payload: Any) -> None:
+    """Atomically write a JSON cache file, ignoring filesystem errors.
+
+    Cached responses can include private repository and workspace data, so the
+    directory is created owner-only (0700) and the file is written as 0600.
     """
-    logger.debug(f"Listing channels (types: {types})")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(payload))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Could not write cache file %s: %s", path, e)
+
+
+def _channels_cache_ttl() -> float:
+    """Return the channel list cache TTL from SLACK_CHANNELS_CACHE_TTL (0 disables)."""
+    raw = os.getenv("SLACK_CHANNELS_CACHE_TTL")
+    if not raw:
+        return _CHANNELS_CACHE_TTL_DEFAULT
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        logger.warning(f"Invalid SLACK_CHANNELS_CACHE_TTL '{raw}', using default")
+        return _CHANNELS_CACHE_TTL_DEFAULT
 
-    all_channels: list[dict[str, Any]] = []
-    cursor: str | None = None
 
-    use_bot_token = _is_bot_token_auth(config)
+def _credentials_cache_key(config: dict[str, str]) -> str:
+    """Return a cache key for a workspace and credential.
 
-    while True:
-        if use_bot_token:
-            # Bot token: Use standard Web API
-            headers = _build_auth_headers(config)
-            params: dict[str, Any] = {
-                "types": types,
-                "exclude_archived": "true",
+    The key is hashed so tokens are never written to disk in the clear.
+    """
+    token = config.get("SLACK_BOT_TOKEN") or config.get("SLACK_XOXC_TOKEN", "")
+    key = f"{config.get('SLACK_ORG_URL', '')}\0{token}"
+    return hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _channels_cache_dir(config: dict[str, str]) -> Path:
+    """Return the channel cache directory for a workspace and credential."""
+    return _cache_dir() / "channels" / _credentials_cache_key(config)
+
+
+def _replies_cache_path(config: dict[str, str], channel_id: str) -> Path:
+    """Return the thread replies cache file for a channel."""
+    return _cache_dir() / "replies" / _credentials_cache_key(config) / f"{channel_id}.json"
+
+
+def _channels_cache_path(config: dict[str, str], types: str) -> Path:
+    """Return the cache file for a channel list request."""
+    return _channels_cache_dir(config) / f"{types.replace(',', '+')}.json"
+
+
+def invalidate_channels_cache(config: dict[str, str]) -> None:
+    """Remove cached channel lists for the given credentials.
+
+    Call this when credentials change or are rejected so the next
+    list_channels() call goes back to Slack.
+
+    Args:
+        config: Configuration dictionary with Slack credentials
+    """
+    cache_dir = _channels_cache_dir(config)
+    if not cache_dir.is_dir():
+        return
+    for cache_file in cache_dir.glob("*.json"):
+        cache_file.unlink(missing_ok=True)
+    logger.debug("Invalidated cached channel list")
+
+
+# Default number of conversations.replies requests issued concurrently
+_REPLIES_BATCH_SIZE_DEFAULT = 10
+# Rate-limited reply batches tolerated before giving up on the remaining threads
+_REPLIES_MAX_RATE_LIMITS = 5
+# Message subtypes kept when scanning history (None/"" is a regular user message)
+_ALLOWED_SUBTYPES = frozenset({None, "", "bot_message", "file_share"})
+
+
+def _replies_batch_size() -> int:
+    """Return the reply fetch batch size from SLACK_REPLIES_BATCH_SIZE.
+
+    Replies are fetched on the shared worker pool, so the size is capped at its
+    _EXECUTOR_MAX_WORKERS threads.
+    """
+    raw = os.getenv("SLACK_REPLIES_BATCH_SIZE")
+    if not raw:
+        return _REPLIES_BATCH_SIZE_DEFAULT
+    try:
+        size = max(1, int(raw))
+    except ValueError:
+        logger.warning(f"Invalid SLACK_REPLIES_BATCH_SIZE '{raw}', using default")
+        return _REPLIES_BATCH_SIZE_DEFAULT
+    if size > _EXECUTOR_MAX_WORKERS:
+        logger.warning(
+            f"SLACK_REPLIES_BATCH_SIZE {size} exceeds the {_EXECUTOR_MAX_WORKERS} worker "
+            f"threads, using {_EXECUTOR_MAX_WORKERS}"
+        )
+        return _EXECUTOR_MAX_WORKERS
+    return size
+
+
+@retry(
+    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError, SlackNetworkError)),
+    wait=wait_exponential(multiplier=1, min=2, max=30),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+def list_channels(
+    config: dict[str, str],
+    types: str = "public_channel,private_channel",
+    force_refresh: bool = False,
+) -> list[dict[str, Any]]:
+    """List accessible Slack channels.
+
+    Results are cached on disk for SLACK_CHANNELS_CACHE_TTL seconds (default 600,
+    0 disables) so repeated scans don't re-page through conversations.list.
+
+    Args:
+        config: Configuration dictionary with Slack credentials
+        types: Channel types to list (comma-separated)
+        force_refresh: Ignore any cached result and fetch from Slack
+
+    Returns:
+        List of channel dicts with id, name, num_members, is_private
+
+    Raises:
+        SlackNetworkError: If network connection fails after retries
+        SlackRateLimitError: If rate limit is exceeded
+        SlackAPIError: If Slack API returns an error
+    """
+    logger.debug("Listing channels (types: %s)", types)
+
+    cache_ttl = _channels_cache_ttl()
+    cache_path = _channels_cache_path(config, types)
+    if cache_ttl and not force_refresh:
+        try:
+            if time.time() - cache_path.stat().st_mtime < cache_ttl:
+                cached: list[dict[str, Any]] = json.loads(cache_path.read_text())
+                logger.debug("Using cached channel list (%s channels)", len(cached))
+                return cached
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    all_channels: list[dict[str, Any]] = []
+    cursor: str | None = None
+
+    use_bot_token = _is_bot_token_auth(config)
+    headers = _build_auth_headers(config)
+    session_headers = _build_session_headers(config)
+
+    while True:
+        if use_bot_token:
+            # Bot token: Use standard Web API
+            params: dict[str, Any] = {
+                "types": types,
+                "exclude_archived": "true",
                 "limit": 200,
             }
             if cursor:
@@ -1603,7 +2171,7 @@ def list_channels(
                     params=params,
                     timeout=15,
                 )
-                result: dict[str, Any] = response.json()
+                result: dict[str, Any] = _response_json(response)
 
                 if not result.get("ok"):
                     error = result.get("error", "unknown")
@@ -1616,23 +2184,23 @@ def list_channels(
                         raise SlackRateLimitError(f"Rate limited, retry after {retry_after}s")
 
                     if error in ("invalid_auth", "token_revoked", "token_expired", "not_authed"):
+                        invalidate_channels_cache(config)
                         logger.error(f"Authentication error: {error}")
                         raise SlackAPIError(f"Authentication error: {error}")
 
                     logger.error(f"Slack API error: {error}")
                     raise SlackAPIError(f"Slack API error: {error}")
 
-                channels = result.get("channels", [])
-                for ch in channels:
-                    all_channels.append(
-                        {
-                            "id": ch.get("id", ""),
-                            "name": ch.get("name", ""),
-                            "num_members": ch.get("num_members", 0),
-                            "is_private": ch.get("is_private", False),
-                            "topic": ch.get("topic", {}).get("value", ""),
-                        }
-                    )
+                all_channels.extend(
+                    {
+                        "id": ch.get("id", ""),
+                        "name": ch.get("name", ""),
+                        "num_members": ch.get("num_members", 0),
+                        "is_private": ch.get("is_private", False),
+                        "topic": (ch.get("topic") or {}).get("value", ""),
+                    }
+                    for ch in result.get("channels", [])
+                )
 
                 # Check for pagination
                 response_metadata = result.get("response_metadata", {})
@@ -1651,7 +2219,6 @@ def list_channels(
 
         else:
             # Session token: Use webapp API
-            cookies = _build_slack_cookies(config)
             data: dict[str, Any] = {
                 "token": config["SLACK_XOXC_TOKEN"],
                 "types": types,
@@ -1665,11 +2232,10 @@ def list_channels(
                 response = _http_post(
                     f"{config['SLACK_ORG_URL']}/api/conversations.list",
                     data=data,
-                    cookies=cookies,
-                    headers=_DEFAULT_HEADERS,
+                    headers=session_headers,
                     timeout=15,
                 )
-                session_result: dict[str, Any] = response.json()
+                session_result: dict[str, Any] = _response_json(response)
 
                 if not session_result.get("ok"):
                     error = session_result.get("error", "unknown")
@@ -1682,23 +2248,23 @@ def list_channels(
                         raise SlackRateLimitError(f"Rate limited, retry after {retry_after}s")
 
                     if error in ("invalid_auth", "token_revoked", "token_expired"):
+                        invalidate_channels_cache(config)
                         logger.error(f"Authentication error: {error}")
                         raise SlackAPIError(f"Authentication error: {error}")
 
                     logger.error(f"Slack API error: {error}")
                     raise SlackAPIError(f"Slack API error: {error}")
 
-                channels = session_result.get("channels", [])
-                for ch in channels:
-                    all_channels.append(
-                        {
-                            "id": ch.get("id", ""),
-                            "name": ch.get("name", ""),
-                            "num_members": ch.get("num_members", 0),
-                            "is_private": ch.get("is_private", False),
-                            "topic": ch.get("topic", {}).get("value", ""),
-                        }
-                    )
+                all_channels.extend(
+                    {
+                        "id": ch.get("id", ""),
+                        "name": ch.get("name", ""),
+                        "num_members": ch.get("num_members", 0),
+                        "is_private": ch.get("is_private", False),
+                        "topic": (ch.get("topic") or {}).get("value", ""),
+                    }
+                    for ch in session_result.get("channels", [])
+                )
 
                 # Check for pagination
                 response_metadata = session_result.get("response_metadata", {})
@@ -1715,7 +2281,9 @@ def list_channels(
                 logger.error(f"Failed to parse Slack API response: {e}")
                 raise SlackAPIError(f"Invalid JSON response: {e}") from e
 
-    logger.debug(f"Found {len(all_channels)} channels")
+    logger.debug("Found %s channels", len(all_channels))
+    if cache_ttl:
+        _write_cache_file(cache_path, all_channels)
     return all_channels
 
 
@@ -1735,9 +2303,9 @@ def get_channel_info(config: dict[str, str], channel_id: str) -> dict[str, Any]
     Returns:
         Channel info dict or None if not found
     """
-    logger.debug(f"Getting channel info for {channel_id}")
+    logger.debug("Getting channel info for %s", channel_id)
 
-    cookies = _build_slack_cookies(config)
+    session_headers = _build_session_headers(config)
 
     data = {
         "token": config["SLACK_XOXC_TOKEN"],
@@ -1748,11 +2316,10 @@ def get_channel_info(config: dict[str, str], channel_id: str) -> dict[str, Any]
         response = _http_post(
             f"{config['SLACK_ORG_URL']}/api/conversations.info",
             data=data,
-            cookies=cookies,
-            headers=_DEFAULT_HEADERS,
+            headers=session_headers,
             timeout=10,
         )
-        result: dict[str, Any] = response.json()
+        result: dict[str, Any] = _response_json(response)
 
         if not result.get("ok"):
             error = result.get("error", "unknown")
@@ -1784,11 +2351,18 @@ def fetch_channel_messages(
     throttle: float = 1.5,
     throttle_range: float = 0.5,
     progress_callback: Any | None = None,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Fetch messages from a Slack channel with replies and reactions.
 
     Uses concurrent requests for fetching replies to optimize speed.
-    Throttling is applied between batches, not individual requests.
+    Throttling is applied between batches, not individual requests. If Slack
+    rate limits a batch of replies, no further batches are sent until
+    Retry-After has elapsed, and the batch size (SLACK_REPLIES_BATCH_SIZE,
+    default 10) is halved.
+
+    Thread replies are cached on disk per channel, and a thread is only
+    re-fetched when its reply_count differs from the cached copy.
 
     Args:
         config: Configuration dictionary with Slack credentials
@@ -1797,6 +2371,7 @@ def fetch_channel_messages(
         throttle: Delay in seconds between API call batches (default: 1.5s)
         throttle_range: Randomization range for throttle (default: ±0.5s)
         progress_callback: Optional callback(current, total, status) for progress updates
+        use_cache: Reuse cached replies for threads whose reply_count is unchanged
 
     Returns:
         Dict with messages, total_messages, total_replies, total_reactions, top_reactions
@@ -1806,20 +2381,19 @@ def fetch_channel_messages(
         SlackRateLimitError: If rate limit is exceeded
         SlackAPIError: If Slack API returns an error
     """
-    import concurrent.futures
-
-    logger.debug(f"Fetching up to {limit} messages from channel {channel_id}")
+    logger.debug("Fetching up to %s messages from channel %s", limit, channel_id)
 
-    cookies = _build_slack_cookies(config)
+    session_headers = _build_session_headers(config)
 
     all_messages: list[dict[str, Any]] = []
-    reaction_counts: dict[str, int] = {}
+    reaction_counts: Counter[str] = Counter()
     total_replies = 0
     cursor: str | None = None
     messages_fetched = 0
 
     # Phase 1: Fetch message history (sequential with pagination)
     while messages_fetched < limit:
+        page_started = time.monotonic()
         batch_limit = min(100, limit - messages_fetched)
 
         data: dict[str, Any] = {
@@ -1834,11 +2408,10 @@ def fetch_channel_messages(
             response = _http_post(
                 f"{config['SLACK_ORG_URL']}/api/conversations.history",
                 data=data,
-                cookies=cookies,
-                headers=_DEFAULT_HEADERS,
+                headers=session_headers,
                 timeout=15,
             )
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = _response_json(response)
 
             if not result.get("ok"):
                 error = result.get("error", "unknown")
@@ -1859,31 +2432,29 @@ def fetch_channel_messages(
             if not messages:
                 break
 
-            for msg in messages:
-                if msg.get("subtype") and msg.get("subtype") not in ("bot_message", "file_share"):
+            # Slack never returns more than batch_limit, but guard against overshooting
+            for msg in messages[: limit - messages_fetched]:
+                if msg.get("subtype") not in _ALLOWED_SUBTYPES:
                     continue
 
+                reactions = [
+                    {"name": reaction.get("name", ""), "count": reaction.get("count", 0)}
+                    for reaction in msg.get("reactions", [])
+                ]
+                reaction_counts.update({r["name"]: r["count"] for r in reactions})
+
                 message_data: dict[str, Any] = {
                     "text": msg.get("text", ""),
                     "user": msg.get("user", ""),
                     "ts": msg.get("ts", ""),
                     "reply_count": msg.get("reply_count", 0),
-                    "reactions": [],
+                    "reactions": reactions,
                     "replies": [],
                 }
 
-                for reaction in msg.get("reactions", []):
-                    emoji_name = reaction.get("name", "")
-                    count = reaction.get("count", 0)
-                    message_data["reactions"].append({"name": emoji_name, "count": count})
-                    reaction_counts[emoji_name] = reaction_counts.get(emoji_name, 0) + count
-
                 all_messages.append(message_data)
                 messages_fetched += 1
 
-                if messages_fetched >= limit:
-                    break
-
             if progress_callback:
                 progress_callback(messages_fetched, limit, f"Fetched {messages_fetched} messages")
 
@@ -1893,7 +2464,12 @@ def fetch_channel_messages(
                 break
 
             # Only throttle between pagination requests
-            apply_throttle(throttle, randomize=True, randomization_range=throttle_range)
+            apply_throttle(
+                throttle,
+                randomize=True,
+                randomization_range=throttle_range,
+                started_at=page_started,
+            )
 
         except (httpx.TimeoutException, httpx.NetworkError) as e:
             logger.error(f"Network error fetching messages: {e}")
@@ -1908,14 +2484,26 @@ def fetch_channel_messages(
     threaded_messages = [m for m in all_messages if m.get("reply_count", 0) > 0]
 
     if threaded_messages:
-        # Batch size for concurrent requests (Slack allows ~50/min, be conservative)
-        batch_size = 10
-
-        def fetch_single_thread(msg: dict[str, Any]) -> tuple[str, list[dict[str, Any]], int]:
-            """Fetch replies for a single thread. Returns (ts, replies, reaction_count)."""
+        # Batch size for concurrent requests (Slack allows ~50/min, be conservative).
+        # Halved whenever a batch is rate limited.
+        batch_size = _replies_batch_size()
+        rate_limited = threading.Event()
+        retry_after = 0.0
+
+        def fetch_single_thread(
+            msg: dict[str, Any],
+        ) -> tuple[str, list[dict[str, Any]] | None, int]:
+            """Fetch replies for a single thread. Returns (ts, replies, reaction_count).
+
+            Replies are None when the request was rate limited (or skipped because
+            another request in the batch was) and should be retried.
+            """
+            nonlocal retry_after
             thread_ts = msg.get("ts", "")
             if not thread_ts:
                 return thread_ts, [], 0
+            if rate_limited.is_set():
+                return thread_ts, None, 0
 
             try:
                 response = _http_post(
@@ -1926,11 +2514,10 @@ def fetch_channel_messages(
                         "ts": thread_ts,
                         "limit": 100,
                     },
-                    cookies=cookies,
-                    headers=_DEFAULT_HEADERS,
+                    headers=session_headers,
                     timeout=15,
                 )
-                result = response.json()
+                result = _response_json(response)
 
                 if result.get("ok"):
                     replies_raw = result.get("messages", [])[1:]  # Skip parent
@@ -1951,57 +2538,148 @@ def fetch_channel_messages(
                 else:
                     error = result.get("error", "unknown")
                     if error == "ratelimited":
-                        retry_after = response.headers.get("Retry-After", "60")
-                        raise SlackRateLimitError(f"Rate limited, retry after {retry_after}s")
+                        try:
+                            wait = float(response.headers.get("Retry-After", "60"))
+                        except ValueError:
+                            wait = 60.0
+                        retry_after = max(retry_after, wait)
+                        rate_limited.set()
+                        return thread_ts, None, 0
                     return thread_ts, [], 0
 
             except (httpx.TimeoutException, httpx.NetworkError, json.JSONDecodeError) as e:
                 logger.warning(f"Failed to fetch replies for {thread_ts}: {e}")
                 return thread_ts, [], 0
 
-        # Process in batches with throttling between batches
-        ts_to_msg = {m["ts"]: m for m in threaded_messages}
+        # Reuse cached replies for threads that haven't grown since the last scan
+        replies_cache_path = _replies_cache_path(config, channel_id)
+        replies_cache: dict[str, list[Any]] = {}
+        if use_cache:
+            try:
+                loaded = json.loads(replies_cache_path.read_text())
+            except (OSError, json.JSONDecodeError):
+                loaded = None
+            # A cache of the wrong shape is ignored rather than crashing the scan
+            if isinstance(loaded, dict):
+                replies_cache = loaded
+
+        reply_rxn_by_ts: dict[str, int] = {}
+        to_fetch: list[dict[str, Any]] = []
+        for msg in threaded_messages:
+            cached = replies_cache.get(msg["ts"])
+            if (
+                isinstance(cached, list)
+                and len(cached) >= 3
+                and cached[0] == msg["reply_count"]
+                and isinstance(cached[1], list)
+                and isinstance(cached[2], int)
+            ):
+                msg["replies"] = cached[1]
+                reply_rxn_by_ts[msg["ts"]] = cached[2]
+                total_replies += len(cached[1])
+                reaction_counts["_reply_reactions"] += cached[2]
+            else:
+                to_fetch.append(msg)
+
+        if len(to_fetch) < len(threaded_messages):
+            logger.debug(
+                f"Using cached replies for {len(threaded_messages) - len(to_fetch)} threads"
+            )
+
+        # Process in batches with throttling between batches. The shared worker pool
+        # and the shared client's pooled connections are reused for every batch
+        executor = _get_executor()
+        pending = to_fetch
+        fetched_threads = 0
+        batch_num = 0
+        rate_limited_batches = 0
 
-        for batch_start in range(0, len(threaded_messages), batch_size):
-            batch = threaded_messages[batch_start : batch_start + batch_size]
-            batch_num = batch_start // batch_size + 1
-            total_batches = (len(threaded_messages) + batch_size - 1) // batch_size
+        while pending:
+            batch_started = time.monotonic()
+            batch, pending = pending[:batch_size], pending[batch_size:]
+            batch_num += 1
+            total_batches = batch_num + (len(pending) + batch_size - 1) // batch_size
 
             if progress_callback:
                 progress_callback(
-                    batch_start + len(batch),
-                    len(threaded_messages),
+                    fetched_threads + len(batch),
+                    len(to_fetch),
                     f"Fetching replies (batch {batch_num}/{total_batches})",
                 )
 
             # Fetch batch concurrently
-            with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
-                futures = {executor.submit(fetch_single_thread, msg): msg for msg in batch}
+            futures = {executor.submit(fetch_single_thread, msg): msg for msg in batch}
+            retry_batch: list[dict[str, Any]] = []
 
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        thread_ts, replies, reply_rxn_count = future.result()
-                        if thread_ts in ts_to_msg:
-                            ts_to_msg[thread_ts]["replies"] = replies
-                            total_replies += len(replies)
-                            # Add to reaction counts (simplified - just count total)
-                            if reply_rxn_count > 0:
-                                reaction_counts["_reply_reactions"] = (
-                                    reaction_counts.get("_reply_reactions", 0) + reply_rxn_count
-                                )
-                    except SlackRateLimitError:
-                        raise
-                    except Exception as e:
-                        logger.warning(f"Error processing thread: {e}")
+            for future in concurrent.futures.as_completed(futures):
+                # Each future maps straight back to its message, so no ts lookup is needed
+                msg = futures[future]
+                try:
+                    thread_ts, replies, reply_rxn_count = future.result()
+                    if replies is None:
+                        retry_batch.append(msg)
+                        continue
+                    fetched_threads += 1
+                    msg["replies"] = replies
+                    reply_rxn_by_ts[thread_ts] = reply_rxn_count
+                    total_replies += len(replies)
+                    # Add to reaction counts (simplified - just count total)
+                    if reply_rxn_count > 0:
+                        reaction_counts["_reply_reactions"] += reply_rxn_count
+                except Exception as e:
+                    logger.warning(f"Error processing thread: {e}")
+
+            if rate_limited.is_set():
+                rate_limited_batches += 1
+                if rate_limited_batches > _REPLIES_MAX_RATE_LIMITS:
+                    skipped = len(retry_batch) + len(pending)
+                    logger.warning(
+                        f"Still rate limited after {_REPLIES_MAX_RATE_LIMITS} back-offs; "
+                        f"skipping replies for {skipped} threads"
+                    )
+                    break
 
-            # Throttle between batches (not between individual requests)
-            if batch_start + batch_size < len(threaded_messages):
-                apply_throttle(throttle, randomize=True, randomization_range=throttle_range)
+                # Back off before submitting anything else, then retry with smaller batches
+                batch_size = max(1, batch_size // 2)
+                logger.warning(
+                    f"Rate limited fetching replies, waiting {retry_after:.0f}s "
+                    f"(batch size now {batch_size})"
+                )
+                apply_throttle(retry_after, randomize=False)
+                pending = retry_batch + pending
+                rate_limited.clear()
+                retry_after = 0.0
+            elif pending:
+                # Throttle between batch starts (not between individual requests)
+                apply_throttle(
+                    throttle,
+                    randomize=True,
+                    randomization_range=throttle_range,
+                    started_at=batch_started,
+                )
+
+        if progress_callback and to_fetch:
+            progress_callback(
+                fetched_threads, len(to_fetch), f"Fetched replies for {fetched_threads} threads"
+            )
+
+        if use_cache:
+            # Failed fetches come back empty, so only threads with replies are cached
+            _write_cache_file(
+                replies_cache_path,
+                {
+                    m["ts"]: [m["reply_count"], m["replies"], reply_rxn_by_ts.get(m["ts"], 0)]
+                    for m in threaded_messages
+                    if m["replies"]
+                },
+            )
 
     # Sort reactions by count (exclude internal counter)
-    filtered_reactions = {k: v for k, v in reaction_counts.items() if not k.startswith("_")}
-    top_reactions = sorted(filtered_reactions.items(), key=lambda x: x[1], reverse=True)[:10]
-    total_reactions = sum(filtered_reactions.values())
+    filtered_reactions = Counter(
+        {k: v for k, v in reaction_counts.items() if not k.startswith("_")}
+    )
+    top_reactions = filtered_reactions.most_common(10)
+    total_reactions = filtered_reactions.total()
 
     logger.info(
         f"Fetched {len(all_messages)} messages, {total_replies} replies, {total_reactions} reactions"
@@ -2016,6 +2694,31 @@ def fetch_channel_messages(
     }
 
 
+# Patterns used to recover prompts from loosely formatted LLM output
+_PROMPT_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_UNESCAPED_CONTROL_RE = re.compile(r"(?<!\\)[\n\t\r]")
+_CONTROL_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+_PROMPT_NUMBERED_RE = re.compile(
+    r"(?:^|\n)(?:#{1,3}\s*)?(?:Prompt\s*)?[1-3][\.:)]\s*(.+?)"
+    r"(?=(?:\n(?:#{1,3}\s*)?(?:Prompt\s*)?[2-4][\.:)])|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+_PROMPT_SECTION_SPLIT_RE = re.compile(r"\n(?:#{1,3}\s+|(?:\d+[\.\)]\s+))")
+
+
+def _iter_sample_messages(messages: list[dict[str, Any]]) -> Iterator[str]:
+    """Yield prompt-ready summaries of channel messages, skipping very short ones."""
+    for msg in messages:
+        text = msg.get("text", "")
+        if not text or len(text) <= 10:
+            continue
+        reply_texts = [r["text"] for r in msg.get("replies", [])[:3] if r.get("text")]
+        if reply_texts:
+            yield f"Message: {text[:500]}\nReplies: {' | '.join(reply_texts)}"
+        else:
+            yield f"Message: {text[:500]}"
+
+
 def generate_system_prompts(
     channel_data: dict[str, Any],
     model: str = "openrouter/auto",
@@ -2038,19 +2741,10 @@ def generate_system_prompts(
 
     logger.info(f"Generating system prompts with {model}...")
 
-    # Format sample messages for the prompt
-    sample_messages: list[str] = []
-    for msg in channel_data.get("messages", [])[:50]:
-        text = msg.get("text", "")
-        if text and len(text) > 10:  # Skip very short messages
-            replies = msg.get("replies", [])
-            reply_texts = [r.get("text", "") for r in replies[:3] if r.get("text")]
-            if reply_texts:
-                sample_messages.append(
-                    f"Message: {text[:500]}\nReplies: {' | '.join(reply_texts[:3])}"
-                )
-            else:
-                sample_messages.append(f"Message: {text[:500]}")
+    # Format sample messages for the prompt (only the first 30 are used)
+    sample_messages = "\n".join(
+        itertools.islice(_iter_sample_messages(channel_data.get("messages", [])), 30)
+    )
 
     # Format top reactions
     top_reactions_str = ", ".join(
@@ -2120,13 +2814,18 @@ Output format: A JSON array with exactly 3 strings. Each string should contain t
 The following messages represent the communication patterns in this channel:
 
 ---
-{chr(10).join(sample_messages[:30])}
+{sample_messages}
 ---
 
 Based on this data, generate 3 comprehensive system prompt variations as a JSON array of 3 strings. Remember to use \\n for newlines within each prompt string."""
 
     try:
-        with console.status(f"[bold magenta]Generating prompts with {model}...", spinner="dots"):
+        # The request can take up to a minute; a slow spinner avoids needless redraws
+        with console.status(
+            f"[bold magenta]Generating prompts with {model}...",
+            spinner="dots",
+            refresh_per_second=2,
+        ):
             response = _http_post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers={
@@ -2149,7 +2848,7 @@ Based on this data, generate 3 comprehensive system prompt variations as a JSON
         if response.status_code != 200:
             error_body = response.text
             logger.error(f"OpenRouter API error: HTTP {response.status_code}")
-            logger.debug(f"Response: {error_body[:200]}")
+            logger.debug("Response: %s", error_body[:200])
 
             if response.status_code == 401:
                 console.print(
@@ -2159,7 +2858,7 @@ Based on this data, generate 3 comprehensive system prompt variations as a JSON
                 console.print("[bold yellow]OpenRouter rate limit. Try again in 60s[/bold yellow]")
             return None
 
-        result = response.json()
+        result = _response_json(response)
         content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
 
         # Try to parse as JSON array
@@ -2167,7 +2866,7 @@ Based on this data, generate 3 comprehensive system prompt variations as a JSON
             # Handle potential markdown code blocks
             if "```" in content:
                 # Extract JSON from code block
-                json_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
+                json_match = _PROMPT_FENCE_RE.search(content)
                 if json_match:
                     content = json_match.group(1)
 
@@ -2177,14 +2876,12 @@ Based on this data, generate 3 comprehensive system prompt variations as a JSON
 
             # Try strict parsing first
             try:
-                prompts = json.loads(content)
+                prompts = _json_loads(content)
             except json.JSONDecodeError:
                 # Try with control character cleanup
                 # This regex finds strings and escapes unescaped newlines/tabs within them
-                cleaned = re.sub(r"(?<!\\)\n", "\\n", content)
-                cleaned = re.sub(r"(?<!\\)\t", "\\t", cleaned)
-                cleaned = re.sub(r"(?<!\\)\r", "\\r", cleaned)
-                prompts = json.loads(cleaned)
+                cleaned = _UNESCAPED_CONTROL_RE.sub(lambda m: _CONTROL_ESCAPES[m.group()], content)
+                prompts = _json_loads(cleaned)
 
             if isinstance(prompts, list) and len(prompts) >= 3:
                 logger.info(f"Generated {len(prompts)} system prompts")
@@ -2197,12 +2894,11 @@ Based on this data, generate 3 comprehensive system prompt variations as a JSON
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse prompts as JSON: {e}")
-            logger.debug(f"Raw content: {content[:500]}")
+            logger.debug("Raw content: %s", content[:500])
 
             # Fallback: try to extract prompts by pattern matching
             # Look for numbered prompts like "1." or "Prompt 1:" or "## Prompt 1"
-            prompt_pattern = r"(?:^|\n)(?:#{1,3}\s*)?(?:Prompt\s*)?[1-3][\.:)]\s*(.+?)(?=(?:\n(?:#{1,3}\s*)?(?:Prompt\s*)?[2-4][\.:)])|$)"
-            matches = re.findall(prompt_pattern, content, re.DOTALL | re.IGNORECASE)
+            matches = _PROMPT_NUMBERED_RE.findall(content)
 
             if len(matches) >= 3:
                 prompts = [m.strip() for m in matches[:3] if len(m.strip()) > 100]
@@ -2211,7 +2907,7 @@ Based on this data, generate 3 comprehensive system prompt variations as a JSON
                     return prompts
 
             # Second fallback: split by markdown headers or numbered sections
-            sections = re.split(r"\n(?:#{1,3}\s+|(?:\d+[\.\)]\s+))", content)
+            sections = _PROMPT_SECTION_SPLIT_RE.split(content)
             if len(sections) >= 3:
                 prompts = [s.strip() for s in sections if len(s.strip()) > 100][:3]
                 if len(prompts) == 3:
@@ -2233,9 +2929,222 @@ Based on this data, generate 3 comprehensive system prompt variations as a JSON
         return None
 
 
+# GitHub API calls fail fast on connect but allow slower reads; GraphQL batches
+# many repos into one request, so it gets a longer read budget
+_GITHUB_TIMEOUT = httpx.Timeout(10, connect=3)
+_GITHUB_GRAPHQL_TIMEOUT = httpx.Timeout(30, connect=3)
+
+
+def _github_headers(gh_token: str) -> dict[str, str]:
+    """Return the request headers shared by every GitHub API call."""
+    return {
+        "Authorization": f"Bearer {gh_token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+
+# Below this many remaining GitHub requests, only calls that can be answered
+# from the conditional-request cache are made.
+_GITHUB_RATE_LIMIT_FLOOR = 100
+# Last X-RateLimit-Remaining value reported by GitHub (None until first response)
+_github_rate_limit_remaining: int | None = None
+# Authenticated GitHub budget is 5,000 requests/hour (~83/minute)
+_GITHUB_REQUESTS_PER_MINUTE = 83
+# Below this many remaining requests, pace calls to last until the limit resets
+_GITHUB_RATE_LIMIT_PACING = 200
+
+
+class _TokenBucket:
+    """Thread-safe token bucket limiting the request rate across worker threads."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available.
+
+        The token is reserved under the lock (the balance may go negative) and
+        the wait happens outside it, so concurrent callers queue in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def pace(self, remaining: int, reset_at: float) -> None:
+        """Spread the remaining quota until reset_at, or restore the base rate.
+
+        Args:
+            remaining: Requests left in the current window
+            reset_at: Window reset time (epoch seconds)
+        """
+        with self._lock:
+            if remaining >= _GITHUB_RATE_LIMIT_PACING:
+                self.rate = self.base_rate
+                return
+            window = max(reset_at - time.time(), 1.0)
+            self.rate = min(self.base_rate, max(remaining, 1) / window)
+            self._tokens = min(self._tokens, 1.0)
+
+
+_GITHUB_BUCKET = _TokenBucket(
+    rate=_GITHUB_REQUESTS_PER_MINUTE / 60, capacity=_GITHUB_REQUESTS_PER_MINUTE
+)
+
+
+def _note_github_rate_limit(response: httpx.Response) -> None:
+    """Record GitHub's REST rate-limit headers and pace later calls accordingly.
+
+    GraphQL has its own budget (X-RateLimit-Resource: graphql), so only the
+    core REST budget is tracked; a low GraphQL count must not throttle REST.
+    """
+    global _github_rate_limit_remaining
+    if response.headers.get("X-RateLimit-Resource", "core") != "core":
+        return
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is None or not remaining.isdigit():
+        return
+    _github_rate_limit_remaining = int(remaining)
+    reset = response.headers.get("X-RateLimit-Reset")
+    if reset is not None and reset.isdigit():
+        _GITHUB_BUCKET.pace(int(remaining), float(reset))
+
+
+def _github_cache_path(url: str, params: dict[str, Any] | None, headers: dict[str, str]) -> Path:
+    """Return the conditional-request cache file for a GitHub API call.
+
+    The key covers the URL, sorted query parameters and credential, so private
+    responses are never served to a different token.
+    """
+    query = urlencode(sorted((params or {}).items()))
+    key = f"{url}?{query}\0{headers.get('Authorization', '')}"
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return _cache_dir() / "github" / f"{digest}.json"
+
+
+def _github_get(
+    url: str,
+    *,
+    headers: dict[str, str],
+    params: dict[str, Any] | None = None,
+    timeout: float | httpx.Timeout = _GITHUB_TIMEOUT,
+) -> httpx.Response:
+    """Make a conditional GitHub API GET request backed by an on-disk cache.
+
+    Sends the cached ETag/Last-Modified validators so unchanged resources come
+    back as 304 (which GitHub does not count against the rate limit) and are
+    served from the cached body. When the remaining rate limit drops below
+    _GITHUB_RATE_LIMIT_FLOOR, uncached calls are skipped with a synthetic 429.
+
+    Args:
+        url: GitHub API URL
+        headers: Request headers (including Authorization)
+        params: Optional query parameters
+        timeout: Request timeout in seconds (or an httpx.Timeout)
+
+    Returns:
+        httpx.Response object (a cached body is returned as a 200 response)
+    """
+    cache_path = _github_cache_path(url, params, headers)
+    cached: dict[str, Any] | None = None
+    try:
+        loaded = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        loaded = None
+    # A truncated or hand-edited entry is treated as a miss rather than breaking the request
+    if isinstance(loaded, dict) and isinstance(loaded.get("body"), str):
+        cached = loaded
+
+    remaining = _github_rate_limit_remaining
+    if cached is None and remaining is not None and remaining < _GITHUB_RATE_LIMIT_FLOOR:
+        logger.warning(f"GitHub rate limit low ({remaining} left), skipping {url}")
+        return httpx.Response(429, request=httpx.Request("GET", url))
+
+    request_headers = dict(headers)
+    if cached is not None:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    _GITHUB_BUCKET.acquire()
+    response = _http_get(url, headers=request_headers, params=params, timeout=timeout)
+    _note_github_rate_limit(response)
+
+    if response.status_code == 304 and cached is not None:
+        logger.debug("GitHub cache hit (304) for %s", url)
+        return httpx.Response(
+            200,
+            content=cached["body"].encode(),
+            headers={"Content-Type": "application/json"},
+            request=response.request,
+        )
+
+    if response.status_code == 200:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _write_cache_file(
+                cache_path,
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "body": response.text,
+                    "fetched_at": time.time(),
+                },
+            )
+    return response
+
+
+@functools.lru_cache(maxsize=1)
+def _gh_cli_token() -> str | None:
+    """Return the token from 'gh auth token', running the CLI at most once per process.
+
+    Returns:
+        GitHub token, or None if the gh CLI is unavailable or not logged in
+    """
+    try:
+        logger.debug("GITHUB_TOKEN not set, attempting to get from 'gh auth token'...")
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            console.print("[bold green]✓ Using GitHub token from 'gh auth token'[/bold green]")
+            return result.stdout.strip() or None
+        logger.warning(f"'gh auth token' failed with return code {result.returncode}")
+    except subprocess.TimeoutExpired:
+        logger.error("Timeout running 'gh auth token'")
+    except FileNotFoundError:
+        logger.error("'gh' command not found. Install GitHub CLI or set GITHUB_TOKEN env var")
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _github_user(gh_token: str) -> dict[str, Any]:
+    """Fetch /user once per token; failures raise and are therefore not cached."""
+    response = _github_get(
+        "https://api.github.com/user",
+        headers=_github_headers(gh_token),
+        timeout=_GITHUB_TIMEOUT,
+    )
+    response.raise_for_status()
+    user: dict[str, Any] = _response_json(response)
+    return user
+
+
 def get_authenticated_user(gh_token: str) -> dict[str, Any] | None:
     """Fetch the authenticated user's information from GitHub.
 
+    Successful lookups are cached for the life of the process.
+
     Args:
         gh_token: GitHub API token
 
@@ -2244,17 +3153,11 @@ def get_authenticated_user(gh_token: str) -> dict[str, Any] | None:
     """
     try:
         logger.debug("Fetching authenticated user info...")
-        response = _http_get(
-            "https://api.github.com/user",
-            headers={"Authorization": f"Bearer {gh_token}"},
-            timeout=10,
-        )
-        if response.status_code == 200:
-            user: dict[str, Any] = response.json()
-            logger.debug(f"Authenticated as: {user.get('login')}")
-            return user
-        else:
-            logger.warning(f"GitHub user API returned status {response.status_code}")
+        user = _github_user(gh_token)
+        logger.debug("Authenticated as: %s", user.get("login"))
+        return user
+    except httpx.HTTPStatusError as e:
+        logger.warning(f"GitHub user API returned status {e.response.status_code}")
     except httpx.TimeoutException:
         logger.error("Timeout fetching user info from GitHub")
     except Exception as e:
@@ -2262,6 +3165,10 @@ def get_authenticated_user(gh_token: str) -> dict[str, Any] | None:
     return None
 
 
+# Relative date filters such as "7d", "2w", "12h" or "30m"
+_DATE_SINCE_RE = re.compile(r"^(\d+)([dwhm])$")
+
+
 def parse_date_since(date_since: str | None) -> str | None:
     """Parse date_since config into ISO format for GitHub API.
 
@@ -2284,9 +3191,7 @@ def parse_date_since(date_since: str | None) -> str | None:
             pass
 
     # Parse relative format like "7d", "30d", "2w"
-    import re
-
-    match = re.match(r"^(\d+)([dwhm])$", date_since.lower())
+    match = _DATE_SINCE_RE.match(date_since.lower())
     if match:
         amount, unit = int(match.group(1)), match.group(2)
         now = datetime.now()
@@ -2321,6 +3226,28 @@ def get_user_repos(
     Returns:
         List of repository full names (owner/repo)
     """
+    return [r["full_name"] for r in _select_user_repos(gh_token, max_repos, repo_selection)]
+
+
+def _select_user_repos(
+    gh_token: str,
+    max_repos: int = 5,
+    repo_selection: GitHubRepoSelectionModel | None = None,
+) -> list[dict[str, Any]]:
+    """Select repos like get_user_repos, returning the repo objects.
+
+    Repos listed from /user/repos keep the full API object (description,
+    language, topics, stars, ...) so callers can skip a per-repo lookup.
+    Explicitly included repos only carry "full_name".
+
+    Args:
+        gh_token: GitHub API token
+        max_repos: Maximum number of repos to return
+        repo_selection: Optional repo selection configuration (include/exclude mode)
+
+    Returns:
+        List of repository objects, each with at least "full_name"
+    """
     # Handle explicit include mode
     if repo_selection and repo_selection.mode == "include" and repo_selection.include:
         console.print(
@@ -2328,34 +3255,33 @@ def get_user_repos(
         )
         for i, repo in enumerate(repo_selection.include, 1):
             console.print(f"  [cyan][{i}][/cyan] {repo}")
-        return repo_selection.include[:max_repos]
+        return [{"full_name": repo} for repo in repo_selection.include[:max_repos]]
 
     try:
-        logger.debug(f"Fetching user's repositories (top {max_repos})...")
-        response = _http_get(
+        logger.debug("Fetching user's repositories (top %s)...", max_repos)
+        response = _github_get(
             "https://api.github.com/user/repos",
-            headers={"Authorization": f"Bearer {gh_token}"},
+            headers=_github_headers(gh_token),
             params={"sort": "updated", "per_page": 50},
-            timeout=10,
+            timeout=_GITHUB_TIMEOUT,
         )
         if response.status_code == 200:
-            repos = response.json()
-            repo_names = [r.get("full_name") for r in repos if r.get("full_name")]
+            repos = [r for r in _response_json(response) if r.get("full_name")]
 
             # Apply exclude filter if specified
             if repo_selection and repo_selection.mode == "exclude" and repo_selection.exclude:
-                original_count = len(repo_names)
-                repo_names = [r for r in repo_names if r not in repo_selection.exclude]
-                excluded_count = original_count - len(repo_names)
+                original_count = len(repos)
+                repos = [r for r in repos if r["full_name"] not in repo_selection.exclude]
+                excluded_count = original_count - len(repos)
                 if excluded_count > 0:
                     console.print(f"[dim]Excluded {excluded_count} repo(s) from selection[/dim]")
 
-            selected = repo_names[:max_repos]
+            selected = repos[:max_repos]
             console.print(
-                f"[bold green]✓ Found {len(repo_names)} user repos, using top {len(selected)}[/bold green]"
+                f"[bold green]✓ Found {len(repos)} user repos, using top {len(selected)}[/bold green]"
             )
             for i, repo in enumerate(selected, 1):
-                console.print(f"  [cyan][{i}][/cyan] {repo}")
+                console.print(f"  [cyan][{i}][/cyan] {repo['full_name']}")
             return selected
         else:
             logger.warning(f"GitHub API returned status {response.status_code}")
@@ -2367,6 +3293,146 @@ def get_user_repos(
     return []
 
 
+# Commits kept per repo, and items of each kind shown in the AI prompt. Pages
+# are capped to these so unused items aren't downloaded and decoded.
+_GITHUB_COMMITS_PER_REPO = 3
+_GITHUB_PROMPT_ITEMS = 5
+
+
+def _github_graphql(
+    query: str,
+    *,
+    headers: dict[str, str],
+    variables: dict[str, Any] | None = None,
+    timeout: float | httpx.Timeout = _GITHUB_GRAPHQL_TIMEOUT,
+) -> httpx.Response:
+    """POST a query to the GitHub GraphQL API under the shared rate limiter.
+
+    Args:
+        query: GraphQL query document
+        headers: Request headers (including Authorization)
+        variables: Optional query variables
+        timeout: Request timeout in seconds (or an httpx.Timeout)
+
+    Returns:
+        httpx.Response object
+    """
+    body: dict[str, Any] = {"query": query}
+    if variables is not None:
+        body["variables"] = variables
+    _GITHUB_BUCKET.acquire()
+    return _http_post(
+        "https://api.github.com/graphql", json_data=body, headers=headers, timeout=timeout
+    )
+
+
+# Repositories fetched per GitHub GraphQL query (each one is an aliased field)
+_GITHUB_GRAPHQL_REPOS_PER_QUERY = 25
+
+# Per-category GraphQL selections and the variables they use, mirroring the
+# fields read from the REST endpoints
+_GITHUB_GRAPHQL_FIELDS = {
+    "repos": (
+        "description primaryLanguage { name } "
+        "repositoryTopics(first: 20) { nodes { topic { name } } } stargazerCount forkCount"
+    ),
+    "commits": "defaultBranchRef { target { ... on Commit { %(history)s } } }",
+    "prs": (
+        "pullRequests(first: $prs, states: $prStates, "
+        "orderBy: {field: UPDATED_AT, direction: DESC}) "
+        "{ nodes { title number state url author { login } createdAt updatedAt } }"
+    ),
+    "issues": (
+        "issues(first: $issues, states: $issueStates, filterBy: {since: $issueSince}, "
+        "orderBy: {field: UPDATED_AT, direction: DESC}) "
+        "{ nodes { title number url state labels(first: 20) { nodes { name } } author { login } } }"
+    ),
+}
+_GITHUB_GRAPHQL_VARIABLES = {
+    "repos": "",
+    "commits": "$commits: Int!, $since: GitTimestamp",
+    "prs": "$prs: Int!, $prStates: [PullRequestState!]",
+    "issues": "$issues: Int!, $issueStates: [IssueState!], $issueSince: DateTime",
+}
+
+# REST state filters expressed as GraphQL enum lists (None means all states)
+_GITHUB_GRAPHQL_PR_STATES = {"open": ["OPEN"], "closed": ["CLOSED", "MERGED"], "all": None}
+_GITHUB_GRAPHQL_ISSUE_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": None}
+
+
+def _github_graphql_enabled() -> bool:
+    """Return False when GITHUB_GRAPHQL_DISABLED forces the REST endpoints."""
+    return os.getenv("GITHUB_GRAPHQL_DISABLED", "").lower() not in ("true", "1")
+
+
+# Commit history selection; one aliased copy is emitted per author when filtering
+_GITHUB_GRAPHQL_HISTORY = (
+    "history(first: $commits, since: $since%s) "
+    "{ nodes { message author { name date user { login } } } }"
+)
+
+
+def _github_graphql_query(
+    repos: list[str], keys: list[str], author_ids: list[str] | None = None
+) -> str:
+    """Build a single GraphQL query fetching the given categories for each repo.
+
+    Args:
+        repos: Repository full names (owner/repo); aliased repo0, repo1, ... in order
+        keys: Context categories to select ("repos", "commits", "prs", "issues")
+        author_ids: Optional user node IDs; commit history is then filtered
+            server-side with one aliased history field (a0, a1, ...) per author
+
+    Returns:
+        GraphQL query document
+    """
+    declarations = ", ".join(
+        _GITHUB_GRAPHQL_VARIABLES[key] for key in keys if _GITHUB_GRAPHQL_VARIABLES[key]
+    )
+    if author_ids:
+        history = " ".join(
+            f"a{i}: " + _GITHUB_GRAPHQL_HISTORY % f", author: {{id: {json.dumps(author_id)}}}"
+            for i, author_id in enumerate(author_ids)
+        )
+    else:
+        history = _GITHUB_GRAPHQL_HISTORY % ""
+    selection = " ".join(_GITHUB_GRAPHQL_FIELDS[key] for key in keys) % {"history": history}
+    fields = []
+    for i, repo in enumerate(repos):
+        owner, _, name = repo.partition("/")
+        fields.append(
+            f"repo{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ {selection} }}"
+        )
+    header = f"query({declarations})" if declarations else "query"
+    return f"{header} {{ {' '.join(fields)} }}"
+
+
+@functools.lru_cache(maxsize=8)
+def _github_user_ids(gh_token: str, logins: tuple[str, ...]) -> dict[str, str]:
+    """Resolve GitHub logins to GraphQL node IDs with a single query.
+
+    Logins that don't match a user are left out. Failures raise and are
+    therefore not cached.
+
+    Args:
+        gh_token: GitHub API token
+        logins: User logins to resolve
+
+    Returns:
+        Mapping of login to node ID
+    """
+    fields = " ".join(
+        f"u{i}: user(login: {json.dumps(login)}) {{ id }}" for i, login in enumerate(logins)
+    )
+    response = _github_graphql(
+        f"query {{ {fields} }}", headers=_github_headers(gh_token), timeout=_GITHUB_TIMEOUT
+    )
+    response.raise_for_status()
+    data = _response_json(response).get("data") or {}
+    return {login: data[f"u{i}"]["id"] for i, login in enumerate(logins) if data.get(f"u{i}")}
+
+
 def get_github_context(
     config: dict[str, str],
     *,
@@ -2397,34 +3463,35 @@ def get_github_context(
         logger.debug("GitHub context disabled")
         return None
 
+    # Nothing to fetch: skip the token lookup, /user and /user/repos calls
+    want_metadata = bool(github_config and github_config.include_repo_metadata)
+    if not (include_commits or include_prs or include_issues or want_metadata):
+        logger.debug("All GitHub context fetches disabled")
+        return None
+
     console.print("\n[bold blue]━━━ GitHub Context ━━━[/bold blue]")
 
     # Try to get GitHub token from explicit param, config, or gh CLI
     gh_token = token or config.get("GITHUB_TOKEN")
-    if not gh_token:
-        try:
-            logger.debug("GITHUB_TOKEN not set, attempting to get from 'gh auth token'...")
-            result = subprocess.run(
-                ["gh", "auth", "token"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                gh_token = result.stdout.strip()
-                console.print("[bold green]✓ Using GitHub token from 'gh auth token'[/bold green]")
-            else:
-                logger.warning(f"'gh auth token' failed with return code {result.returncode}")
-        except subprocess.TimeoutExpired:
-            logger.error("Timeout running 'gh auth token'")
-        except FileNotFoundError:
-            logger.error("'gh' command not found. Install GitHub CLI or set GITHUB_TOKEN env var")
-    else:
+    if gh_token:
         logger.debug("Using GITHUB_TOKEN from environment")
+    else:
+        gh_token = _gh_cli_token()
 
     if not gh_token:
         logger.warning("No GitHub token available, skipping GitHub context")
         return None
 
-    # Get authenticated user info for @me resolution
-    authenticated_user = get_authenticated_user(gh_token)
+    # The user lookup (for @me resolution) and the repo listing are independent
+    # round-trips, so run them concurrently rather than back to back
+    repo_selection = github_config.repos if github_config else None
+    executor = _get_executor()
+    user_future = executor.submit(get_authenticated_user, gh_token)
+    repos_future = executor.submit(
+        _select_user_repos, gh_token, max_repos=limit, repo_selection=repo_selection
+    )
+
+    authenticated_user = user_future.result()
     authenticated_username = authenticated_user.get("login") if authenticated_user else None
 
     # Resolve @me in authors list
@@ -2435,6 +3502,8 @@ def get_github_context(
                 authors.append(authenticated_username)
             elif author != "@me":
                 authors.append(author)
+    # Set for the per-item membership checks in the client-side filters
+    author_set = frozenset(authors)
 
     # Parse date filter
     date_since = None
@@ -2445,192 +3514,406 @@ def get_github_context(
 
     # Get per-category limits
     items_per_repo = github_config.items_per_repo if github_config else GitHubItemLimitsModel()
+    # Only the first few PRs/issues reach the prompt; keep the configured page size
+    # when results are filtered locally afterwards and fewer would survive
+    pr_page_size = (
+        items_per_repo.prs
+        if authors or date_since
+        else min(items_per_repo.prs, _GITHUB_PROMPT_ITEMS)
+    )
+    # The REST issues endpoint also returns PRs, which are dropped locally, so only
+    # GraphQL (which lists issues alone) can use the smaller page
+    graphql_issue_page_size = (
+        items_per_repo.issues if authors else min(items_per_repo.issues, _GITHUB_PROMPT_ITEMS)
+    )
 
     context: dict[str, Any] = {"commits": [], "prs": [], "issues": [], "repos": []}
-    headers = {"Authorization": f"Bearer {gh_token}"}
+    headers = _github_headers(gh_token)
 
     try:
         # Get user's repos with selection mode
-        repo_selection = github_config.repos if github_config else None
-        repos = get_user_repos(gh_token, max_repos=limit, repo_selection=repo_selection)
-        if not repos:
+        selected_repos = repos_future.result()
+        if not selected_repos:
             logger.warning("No user repos found, skipping GitHub context")
             return None
+        repos = [r["full_name"] for r in selected_repos]
+        # Repos listed from /user/repos already carry their metadata
+        listed_repos = {r["full_name"]: r for r in selected_repos if "stargazers_count" in r}
 
         logger.info(f"Fetching context from {len(repos)} repositories...")
 
-        # Fetch data from multiple repos
-        for repo_idx, repo in enumerate(repos, 1):
-            try:
-                logger.debug(f"  [{repo_idx}/{len(repos)}] Processing {repo}...")
-
-                # Fetch repo metadata if enabled
-                repo_metadata = None
-                if github_config and github_config.include_repo_metadata:
-                    repo_response = _http_get(
-                        f"https://api.github.com/repos/{repo}",
-                        headers=headers,
-                        timeout=10,
-                    )
-                    if repo_response.status_code == 200:
-                        repo_data = repo_response.json()
-                        repo_metadata = {
-                            "name": repo,
-                            "description": repo_data.get("description"),
-                            "language": repo_data.get("language"),
-                            "topics": repo_data.get("topics", []),
-                            "stars": repo_data.get("stargazers_count", 0),
-                            "forks": repo_data.get("forks_count", 0),
-                        }
-                        context["repos"].append(repo_metadata)
-                        logger.debug(
-                            f"    ✓ Repo metadata: {repo_metadata['language']}, "
-                            f"{repo_metadata['stars']} stars"
-                        )
+        def fetch_repo_metadata(repo: str) -> list[dict[str, Any]]:
+            repo_data = listed_repos.get(repo)
+            if repo_data is None:
+                repo_response = _github_get(
+                    f"https://api.github.com/repos/{repo}",
+                    headers=headers,
+                    timeout=_GITHUB_TIMEOUT,
+                )
+                if repo_response.status_code != 200:
+                    return []
+                repo_data = _response_json(repo_response)
+            repo_metadata = {
+                "name": repo,
+                "description": repo_data.get("description"),
+                "language": repo_data.get("language"),
+                "topics": repo_data.get("topics", []),
+                "stars": repo_data.get("stargazers_count", 0),
+                "forks": repo_data.get("forks_count", 0),
+            }
+            logger.debug(
+                f"    ✓ {repo} metadata: {repo_metadata['language']}, "
+                f"{repo_metadata['stars']} stars"
+            )
+            return [repo_metadata]
 
-                # Get recent commits
-                if include_commits:
-                    commit_params: dict[str, Any] = {"per_page": items_per_repo.commits}
-                    if date_since:
-                        commit_params["since"] = date_since
-                    if authors:
-                        # GitHub API uses 'author' parameter for commit filtering
-                        commit_params["author"] = authors[0] if len(authors) == 1 else None
-
-                    response = _http_get(
-                        f"https://api.github.com/repos/{repo}/commits",
-                        headers=headers,
-                        params=commit_params,
-                        timeout=10,
-                    )
-                    if response.status_code == 200:
-                        commits = response.json()
-                        # Filter by multiple authors if needed (API only supports one)
-                        if len(authors) > 1:
-                            commits = [
-                                c
-                                for c in commits
-                                if c.get("commit", {}).get("author", {}).get("name") in authors
-                                or c.get("author", {}).get("login") in authors
-                            ]
-                        fetched = len(commits)
-                        context["commits"].extend(
-                            [
-                                {
-                                    "message": c.get("commit", {}).get("message", ""),
-                                    "author": c.get("commit", {})
-                                    .get("author", {})
-                                    .get("name", "Unknown"),
-                                    "repo": repo,
-                                    "date": c.get("commit", {}).get("author", {}).get("date", ""),
-                                }
-                                for c in commits[:3]
-                            ]
-                        )
-                        logger.debug(f"    ✓ Fetched {fetched} commits")
-                    else:
-                        logger.debug(f"    ⚠ Commits API returned {response.status_code}")
+        def fetch_repo_commits(repo: str, author: str | None = None) -> list[dict[str, Any]]:
+            commit_params: dict[str, Any] = {
+                "per_page": min(items_per_repo.commits, _GITHUB_COMMITS_PER_REPO)
+            }
+            if date_since:
+                commit_params["since"] = date_since
+            if author:
+                # GitHub API uses 'author' parameter for commit filtering
+                commit_params["author"] = author
+
+            response = _github_get(
+                f"https://api.github.com/repos/{repo}/commits",
+                headers=headers,
+                params=commit_params,
+                timeout=_GITHUB_TIMEOUT,
+            )
+            if response.status_code != 200:
+                logger.debug("    ⚠ %s commits API returned %s", repo, response.status_code)
+                return []
+            commits = _response_json(response)
+            logger.debug("    ✓ Fetched %s commits from %s", len(commits), repo)
+            results = []
+            for c in commits:
+                # Resolve the nested commit/author dicts once per item
+                commit = c.get("commit") or {}
+                commit_author = commit.get("author") or {}
+                results.append(
+                    {
+                        "message": commit.get("message", ""),
+                        "author": commit_author.get("name", "Unknown"),
+                        "repo": repo,
+                        "date": commit_author.get("date", ""),
+                    }
+                )
+            return results
+
+        def fetch_repo_prs(repo: str) -> list[dict[str, Any]]:
+            pr_params: dict[str, Any] = {
+                "state": github_config.pr_state if github_config else "all",
+                "per_page": pr_page_size,
+            }
+            if date_since:
+                # GitHub doesn't support since for PRs directly, filter client-side
+                pr_params["sort"] = "updated"
+                pr_params["direction"] = "desc"
 
-                # Get recent PRs
-                if include_prs:
-                    pr_params: dict[str, Any] = {
-                        "state": github_config.pr_state if github_config else "all",
-                        "per_page": items_per_repo.prs,
+            response = _github_get(
+                f"https://api.github.com/repos/{repo}/pulls",
+                headers=headers,
+                params=pr_params,
+                timeout=_GITHUB_TIMEOUT,
+            )
+            if response.status_code != 200:
+                logger.debug("    ⚠ %s PRs API returned %s", repo, response.status_code)
+                return []
+            prs = _response_json(response)
+            # Filter by date if specified; PRs are sorted newest-updated first, so
+            # stop at the first one that is too old
+            if date_since:
+                prs = list(
+                    itertools.takewhile(lambda pr: pr.get("updated_at", "") >= date_since, prs)
+                )
+            # Filter by authors if specified
+            if authors:
+                prs = [pr for pr in prs if (pr.get("user") or {}).get("login") in author_set]
+            logger.debug("    ✓ Fetched %s PRs from %s", len(prs), repo)
+            results = []
+            for pr in prs:
+                user = pr.get("user") or {}
+                results.append(
+                    {
+                        "title": pr.get("title", ""),
+                        "number": pr.get("number", 0),
+                        "state": pr.get("state", ""),
+                        "repo": repo,
+                        "url": pr.get("html_url", ""),
+                        "author": user.get("login", "Unknown"),
+                        "created_at": pr.get("created_at", ""),
+                        "updated_at": pr.get("updated_at", ""),
                     }
-                    if date_since:
-                        # GitHub doesn't support since for PRs directly, filter client-side
-                        pr_params["sort"] = "updated"
-                        pr_params["direction"] = "desc"
-
-                    response = _http_get(
-                        f"https://api.github.com/repos/{repo}/pulls",
-                        headers=headers,
-                        params=pr_params,
-                        timeout=10,
-                    )
-                    if response.status_code == 200:
-                        prs = response.json()
-                        # Filter by authors if specified
-                        if authors:
-                            prs = [pr for pr in prs if pr.get("user", {}).get("login") in authors]
-                        # Filter by date if specified
-                        if date_since:
-                            prs = [pr for pr in prs if pr.get("updated_at", "") >= date_since]
-                        fetched = len(prs)
-                        context["prs"].extend(
-                            [
-                                {
-                                    "title": pr.get("title", ""),
-                                    "number": pr.get("number", 0),
-                                    "state": pr.get("state", ""),
-                                    "repo": repo,
-                                    "url": pr.get("html_url", ""),
-                                    "author": pr.get("user", {}).get("login", "Unknown"),
-                                    "created_at": pr.get("created_at", ""),
-                                    "updated_at": pr.get("updated_at", ""),
-                                }
-                                for pr in prs
-                            ]
-                        )
-                        logger.debug(f"    ✓ Fetched {fetched} PRs")
-                    else:
-                        logger.debug(f"    ⚠ PRs API returned {response.status_code}")
+                )
+            return results
+
+        def fetch_repo_issues(repo: str) -> list[dict[str, Any]]:
+            issue_params: dict[str, Any] = {
+                "state": github_config.issue_state if github_config else "all",
+                "per_page": items_per_repo.issues,
+            }
+            if date_since:
+                issue_params["since"] = date_since
+            # GitHub issues API supports 'creator' parameter for author filtering
+            if authors and len(authors) == 1:
+                issue_params["creator"] = authors[0]
+
+            response = _github_get(
+                f"https://api.github.com/repos/{repo}/issues",
+                headers=headers,
+                params=issue_params,
+                timeout=_GITHUB_TIMEOUT,
+            )
+            if response.status_code != 200:
+                logger.debug("    ⚠ %s issues API returned %s", repo, response.status_code)
+                return []
+            issues = _response_json(response)
+            # Filter out PRs and apply multi-author filter if needed
+            issues_filtered = [i for i in issues if not i.get("pull_request")]
+            if len(authors) > 1:
+                issues_filtered = [
+                    i for i in issues_filtered if (i.get("user") or {}).get("login") in author_set
+                ]
+            logger.debug("    ✓ Fetched %s issues from %s", len(issues_filtered), repo)
+            results = []
+            for i in issues_filtered:
+                user = i.get("user") or {}
+                results.append(
+                    {
+                        "title": i.get("title", ""),
+                        "number": i.get("number", 0),
+                        "repo": repo,
+                        "url": i.get("html_url", ""),
+                        "labels": [label.get("name", "") for label in i.get("labels", [])],
+                        "state": i.get("state", ""),
+                        "author": user.get("login", "Unknown"),
+                    }
+                )
+            return results
+
+        fetchers: list[tuple[str, Callable[[str], list[dict[str, Any]]]]] = []
+        if github_config and github_config.include_repo_metadata:
+            fetchers.append(("repos", fetch_repo_metadata))
+        if include_commits:
+            fetchers.append(("commits", fetch_repo_commits))
+        if include_prs:
+            fetchers.append(("prs", fetch_repo_prs))
+        if include_issues:
+            fetchers.append(("issues", fetch_repo_issues))
+
+        # GraphQL timestamps must carry a zone; relative filters are local naive times
+        graphql_since = None
+        if date_since:
+            since_dt = datetime.fromisoformat(date_since)
+            graphql_since = (since_dt if since_dt.tzinfo else since_dt.astimezone()).isoformat()
 
-                # Get recent issues
-                if include_issues:
-                    issue_params: dict[str, Any] = {
-                        "state": github_config.issue_state if github_config else "all",
-                        "per_page": items_per_repo.issues,
+        def is_listed_commit_author(commit: dict[str, Any]) -> bool:
+            author = commit.get("author") or {}
+            if author.get("name") in author_set:
+                return True
+            return (author.get("user") or {}).get("login") in author_set
+
+        def parse_graphql_repo(repo: str, node: dict[str, Any] | None) -> dict[str, Any]:
+            parsed: dict[str, list[dict[str, Any]]] = {key: [] for key, _ in fetchers}
+            if not node:
+                return parsed
+            if "repos" in parsed:
+                parsed["repos"] = [
+                    {
+                        "name": repo,
+                        "description": node.get("description"),
+                        "language": (node.get("primaryLanguage") or {}).get("name"),
+                        "topics": [
+                            t["topic"]["name"]
+                            for t in (node.get("repositoryTopics") or {}).get("nodes", [])
+                        ],
+                        "stars": node.get("stargazerCount", 0),
+                        "forks": node.get("forkCount", 0),
                     }
-                    if date_since:
-                        issue_params["since"] = date_since
-                    # GitHub issues API supports 'creator' parameter for author filtering
-                    if authors and len(authors) == 1:
-                        issue_params["creator"] = authors[0]
-
-                    response = _http_get(
-                        f"https://api.github.com/repos/{repo}/issues",
-                        headers=headers,
-                        params=issue_params,
-                        timeout=10,
+                ]
+            if "commits" in parsed:
+                target = (node.get("defaultBranchRef") or {}).get("target") or {}
+                # One history field, or one aliased field per server-side filtered author
+                commits = [
+                    c for history in target.values() for c in (history or {}).get("nodes", [])
+                ]
+                if author_ids:
+                    commits.sort(
+                        key=lambda c: (c.get("author") or {}).get("date", ""), reverse=True
                     )
-                    if response.status_code == 200:
-                        issues = response.json()
-                        # Filter out PRs and apply multi-author filter if needed
-                        issues_filtered = [i for i in issues if not i.get("pull_request")]
-                        if len(authors) > 1:
-                            issues_filtered = [
-                                i
-                                for i in issues_filtered
-                                if i.get("user", {}).get("login") in authors
-                            ]
-                        fetched = len(issues_filtered)
-                        context["issues"].extend(
-                            [
-                                {
-                                    "title": i.get("title", ""),
-                                    "number": i.get("number", 0),
-                                    "repo": repo,
-                                    "url": i.get("html_url", ""),
-                                    "labels": [
-                                        label.get("name", "") for label in i.get("labels", [])
-                                    ],
-                                    "state": i.get("state", ""),
-                                    "author": i.get("user", {}).get("login", "Unknown"),
-                                }
-                                for i in issues_filtered
-                            ]
-                        )
-                        logger.debug(f"    ✓ Fetched {fetched} issues")
-                    else:
-                        logger.debug(f"    ⚠ Issues API returned {response.status_code}")
+                elif authors:
+                    commits = [c for c in commits if is_listed_commit_author(c)]
+                for c in commits[:_GITHUB_COMMITS_PER_REPO]:
+                    commit_author = c.get("author") or {}
+                    parsed["commits"].append(
+                        {
+                            "message": c.get("message", ""),
+                            "author": commit_author.get("name") or "Unknown",
+                            "repo": repo,
+                            "date": commit_author.get("date", ""),
+                        }
+                    )
+            if "prs" in parsed:
+                prs = (node.get("pullRequests") or {}).get("nodes", [])
+                if date_since:
+                    # Ordered by UPDATED_AT descending, so stop at the first older PR
+                    prs = list(
+                        itertools.takewhile(lambda pr: pr.get("updatedAt", "") >= date_since, prs)
+                    )
+                if authors:
+                    prs = [pr for pr in prs if (pr.get("author") or {}).get("login") in author_set]
+                parsed["prs"] = [
+                    {
+                        "title": pr.get("title", ""),
+                        "number": pr.get("number", 0),
+                        # REST reports merged PRs as closed
+                        "state": "closed"
+                        if pr.get("state") == "MERGED"
+                        else pr.get("state", "").lower(),
+                        "repo": repo,
+                        "url": pr.get("url", ""),
+                        "author": (pr.get("author") or {}).get("login", "Unknown"),
+                        "created_at": pr.get("createdAt", ""),
+                        "updated_at": pr.get("updatedAt", ""),
+                    }
+                    for pr in prs
+                ]
+            if "issues" in parsed:
+                issues = (node.get("issues") or {}).get("nodes", [])
+                if authors:
+                    issues = [
+                        i for i in issues if (i.get("author") or {}).get("login") in author_set
+                    ]
+                parsed["issues"] = [
+                    {
+                        "title": i.get("title", ""),
+                        "number": i.get("number", 0),
+                        "repo": repo,
+                        "url": i.get("url", ""),
+                        "labels": [
+                            label["name"] for label in (i.get("labels") or {}).get("nodes", [])
+                        ],
+                        "state": i.get("state", "").lower(),
+                        "author": (i.get("author") or {}).get("login", "Unknown"),
+                    }
+                    for i in issues
+                ]
+            return parsed
+
+        def fetch_repos_graphql(chunk: list[str]) -> dict[str, dict[str, Any]] | None:
+            keys = [key for key, _ in fetchers]
+            variables: dict[str, Any] = {}
+            if "commits" in keys:
+                # Unresolved authors are filtered locally, which needs the full page
+                commits_first = (
+                    items_per_repo.commits
+                    if authors and not author_ids
+                    else min(items_per_repo.commits, _GITHUB_COMMITS_PER_REPO)
+                )
+                variables.update(commits=commits_first, since=graphql_since)
+            if "prs" in keys:
+                pr_state = github_config.pr_state if github_config else "all"
+                variables.update(prs=pr_page_size, prStates=_GITHUB_GRAPHQL_PR_STATES[pr_state])
+            if "issues" in keys:
+                issue_state = github_config.issue_state if github_config else "all"
+                variables.update(
+                    issues=graphql_issue_page_size,
+                    issueStates=_GITHUB_GRAPHQL_ISSUE_STATES[issue_state],
+                    issueSince=graphql_since,
+                )
 
-            except httpx.TimeoutException:
-                logger.error(f"  Timeout fetching data from {repo}")
-                continue
+            query = _github_graphql_query(chunk, keys, author_ids)
+            response = _github_graphql(query, headers=headers, variables=variables)
+            if response.status_code != 200:
+                logger.debug("  ⚠ GitHub GraphQL API returned %s", response.status_code)
+                return None
+            payload = _response_json(response)
+            data = payload.get("data")
+            if not data:
+                logger.debug("  ⚠ GitHub GraphQL query failed: %s", payload.get("errors"))
+                return None
+            # Missing or inaccessible repos come back as null alongside an error entry
+            logger.debug("    ✓ Fetched %s repos in one GraphQL query", len(chunk))
+            return {
+                repo: parse_graphql_repo(repo, data.get(f"repo{i}")) for i, repo in enumerate(chunk)
+            }
+
+        executor = _get_executor()
+
+        # One GraphQL query covers every category for up to
+        # _GITHUB_GRAPHQL_REPOS_PER_QUERY repos; chunks it can't answer fall back to REST
+        graphql_results: dict[str, dict[str, Any]] = {}
+        use_graphql = bool(fetchers) and _github_graphql_enabled()
+
+        # Filter commit history by author on the server when every author resolves
+        # to a user; otherwise fall back to filtering the fetched commits locally
+        author_ids: list[str] | None = None
+        if use_graphql and authors and include_commits:
+            try:
+                resolved = _github_user_ids(gh_token, tuple(authors))
+                if len(resolved) == len(authors):
+                    author_ids = list(resolved.values())
             except Exception as e:
-                logger.error(f"  Error fetching data from {repo}: {type(e).__name__}: {e}")
+                logger.debug("  ⚠ Could not resolve GitHub author IDs: %s", e)
+
+        if use_graphql:
+            chunk_size = _GITHUB_GRAPHQL_REPOS_PER_QUERY
+            chunk_futures = [
+                executor.submit(fetch_repos_graphql, repos[i : i + chunk_size])
+                for i in range(0, len(repos), chunk_size)
+            ]
+            for chunk_future in chunk_futures:
+                try:
+                    graphql_results.update(chunk_future.result() or {})
+                except httpx.TimeoutException:
+                    logger.debug("  ⚠ GitHub GraphQL query timed out, falling back to REST")
+                except Exception as e:
+                    logger.debug("  ⚠ GitHub GraphQL error, falling back to REST: %s", e)
+
+        # Every remaining (repo, endpoint) request is independent, so issue them all
+        # concurrently on the shared worker pool. The commits endpoint filters by a
+        # single author, so multiple authors get one request each.
+        futures: dict[tuple[str, str], list[concurrent.futures.Future[list[dict[str, Any]]]]] = {}
+        for repo in repos:
+            if repo in graphql_results:
                 continue
+            for key, fetcher in fetchers:
+                if key == "commits" and authors:
+                    futures[repo, key] = [
+                        executor.submit(fetch_repo_commits, repo, author) for author in authors
+                    ]
+                else:
+                    futures[repo, key] = [executor.submit(fetcher, repo)]
+
+        # Merge results back in repo order
+        for repo in repos:
+            for key, _ in fetchers:
+                bucket = context[key]
+                if repo in graphql_results:
+                    bucket.extend(graphql_results[repo][key])
+                    continue
+                repo_futures = futures[repo, key]
+                if len(repo_futures) == 1:
+                    # One request already returns newest first within the page size,
+                    # so append straight into the context list
+                    items = bucket
+                else:
+                    items = []
+                for future in repo_futures:
+                    try:
+                        items.extend(future.result())
+                    except httpx.TimeoutException:
+                        logger.error(f"  Timeout fetching {key} from {repo}")
+                    except Exception as e:
+                        logger.error(f"  Error fetching {key} from {repo}: {type(e).__name__}: {e}")
+                if items is not bucket:
+                    # Newest first across per-author requests, sorted and trimmed in place
+                    items.sort(key=lambda c: c["date"], reverse=True)
+                    del items[_GITHUB_COMMITS_PER_REPO:]
+                    bucket.extend(items)
 
         # Keep all fetched items (already limited by per_repo settings)
         summary_parts = []
@@ -2655,6 +3938,63 @@ def get_github_context(
         return None
 
 
+# YAP_LLM_CACHE modes: "enabled" reads and writes cached responses, "readonly"
+# only reads, "replay" only reads and never calls the API, "disabled" skips it.
+# Off by default so repeated runs still produce fresh conversations.
+_LLM_CACHE_MODES = ("enabled", "readonly", "replay", "disabled")
+
+
+def _llm_cache_mode() -> str:
+    """Return the AI response cache mode from YAP_LLM_CACHE."""
+    mode = os.getenv("YAP_LLM_CACHE", "disabled").lower()
+    if mode not in _LLM_CACHE_MODES:
+        logger.warning(f"Invalid YAP_LLM_CACHE '{mode}', using 'disabled'")
+        return "disabled"
+    return mode
+
+
+def _llm_cache_key(payload: dict[str, Any]) -> str:
+    """Return the cache key for a chat completion request.
+
+    The whole request body is hashed, so any change to the model, prompt,
+    sampling parameters or schema misses the cache.
+    """
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _llm_cache_path(key: str) -> Path:
+    """Return the cache file for an AI response."""
+    return _cache_dir() / "llm" / f"{key}.json"
+
+
+def _llm_cache_get(key: str) -> list[dict[str, Any]] | None:
+    """Return cached generated messages, or None on a miss (or a malformed entry)."""
+    try:
+        loaded = json.loads(_llm_cache_path(key).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(loaded, list) or not all(
+        isinstance(msg, dict) and isinstance(msg.get("text"), str) for msg in loaded
+    ):
+        return None
+    messages: list[dict[str, Any]] = loaded
+    return messages
+
+
+# Closing instructions appended after the GitHub context in the AI prompt
+_GITHUB_CONTEXT_USAGE = (
+    "\n### How to use this context:\n"
+    "- Reference ACTUAL PR numbers and URLs from above\n"
+    "- Discuss real commit messages (ask questions, give feedback)\n"
+    "- Mention real issues that need attention\n"
+    "- Include workflow run links like https://github.com/owner/repo/actions/runs/123\n"
+    "- Ask about specific code changes from PRs\n"
+    "- Discuss merge conflicts, review comments, CI failures on these PRs\n"
+    "- Create realistic support threads around this actual project context\n"
+    "- Reference repository languages and topics when relevant\n"
+)
+
+
 def generate_messages_with_ai(
     config: dict[str, str],
     ai_config: AIConfigModel | None = None,
@@ -2697,51 +4037,46 @@ def generate_messages_with_ai(
     base_prompt = system_prompt
 
     if github_context:
-        context_str = "\n\n## REAL PROJECT CONTEXT (USE THIS!)\nYou have access to real GitHub data from the user's repos. HEAVILY reference this in your messages:\n"
+        parts = [
+            "\n\n## REAL PROJECT CONTEXT (USE THIS!)\nYou have access to real GitHub data from the user's repos. HEAVILY reference this in your messages:\n"
+        ]
 
         # Include repository metadata if available
         if github_context.get("repos"):
-            context_str += "\n### Repositories (background info):\n"
+            parts.append("\n### Repositories (background info):\n")
             for repo in github_context["repos"]:
                 lang = repo.get("language") or "Unknown"
                 stars = repo.get("stars", 0)
                 topics = ", ".join(repo.get("topics", [])[:3]) or "no topics"
                 desc = repo.get("description") or "No description"
-                context_str += (
-                    f"- *{repo['name']}*: {desc} ({lang}, {stars} ⭐, topics: {topics})\n"
-                )
+                parts.append(f"- *{repo['name']}*: {desc} ({lang}, {stars} ⭐, topics: {topics})\n")
 
         if github_context.get("commits"):
-            context_str += "\n### Recent Commits (reference these!):\n"
-            for c in github_context["commits"][:5]:
-                context_str += f"- `{c['message'][:60]}` in *{c['repo']}* by _{c['author']}_\n"
+            parts.append("\n### Recent Commits (reference these!):\n")
+            parts.extend(
+                f"- `{c['message'][:60]}` in *{c['repo']}* by _{c['author']}_\n"
+                for c in github_context["commits"][:_GITHUB_PROMPT_ITEMS]
+            )
         if github_context.get("prs"):
-            context_str += "\n### Open/Recent PRs (discuss, review, question these!):\n"
-            for pr in github_context["prs"][:5]:
+            parts.append("\n### Open/Recent PRs (discuss, review, question these!):\n")
+            for pr in github_context["prs"][:_GITHUB_PROMPT_ITEMS]:
                 url = pr.get("url", "")
                 state_icon = "🟢" if pr["state"] == "open" else "🟣"
-                context_str += f"- {state_icon} <{url}|#{pr['number']}: {pr['title']}> ({pr['state']}) by @{pr['author']}\n"
+                parts.append(
+                    f"- {state_icon} <{url}|#{pr['number']}: {pr['title']}> ({pr['state']}) by @{pr['author']}\n"
+                )
         if github_context.get("issues"):
-            context_str += "\n### Issues (ask about, update, close these!):\n"
-            for issue in github_context["issues"][:5]:
+            parts.append("\n### Issues (ask about, update, close these!):\n")
+            for issue in github_context["issues"][:_GITHUB_PROMPT_ITEMS]:
                 url = issue.get("url", "")
                 labels = ", ".join(issue["labels"]) if issue["labels"] else "no labels"
                 state_icon = "🔴" if issue.get("state") == "open" else "✅"
-                context_str += f"- {state_icon} <{url}|#{issue['number']}: {issue['title']}> [{labels}] by @{issue.get('author', 'unknown')}\n"
-
-        context_str += "\n### How to use this context:\n"
-        context_str += "- Reference ACTUAL PR numbers and URLs from above\n"
-        context_str += "- Discuss real commit messages (ask questions, give feedback)\n"
-        context_str += "- Mention real issues that need attention\n"
-        context_str += (
-            "- Include workflow run links like https://github.com/owner/repo/actions/runs/123\n"
-        )
-        context_str += "- Ask about specific code changes from PRs\n"
-        context_str += "- Discuss merge conflicts, review comments, CI failures on these PRs\n"
-        context_str += "- Create realistic support threads around this actual project context\n"
-        context_str += "- Reference repository languages and topics when relevant\n"
+                parts.append(
+                    f"- {state_icon} <{url}|#{issue['number']}: {issue['title']}> [{labels}] by @{issue.get('author', 'unknown')}\n"
+                )
 
-        prompt = base_prompt + "\n\n" + context_str
+        parts.append(_GITHUB_CONTEXT_USAGE)
+        prompt = base_prompt + "\n\n" + "".join(parts)
         logger.debug("AI prompt includes GitHub context")
     else:
         prompt = base_prompt
@@ -2781,8 +4116,36 @@ def generate_messages_with_ai(
         "additionalProperties": False,
     }
 
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "top_p": 0.9,
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": "slack_messages", "strict": True, "schema": schema},
+        },
+    }
+
+    cache_mode = _llm_cache_mode()
+    cache_key = _llm_cache_key(payload)
+    if cache_mode != "disabled":
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"✓ Loaded {len(cached)} cached messages for {model}")
+            return cached
+        if cache_mode == "replay":
+            logger.error("No cached AI response for this prompt (YAP_LLM_CACHE=replay)")
+            return None
+
     try:
-        with console.status(f"[bold magenta]Generating messages with {model}...", spinner="dots"):
+        # The request can take up to a minute; a slow spinner avoids needless redraws
+        with console.status(
+            f"[bold magenta]Generating messages with {model}...",
+            spinner="dots",
+            refresh_per_second=2,
+        ):
             response = _http_post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers={
@@ -2790,37 +4153,29 @@ def generate_messages_with_ai(
                     "Content-Type": "application/json",
                     "HTTP-Referer": "https://github.com/echohello-dev/yap-on-slack",
                 },
-                json_data={
-                    "model": model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "top_p": 0.9,
-                    "response_format": {
-                        "type": "json_schema",
-                        "json_schema": {"name": "slack_messages", "strict": True, "schema": schema},
-                    },
-                },
+                json_data=payload,
                 timeout=30,
             )
 
         if response.status_code == 200:
-            result = response.json()
+            result = _response_json(response)
             content = result["choices"][0]["message"]["content"]
 
             try:
-                data = json.loads(content)
+                data = _json_loads(content)
                 messages: list[dict[str, Any]] = data.get("messages", [])
                 logger.info(f"✓ Generated {len(messages)} messages from {model}")
+                if cache_mode == "enabled":
+                    _write_cache_file(_llm_cache_path(cache_key), messages)
                 return messages
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response: {type(e).__name__}: {e}")
-                logger.debug(f"   Content: {content[:200]}")
+                logger.debug("   Content: %s", content[:200])
                 return None
         else:
             error_body = response.text
             logger.error(f"AI generation failed: HTTP {response.status_code}")
-            logger.debug(f"   Response: {error_body[:200]}")
+            logger.debug("   Response: %s", error_body[:200])
             return None
     except httpx.TimeoutException:
         logger.error("AI generation timed out (30s)")
@@ -2830,168 +4185,189 @@ def generate_messages_with_ai(
         return None
 
 
+# Fallback messages used when no valid messages file is available
+_DEFAULT_MESSAGES: tuple[dict[str, Any], ...] = (
+    {
+        "text": "Hey team, I'm getting a *403* on the new dashboard analytics endpoint :thinking_face: Has anyone else run into this?",
+        "replies": [
+            "Did you check if your token has the `analytics.read` scope?",
+            "Also, make sure the URL is `/api/v3/analytics`, not `/api/analytics`. Easy typo to make",
+        ],
+    },
+    {
+        "text": "Quick question - what's our _data retention policy_ for session logs? Need this for the compliance audit",
+        "replies": ["90 days in hot storage, then goes to cold storage for 7 years per policy"],
+    },
+    {
+        "text": "*Issue* in prod :bug:: Database query timeout on user auth\n`TypeError: Cannot read property 'userId' of undefined` at `user-service.js:45`\nAnyone know what we deployed?",
+        "replies": [
+            "Did we change the auth middleware recently?",
+            "Yeah, I see it now. JWT decode is failing silently. Let me push a fix",
+        ],
+    },
+    {
+        "text": "Could someone send me the rate limiter config docs? Setting up limits for the _payment service_ and need guidance",
+        "replies": [],
+    },
+    {
+        "text": "Onboarding new team member tomorrow - where can I find the local dev setup guide? Need the Docker compose instructions :wave:",
+        "replies": ["Root `README` has everything including the Docker compose setup :whale:"],
+    },
+    {
+        "text": "Has anyone successfully integrated <https://stripe.com/docs/webhooks|Stripe webhooks>? Signature validation keeps failing and I can't figure out why",
+        "replies": [
+            "Make sure you're using the webhook secret from the dashboard, not your API secret",
+            "Also gotta read the raw request body before parsing as JSON. That's a common gotcha",
+        ],
+    },
+    {
+        "text": "Could use some help - how does the *authentication flow* work on mobile? Is there a sequence diagram or docs somewhere?",
+        "replies": [],
+    },
+    {
+        "text": "Quick question on _database migrations_: should I create a new file or modify the existing one? Adding a column to the `users` table",
+        "replies": [
+            "Always create a *new migration file*. Never modify deployed migrations - that's how things break :no_entry:"
+        ],
+    },
+    {
+        "text": "Getting timeout errors on `/api/v2/reports` when generating large reports. Timeout is set to 30s currently - what's the recommended value?",
+        "replies": [
+            "60s is typical for report generation. Or consider making it _async with a callback_ if reports are heavy"
+        ],
+    },
+    {
+        "text": "What's the best approach for handling *retries* in the payment module? How do you differentiate between `transient` and `permanent` failures?",
+        "replies": [],
+    },
+    {
+        "text": "Question - _staging_ vs _pre-prod_: which one should I use for feature flag testing? :rocket:",
+        "replies": [
+            "Staging is for integration testing. Pre-prod mirrors production config. Use *pre-prod* for feature flags"
+        ],
+    },
+    {
+        "text": "Looking for documentation on *user permissions*. Need to implement role-based access control for the admin dashboard",
+        "replies": [],
+    },
+    {
+        "text": "*Push notifications* aren't showing on iOS. Has anyone worked with the notification service recently? :iphone:",
+        "replies": [
+            "When's the last time you updated the *APNs certificate*? Pretty sure it expired :warning:",
+            "Oh, that's probably it! Where can I find the new one? :bulb:",
+        ],
+    },
+    {
+        "text": "*Security question* - do we automatically redact _credit card numbers_ in logs, or should they be manually scrubbed?",
+        "replies": [],
+    },
+    {
+        "text": "Seeing _inconsistent results_ from the search API. Same query returns different results on subsequent calls. Is Redis caching enabled?",
+        "replies": ["Yes, Redis caching with 5-minute TTL. Could be cache warming issues :mag:"],
+    },
+    {
+        "text": ":rocket: *heads up* - deploying _auth service v2.1_ to staging in 30min. if you're testing auth stuff plz use `staging-v2`",
+        "replies": [
+            "thanks for the heads up! when's it going to prod?",
+            "probably friday if no issues in staging. ill ping the channel",
+        ],
+    },
+    {
+        "text": "just merged <https://github.com/echohello-dev/yap-on-slack/pull/487|PR #487> - refactored the payment webhook handler to be more robust. plz review when u get a sec :eyes:",
+        "replies": ["lgtm! just left a comment on line 42 :+1:", "approved! ship it :ship:"],
+    },
+    {
+        "text": ":warning: *ATTENTION*: we're deprecating the old `/api/v1/users` endpoint _next month_. migrate to `/api/v2/users` asap. see <https://docs.example.com|docs> for migration guide",
+        "replies": [
+            "how long do we have to migrate?",
+            "until feb 15. we're sending emails to all customers but best to get it done early",
+        ],
+    },
+    {
+        "text": "*performance update*: search endpoint now doing _fuzzy matching_. this may affect some queries but accuracy is way better. feedback welcome :mag:",
+        "replies": [
+            "nice! how's the perf impact?",
+            "minimal actually. redis caching handles most of it :zap:",
+        ],
+    },
+    {
+        "text": "*planned maintenance*: database will be down for upgrades tomorrow 2am-3am pst. notify ur customers pls :warning:",
+        "replies": [
+            "done. already sent notifications :email:",
+            "thx. also FYI we're upgrading to `postgres 15` :elephant:",
+        ],
+    },
+    {
+        "text": "*FYI* rolling out new UI theme next week. if things look weird that's expected lol. should stabilize by wed :art:",
+        "replies": [
+            "dark mode finally?? :moon:",
+            "yeah! and better mobile responsive too :iphone:",
+        ],
+    },
+    {
+        "text": "quick *status update*: api latency spiked this morning around 9am but we've sorted it now. no data loss :relieved:",
+        "replies": [
+            "what caused it?",
+            "one of the load balancers got overloaded. scaled it up :muscle:",
+        ],
+    },
+)
+
+
 def load_messages(messages_path: Path | None = None) -> list[dict[str, Any]]:
     """Load messages from messages.json or use defaults."""
     messages_file = messages_path if messages_path else Path("messages.json")
 
     if messages_file.exists():
+        with messages_file.open() as f:
+            raw = f.read()
+        # Parse and validate messages with pydantic in one step
         try:
-            with messages_file.open() as f:
-                data = json.load(f)
-                # Validate messages with pydantic
-                try:
-                    validated = [Message(**msg) for msg in data]
-                    console.print(
-                        f"[bold green]✓ Loaded {len(validated)} messages from {messages_file}[/bold green]"
-                    )
-                    return [msg.model_dump() for msg in validated]
-                except (ValidationError, TypeError) as e:
-                    logger.error(f"Message validation failed: {e}")
-                    console.print(
-                        "[bold red]✗ Invalid message format. Using default messages.[/bold red]"
-                    )
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse {messages_file}: {e}")
+            validated = _MESSAGES_ADAPTER.validate_json(raw)
+            console.print(
+                f"[bold green]✓ Loaded {len(validated)} messages from {messages_file}[/bold green]"
+            )
+            messages: list[dict[str, Any]] = _MESSAGES_ADAPTER.dump_python(validated)
+            return messages
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                logger.error(f"Failed to parse {messages_file}: {e}")
+            else:
+                logger.error(f"Message validation failed: {e}")
+                console.print(
+                    "[bold red]✗ Invalid message format. Using default messages.[/bold red]"
+                )
 
-    # Default fallback messages
-    return [
-        {
-            "text": "Hey team, I'm getting a *403* on the new dashboard analytics endpoint :thinking_face: Has anyone else run into this?",
-            "replies": [
-                "Did you check if your token has the `analytics.read` scope?",
-                "Also, make sure the URL is `/api/v3/analytics`, not `/api/analytics`. Easy typo to make",
-            ],
-        },
-        {
-            "text": "Quick question - what's our _data retention policy_ for session logs? Need this for the compliance audit",
-            "replies": ["90 days in hot storage, then goes to cold storage for 7 years per policy"],
-        },
-        {
-            "text": "*Issue* in prod :bug:: Database query timeout on user auth\n`TypeError: Cannot read property 'userId' of undefined` at `user-service.js:45`\nAnyone know what we deployed?",
-            "replies": [
-                "Did we change the auth middleware recently?",
-                "Yeah, I see it now. JWT decode is failing silently. Let me push a fix",
-            ],
-        },
-        {
-            "text": "Could someone send me the rate limiter config docs? Setting up limits for the _payment service_ and need guidance",
-            "replies": [],
-        },
-        {
-            "text": "Onboarding new team member tomorrow - where can I find the local dev setup guide? Need the Docker compose instructions :wave:",
-            "replies": ["Root `README` has everything including the Docker compose setup :whale:"],
-        },
-        {
-            "text": "Has anyone successfully integrated <https://stripe.com/docs/webhooks|Stripe webhooks>? Signature validation keeps failing and I can't figure out why",
-            "replies": [
-                "Make sure you're using the webhook secret from the dashboard, not your API secret",
-                "Also gotta read the raw request body before parsing as JSON. That's a common gotcha",
-            ],
-        },
-        {
-            "text": "Could use some help - how does the *authentication flow* work on mobile? Is there a sequence diagram or docs somewhere?",
-            "replies": [],
-        },
-        {
-            "text": "Quick question on _database migrations_: should I create a new file or modify the existing one? Adding a column to the `users` table",
-            "replies": [
-                "Always create a *new migration file*. Never modify deployed migrations - that's how things break :no_entry:"
-            ],
-        },
-        {
-            "text": "Getting timeout errors on `/api/v2/reports` when generating large reports. Timeout is set to 30s currently - what's the recommended value?",
-            "replies": [
-                "60s is typical for report generation. Or consider making it _async with a callback_ if reports are heavy"
-            ],
-        },
-        {
-            "text": "What's the best approach for handling *retries* in the payment module? How do you differentiate between `transient` and `permanent` failures?",
-            "replies": [],
-        },
-        {
-            "text": "Question - _staging_ vs _pre-prod_: which one should I use for feature flag testing? :rocket:",
-            "replies": [
-                "Staging is for integration testing. Pre-prod mirrors production config. Use *pre-prod* for feature flags"
-            ],
-        },
-        {
-            "text": "Looking for documentation on *user permissions*. Need to implement role-based access control for the admin dashboard",
-            "replies": [],
-        },
-        {
-            "text": "*Push notifications* aren't showing on iOS. Has anyone worked with the notification service recently? :iphone:",
-            "replies": [
-                "When's the last time you updated the *APNs certificate*? Pretty sure it expired :warning:",
-                "Oh, that's probably it! Where can I find the new one? :bulb:",
-            ],
-        },
-        {
-            "text": "*Security question* - do we automatically redact _credit card numbers_ in logs, or should they be manually scrubbed?",
-            "replies": [],
-        },
-        {
-            "text": "Seeing _inconsistent results_ from the search API. Same query returns different results on subsequent calls. Is Redis caching enabled?",
-            "replies": [
-                "Yes, Redis caching with 5-minute TTL. Could be cache warming issues :mag:"
-            ],
-        },
-        {
-            "text": ":rocket: *heads up* - deploying _auth service v2.1_ to staging in 30min. if you're testing auth stuff plz use `staging-v2`",
-            "replies": [
-                "thanks for the heads up! when's it going to prod?",
-                "probably friday if no issues in staging. ill ping the channel",
-            ],
-        },
-        {
-            "text": "just merged <https://github.com/echohello-dev/yap-on-slack/pull/487|PR #487> - refactored the payment webhook handler to be more robust. plz review when u get a sec :eyes:",
-            "replies": ["lgtm! just left a comment on line 42 :+1:", "approved! ship it :ship:"],
-        },
-        {
-            "text": ":warning: *ATTENTION*: we're deprecating the old `/api/v1/users` endpoint _next month_. migrate to `/api/v2/users` asap. see <https://docs.example.com|docs> for migration guide",
-            "replies": [
-                "how long do we have to migrate?",
-                "until feb 15. we're sending emails to all customers but best to get it done early",
-            ],
-        },
-        {
-            "text": "*performance update*: search endpoint now doing _fuzzy matching_. this may affect some queries but accuracy is way better. feedback welcome :mag:",
-            "replies": [
-                "nice! how's the perf impact?",
-                "minimal actually. redis caching handles most of it :zap:",
-            ],
-        },
-        {
-            "text": "*planned maintenance*: database will be down for upgrades tomorrow 2am-3am pst. notify ur customers pls :warning:",
-            "replies": [
-                "done. already sent notifications :email:",
-                "thx. also FYI we're upgrading to `postgres 15` :elephant:",
-            ],
-        },
-        {
-            "text": "*FYI* rolling out new UI theme next week. if things look weird that's expected lol. should stabilize by wed :art:",
-            "replies": [
-                "dark mode finally?? :moon:",
-                "yeah! and better mobile responsive too :iphone:",
-            ],
-        },
-        {
-            "text": "quick *status update*: api latency spiked this morning around 9am but we've sorted it now. no data loss :relieved:",
-            "replies": [
-                "what caused it?",
-                "one of the load balancers got overloaded. scaled it up :muscle:",
-            ],
-        },
-    ]
+    # Copy so callers can edit messages and replies without touching the defaults
+    return [{**msg, "replies": list(msg["replies"])} for msg in _DEFAULT_MESSAGES]
+
+
+# Form fields the webapp chat.postMessage endpoint expects that never change per message
+_SESSION_POST_FIELDS = {
+    "type": "message",
+    "xArgs": "{}",
+    "unfurl": "[]",
+    "include_channel_perm_error": "true",
+    "_x_reason": "webapp_message_send",
+    "_x_mode": "online",
+    "_x_sonic": "true",
+    "_x_app_name": "client",
+}
 
 
 @retry(
-    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError, SlackNetworkError)),
-    wait=wait_exponential(multiplier=1, min=2, max=30),
+    retry=retry_if_exception_type(
+        (httpx.TimeoutException, httpx.NetworkError, SlackNetworkError, SlackRateLimitError)
+    ),
+    wait=_slack_retry_wait,
     stop=stop_after_attempt(3),
     reraise=True,
 )
 def post_message(
-    text: str, config: dict[str, str], thread_ts: str | None = None
+    text: str,
+    config: dict[str, str],
+    thread_ts: str | None = None,
+    blocks: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any] | None:
     """Post a single message to Slack with retry logic.
 
@@ -2999,6 +4375,7 @@ def post_message(
         text: Message text with markdown-like formatting
         config: Configuration dictionary with Slack credentials
         thread_ts: Optional thread timestamp for replies
+        blocks: Optional blocks already built from text by _build_blocks()
 
     Returns:
         Response dict if successful, None otherwise
@@ -3008,25 +4385,23 @@ def post_message(
         SlackRateLimitError: If rate limit is exceeded
         InvalidMessageFormatError: If message format is invalid
     """
-    logger.debug(f"Posting message{' to thread ' + thread_ts if thread_ts else ''}: {text[:50]}...")
-
-    try:
-        elements = parse_rich_text_from_string(text)
-    except InvalidMessageFormatError as e:
-        logger.error(f"Invalid message format: {e}")
-        raise
+    logger.debug(
+        "Posting message%s: %s...", " to thread " + thread_ts if thread_ts else "", text[:50]
+    )
 
-    blocks = [
-        {"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": elements}]}
-    ]
+    if blocks is None:
+        try:
+            blocks = _build_blocks(text)
+        except InvalidMessageFormatError as e:
+            logger.error(f"Invalid message format: {e}")
+            raise
 
     # Determine authentication method
     use_bot_token = _is_bot_token_auth(config)
 
     if use_bot_token:
         # Bot token: Use standard Web API with JSON payload
-        headers = _build_auth_headers(config)
-        headers["Content-Type"] = "application/json"
+        headers = _build_bot_json_headers(config)
 
         payload = {
             "channel": config["SLACK_CHANNEL_ID"],
@@ -3043,10 +4418,10 @@ def post_message(
                 headers=headers,
                 timeout=10,
             )
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = _response_json(response)
 
             if result.get("ok"):
-                logger.debug(f"Successfully posted message: {result.get('ts')}")
+                logger.debug("Successfully posted message: %s", result.get("ts"))
                 return result
 
             error = result.get("error", "unknown")
@@ -3055,7 +4430,10 @@ def post_message(
             if error == "ratelimited":
                 retry_after = response.headers.get("Retry-After", "60")
                 logger.warning(f"Rate limited on chat.postMessage, retry after {retry_after}s")
-                raise SlackRateLimitError(f"Rate limited, retry after {retry_after}s")
+                raise SlackRateLimitError(
+                    f"Rate limited, retry after {retry_after}s",
+                    retry_after=_retry_after_seconds(response),
+                )
 
             # Handle channel errors
             if error in ("channel_not_found", "not_in_channel"):
@@ -3078,47 +4456,38 @@ def post_message(
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse Slack API response: {e}")
             return None
-        except Exception as e:
-            logger.error(f"Unexpected error posting message: {e}")
+        except httpx.HTTPError as e:
+            # Remaining transport failures (e.g. protocol errors) that aren't retried
+            logger.error(f"HTTP error posting message: {type(e).__name__}: {e}")
             return None
 
     else:
         # Session token: Use webapp API with form-urlencoded data
         data = {
+            **_SESSION_POST_FIELDS,
             "token": config["SLACK_XOXC_TOKEN"],
             "channel": config["SLACK_CHANNEL_ID"],
-            "type": "message",
-            "xArgs": "{}",
-            "unfurl": "[]",
             "client_context_team_id": config["SLACK_TEAM_ID"],
-            "blocks": json.dumps(blocks),
-            "include_channel_perm_error": "true",
+            "blocks": _json_dumps(blocks),
             "client_msg_id": str(uuid.uuid4()),
-            "_x_reason": "webapp_message_send",
-            "_x_mode": "online",
-            "_x_sonic": "true",
-            "_x_app_name": "client",
         }
 
         if thread_ts:
             data["reply_broadcast"] = "false"
             data["thread_ts"] = thread_ts
 
-        cookies = _build_slack_cookies(config)
-
         try:
             # Use form-urlencoded like the working script (not multipart)
             response = _http_post(
                 f"{config['SLACK_ORG_URL']}/api/chat.postMessage",
                 data=data,
-                cookies=cookies,
-                headers=_DEFAULT_HEADERS,
+                headers=_build_session_headers(config),
                 timeout=10,
             )
-            session_result: dict[str, Any] = response.json()
+            session_result: dict[str, Any] = _response_json(response)
 
             if session_result.get("ok"):
-                logger.debug(f"Successfully posted message: {session_result.get('ts')}")
+                logger.debug("Successfully posted message: %s", session_result.get("ts"))
                 return session_result
 
             error = session_result.get("error", "unknown")
@@ -3128,7 +4497,7 @@ def post_message(
                 _print_auth_debug(
                     endpoint="chat.postMessage",
                     config=config,
-                    cookies=cookies,
+                    cookies=_build_slack_cookies(config),
                     response=response,
                     slack_result=session_result,
                     note=f"thread_ts={'yes' if thread_ts else 'no'}",
@@ -3138,7 +4507,10 @@ def post_message(
             if error == "ratelimited":
                 retry_after = response.headers.get("Retry-After", "60")
                 logger.warning(f"Rate limited on chat.postMessage, retry after {retry_after}s")
-                raise SlackRateLimitError(f"Rate limited, retry after {retry_after}s")
+                raise SlackRateLimitError(
+                    f"Rate limited, retry after {retry_after}s",
+                    retry_after=_retry_after_seconds(response),
+                )
 
             # Handle channel errors
             if error in ("channel_not_found", "not_in_channel"):
@@ -3166,8 +4538,9 @@ def post_message(
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse Slack API response: {e}")
             return None
-        except Exception as e:
-            logger.error(f"Unexpected error posting message: {e}")
+        except httpx.HTTPError as e:
+            # Remaining transport failures (e.g. protocol errors) that aren't retried
+            logger.error(f"HTTP error posting message: {type(e).__name__}: {e}")
             return None
 
 
@@ -3302,7 +4675,8 @@ Examples:
 
 def main() -> None:
     """Main entry point."""
-    global _SSL_CONTEXT
+    from rich.panel import Panel
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
     args = parse_args()
 
@@ -3313,18 +4687,11 @@ def main() -> None:
 
     # Try unified config first, fall back to legacy config
     try:
-        app_config, env = load_unified_config(args.config)
-        # Get unified config if it was loaded
-        discovered_config = discover_config_file(args.config)
-        unified_config_obj: UnifiedConfig | None = None
-        if discovered_config:
-            with discovered_config.open() as f:
-                config_data = yaml.safe_load(f)
-            if isinstance(config_data, dict):
-                unified_config_obj = UnifiedConfig(**config_data)
+        unified_config_obj: UnifiedConfig | None
+        app_config, env, unified_config_obj = _load_unified_config(args.config)
     except (ValueError, FileNotFoundError) as e:
         # Fallback to legacy config loading if unified config fails
-        logger.debug(f"Unified config failed, trying legacy: {e}")
+        logger.debug("Unified config failed, trying legacy: %s", e)
         try:
             app_config, env = load_config(args.users)
             unified_config_obj = None
@@ -3349,7 +4716,7 @@ def main() -> None:
             logger.info("Strict X509 verification enabled via --ssl-strict")
 
     # Set global SSL context for httpx requests
-    _SSL_CONTEXT = create_ssl_context(app_config.ssl)
+    set_ssl_context(create_ssl_context(app_config.ssl))
     if app_config.ssl.verify:
         if app_config.ssl.ca_bundle:
             console.print(f"[dim]Using custom CA bundle: {app_config.ssl.ca_bundle}[/dim]")
@@ -3445,52 +4812,82 @@ def main() -> None:
         )
     )
 
-    # Preview messages in logs
-    console.print("\n[bold blue]━━━ Message Preview ━━━[/bold blue]\n")
-    for i, msg_data in enumerate(messages, 1):
-        text = str(msg_data["text"])
-        msg_user = msg_data.get("user")
-        user_display = (
-            f"[bold magenta]@{msg_user}[/bold magenta]" if msg_user else "[dim]@default[/dim]"
-        )
-
-        # Main message
-        console.print(f"[bold cyan]#{i}[/bold cyan] {user_display}")
-        # Indent and format message text (truncate if very long)
-        preview_text = text[:200] + "..." if len(text) > 200 else text
-        console.print(f"    [white]{preview_text}[/white]")
-
-        # Show reactions if present
-        reactions = msg_data.get("reactions", [])
-        if reactions:
-            reaction_str = " ".join([f":{r.strip(':')}:" for r in reactions])
-            console.print(f"    [yellow]reactions:[/yellow] {reaction_str}")
-
-        # Show replies as thread
-        replies = msg_data.get("replies", [])
-        if replies:
-            console.print(
-                f"    [dim]└─ [bold]{len(replies)} repl{'y' if len(replies) == 1 else 'ies'}[/bold][/dim]"
+    # Preview messages in logs. Live runs print each message as it is posted, so the
+    # full preview is only rendered for dry runs and --verbose.
+    if args.dry_run or args.verbose:
+        console.print("\n[bold blue]━━━ Message Preview ━━━[/bold blue]\n")
+        for i, msg_data in enumerate(messages, 1):
+            text = str(msg_data["text"])
+            msg_user = msg_data.get("user")
+            user_display = (
+                f"[bold magenta]@{msg_user}[/bold magenta]" if msg_user else "[dim]@default[/dim]"
             )
-            for reply_idx, reply in enumerate(replies):
-                if isinstance(reply, str):
-                    reply_text = reply
-                    reply_user = None
-                else:
-                    reply_text = str(reply.get("text", ""))
-                    reply_user = reply.get("user")
 
-                reply_user_display = (
-                    f"[magenta]@{reply_user}[/magenta]" if reply_user else "[dim]@default[/dim]"
-                )
-                prefix = "└─" if reply_idx == len(replies) - 1 else "├─"
-                # Truncate long replies
-                reply_preview = reply_text[:150] + "..." if len(reply_text) > 150 else reply_text
+            # Main message
+            console.print(f"[bold cyan]#{i}[/bold cyan] {user_display}")
+            # Indent and format message text (truncate if very long)
+            preview_text = text[:200] + "..." if len(text) > 200 else text
+            console.print(f"    [white]{preview_text}[/white]")
+
+            # Show reactions if present
+            reactions = msg_data.get("reactions", [])
+            if reactions:
+                reaction_str = " ".join([f":{r.strip(':')}:" for r in reactions])
+                console.print(f"    [yellow]reactions:[/yellow] {reaction_str}")
+
+            # Show replies as thread
+            replies = msg_data.get("replies", [])
+            if replies:
                 console.print(
-                    f"       [dim]{prefix}[/dim] {reply_user_display}: [white]{reply_preview}[/white]"
+                    f"    [dim]└─ [bold]{len(replies)} repl{'y' if len(replies) == 1 else 'ies'}[/bold][/dim]"
                 )
+                for reply_idx, reply in enumerate(replies):
+                    if isinstance(reply, str):
+                        reply_text = reply
+                        reply_user = None
+                    else:
+                        reply_text = str(reply.get("text", ""))
+                        reply_user = reply.get("user")
+
+                    reply_user_display = (
+                        f"[magenta]@{reply_user}[/magenta]" if reply_user else "[dim]@default[/dim]"
+                    )
+                    prefix = "└─" if reply_idx == len(replies) - 1 else "├─"
+                    # Truncate long replies
+                    reply_preview = (
+                        reply_text[:150] + "..." if len(reply_text) > 150 else reply_text
+                    )
+                    console.print(
+                        f"       [dim]{prefix}[/dim] {reply_user_display}: [white]{reply_preview}[/white]"
+                    )
+
+            console.print()  # Empty line between messages
+
+    # Parse every message and reply up front, so formatting errors surface before
+    # anything is posted and the posting loop doesn't re-parse each text
+    blocks_by_text: dict[str, list[dict[str, Any]]] = {}
+    invalid: list[str] = []
+    for i, msg_data in enumerate(messages, 1):
+        texts = [(f"#{i}", str(msg_data["text"]))]
+        for reply_idx, reply in enumerate(msg_data.get("replies", []), 1):
+            reply_text = reply if isinstance(reply, str) else str(reply.get("text", ""))
+            if not reply_text.strip():
+                invalid.append(f"#{i} reply {reply_idx}: Reply text cannot be empty")
+                continue
+            texts.append((f"#{i} reply {reply_idx}", reply_text))
+        for label, text in texts:
+            if text in blocks_by_text:
+                continue
+            try:
+                blocks_by_text[text] = _build_blocks(text)
+            except InvalidMessageFormatError as e:
+                invalid.append(f"{label}: {e}")
 
-        console.print()  # Empty line between messages
+    if invalid:
+        console.print("[bold red]✗ Invalid message format - nothing was posted[/bold red]")
+        for problem in invalid:
+            console.print(f"    [red]{problem}[/red]")
+        return
 
     if args.dry_run:
         console.print("[bold green]✓ Dry run complete - all validations passed[/bold green]")
@@ -3500,13 +4897,42 @@ def main() -> None:
     success = 0
     failed = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
+    def add_reactions_later(
+        channel: str, timestamp: str, emojis: list[str], config: dict[str, str]
+    ) -> None:
+        """Wait --reaction-delay, then add reactions (runs off the posting loop)."""
+        time.sleep(args.reaction_delay)
+        try:
+            add_reactions(channel, timestamp, emojis, config)
+        except Exception as e:
+            logger.warning(f"Failed to add reactions: {type(e).__name__}: {e}")
+
+    # Request configs depend only on the user, so build each once rather than per post.
+    # Keyed by the (frozen) user itself, not its name, since names aren't guaranteed
+    # unique. They are shared with the reaction worker and must not be mutated.
+    request_configs: dict[SlackUser, dict[str, str]] = {}
+    for user in app_config.users:
+        request_configs[user] = _merge_request_config(app_config, user)
+        if args.debug_auth:
+            # A sentinel key so helpers can print diagnostics without changing function signatures.
+            request_configs[user]["__DEBUG_AUTH"] = "1"
+
+    # Reactions don't need to land before the replies, so they're delayed and added
+    # on their own thread while posting continues. One worker keeps them in message
+    # order; add_reactions fans out on the shared pool, so this can't deadlock it.
+    reaction_pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="yap-on-slack-reactions"
+    )
+    with (
+        reaction_pool,
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress,
+    ):
         task = progress.add_task("[green]Posting messages...", total=len(messages))
 
         for i, msg_data in enumerate(messages, 1):
@@ -3529,68 +4955,48 @@ def main() -> None:
             )
 
             posting_user = app_config.select_user(name=user_name, message_index=i - 1)
-            request_config = _merge_request_config(app_config, posting_user)
-
-            if args.debug_auth:
-                # A sentinel key so helpers can print diagnostics without changing function signatures.
-                request_config["__DEBUG_AUTH"] = "1"
+            request_config = request_configs[posting_user]
 
             try:
-                result = post_message(text, request_config)
+                # Delays are measured from the start of the previous post, so time
+                # spent waiting on Slack counts towards them
+                last_post_started = time.monotonic()
+                result = post_message(text, request_config, blocks=blocks_by_text.get(text))
 
                 if result:
                     success += 1
                     thread_ts = result["ts"]
                     progress.console.print("    [green]✓[/green] Posted")
 
-                    # Add AI-generated reactions first (if present)
-                    ai_reactions = msg_data.get("reactions", [])
-                    if ai_reactions:
-                        reaction_display = " ".join([f":{r.strip(':')}:" for r in ai_reactions])
+                    # AI-generated reactions (colons stripped), else the first emoji in
+                    # the message text as a fallback for non-AI messages
+                    emojis = [r.strip(":") for r in msg_data.get("reactions", [])]
+                    if not emojis and (emoji_match := _EMOJI_RE.search(text)):
+                        emojis = [emoji_match.group(1)]
+                    if emojis:
+                        label = "reactions" if len(emojis) > 1 else "reaction"
+                        reaction_display = " ".join(f":{e}:" for e in emojis)
                         progress.console.print(
-                            f"    [yellow]  + reactions:[/yellow] {reaction_display}"
+                            f"    [yellow]  + {label}:[/yellow] {reaction_display}"
+                        )
+                        # Reactions are added concurrently, off the posting loop
+                        reaction_pool.submit(
+                            add_reactions_later,
+                            request_config["SLACK_CHANNEL_ID"],
+                            thread_ts,
+                            emojis,
+                            request_config,
                         )
-                    for reaction_emoji in ai_reactions:
-                        try:
-                            time.sleep(args.reaction_delay)
-                            # Strip colons if present
-                            emoji_name = reaction_emoji.strip(":")
-                            if emoji_name:
-                                add_reaction(
-                                    request_config["SLACK_CHANNEL_ID"],
-                                    thread_ts,
-                                    emoji_name,
-                                    request_config,
-                                )
-                        except (SlackNetworkError, RetryError) as e:
-                            logger.warning(f"Failed to add reaction after retries: {e}")
-                        except SlackRateLimitError as e:
-                            logger.warning(f"Rate limited adding reaction: {e}")
-
-                    # Also add reaction if emoji found in message text (fallback for non-AI)
-                    if not ai_reactions:
-                        emoji_match = re.search(r":([a-z_0-9]+):", text)
-                        if emoji_match:
-                            progress.console.print(
-                                f"    [yellow]  + reaction:[/yellow] :{emoji_match.group(1)}:"
-                            )
-                            try:
-                                time.sleep(args.reaction_delay)
-                                add_reaction(
-                                    request_config["SLACK_CHANNEL_ID"],
-                                    thread_ts,
-                                    emoji_match.group(1),
-                                    request_config,
-                                )
-                            except (SlackNetworkError, RetryError) as e:
-                                logger.warning(f"Failed to add reaction after retries: {e}")
-                            except SlackRateLimitError as e:
-                                logger.warning(f"Rate limited adding reaction: {e}")
 
                     # Post replies
                     replies = msg_data.get("replies", [])
                     for reply_idx, reply in enumerate(replies):
-                        time.sleep(args.reply_delay)
+                        apply_throttle(
+                            args.reply_delay,
+                            randomize=False,
+                            max_wait_time=args.reply_delay,
+                            started_at=last_post_started,
+                        )
                         try:
                             if isinstance(reply, str):
                                 reply_text = reply
@@ -3621,11 +5027,13 @@ def main() -> None:
                                 f"    [dim]{prefix}[/dim] [magenta]{reply_user_display}[/magenta]: {reply_preview}"
                             )
 
-                            reply_request_config = _merge_request_config(app_config, reply_user)
-                            if args.debug_auth:
-                                reply_request_config["__DEBUG_AUTH"] = "1"
+                            reply_request_config = request_configs[reply_user]
+                            last_post_started = time.monotonic()
                             reply_result = post_message(
-                                reply_text, reply_request_config, thread_ts=thread_ts
+                                reply_text,
+                                reply_request_config,
+                                thread_ts=thread_ts,
+                                blocks=blocks_by_text.get(reply_text),
                             )
                             if reply_result:
                                 success += 1
@@ -3638,6 +5046,10 @@ def main() -> None:
                         except SlackAPIError as e:
                             logger.error(f"Slack API error posting reply: {e}")
                             failed += 1
+                        except Exception as e:
+                            # Count it as one failed reply rather than ending the run
+                            logger.error(f"Unexpected error posting reply: {e}")
+                            failed += 1
                 else:
                     logger.error(f"Message {i} failed")
                     failed += 1
@@ -3651,11 +5063,20 @@ def main() -> None:
             except InvalidMessageFormatError as e:
                 logger.error(f"Invalid message format for message {i}: {e}")
                 failed += 1
+            except Exception as e:
+                # Count it as one failed post rather than ending the run
+                logger.error(f"Unexpected error posting message {i}: {e}")
+                failed += 1
 
             progress.advance(task)
 
             if i < len(messages):
-                time.sleep(args.delay)
+                apply_throttle(
+                    args.delay,
+                    randomize=False,
+                    max_wait_time=args.delay,
+                    started_at=last_post_started,
+                )
 
     console.print("\n")
     console.print(